@@ -0,0 +1,84 @@
+"""Compare the throughput of the Aggregate stream operator with and without NumPy.
+
+Run with `python benchmarks/bench_aggregate.py`. `--samples` IMU samples of six channels are aggregated in windows
+of `--window` samples: once as one dictionary per sample, as delivered by a receiver with the JSON unpacker,
+and once as batches of column arrays, as delivered by the StructBatchUnpacker with columns=True.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+
+from heisskleber.core import Receiver
+from heisskleber.stream import Aggregate
+
+CHANNELS = ("ax", "ay", "az", "gx", "gy", "gz")
+
+
+class _ListReceiver(Receiver[Any]):
+    """Returns the prepared messages, then ends the stream."""
+
+    def __init__(self, messages: list[Any]) -> None:
+        self._messages = messages
+        self._index = 0
+
+    async def receive(self, **kwargs: Any) -> tuple[Any, dict[str, Any]]:
+        return (await self.receive_many(1))[0]
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[Any, dict[str, Any]]]:
+        if self._index >= len(self._messages):
+            raise StopAsyncIteration
+        batch = self._messages[self._index : self._index + max_items]
+        self._index += len(batch)
+        return [(data, {"topic": "imu"}) for data in batch]
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return "ListReceiver"
+
+
+async def aggregate(messages: list[Any], window: int, numpy: bool) -> tuple[int, float]:
+    """Aggregate the messages and return the number of windows and the elapsed seconds."""
+    stream = Aggregate(_ListReceiver(messages), count=window, numpy=numpy)
+    start = time.perf_counter()
+    windows = len([data async for data, _ in stream])
+    return windows, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=200_000, help="Number of IMU samples")
+    parser.add_argument("--window", type=int, default=1000, help="Samples per window, e.g. 1 kHz to 1 Hz")
+    args = parser.parse_args()
+
+    samples = [{"epoch": float(i), **{channel: random.gauss() for channel in CHANNELS}} for i in range(args.samples)]
+    runs = [("dicts, python", samples, args.window, False), ("dicts, numpy", samples, args.window, True)]
+    try:
+        import numpy as np
+    except ImportError:
+        print("numpy is not installed, only the pure Python aggregation is measured")
+        runs = runs[:1]
+    else:
+        columns = [
+            {name: np.array([sample[name] for sample in samples[i : i + args.window]]) for name in samples[0]}
+            for i in range(0, args.samples, args.window)
+        ]
+        runs.append(("column batches, numpy", columns, 1, True))
+
+    for name, messages, window, numpy in runs:
+        windows, elapsed = asyncio.run(aggregate(messages, window, numpy))
+        print(f"{name:>22}: {windows} windows in {elapsed:.3f} s, {args.samples / elapsed:,.0f} samples/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compare the throughput and payload size of the built-in codecs.
+
+Run with `python benchmarks/bench_codecs.py`. Codecs whose library is not installed are skipped.
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from heisskleber.core import get_packer, get_unpacker
+
+CODECS = ["json", "orjson", "msgspec", "msgpack", "cbor"]
+
+
+def telemetry_message(fields: int) -> dict[str, Any]:
+    """Return a message that resembles a typical sensor reading."""
+    message: dict[str, Any] = {"epoch": 1718000000.123456, "sensor": "imu-01"}
+    message.update({f"value_{i}": 1000.0 / (i + 3) for i in range(fields)})
+    return message
+
+
+def main() -> None:
+    """Run the benchmark and print one line per codec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=12, help="Number of float fields per message")
+    parser.add_argument("--number", type=int, default=100_000, help="Number of messages per measurement")
+    args = parser.parse_args()
+
+    data = telemetry_message(args.fields)
+    print(f"{'codec':<10}{'bytes':>8}{'pack [us]':>12}{'unpack [us]':>14}")
+    for name in CODECS:
+        try:
+            packer, unpacker = get_packer(name), get_unpacker(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>34}")
+            continue
+        payload = packer(data)
+        pack_time = min(timeit.repeat(lambda: packer(data), number=args.number, repeat=3)) / args.number  # noqa: B023
+        unpack_time = min(timeit.repeat(lambda: unpacker(payload), number=args.number, repeat=3)) / args.number  # noqa: B023
+        print(f"{name:<10}{len(payload):>8}{pack_time * 1e6:>12.2f}{unpack_time * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
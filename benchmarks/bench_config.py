@@ -0,0 +1,71 @@
+"""Compare config instantiation with compiled validators against the previous per-call field inspection.
+
+Run with `python benchmarks/bench_config.py`.
+"""
+
+import argparse
+import timeit
+from dataclasses import dataclass, fields
+from typing import Any, Literal, Union, get_args, get_origin
+
+from heisskleber.core.config import BaseConf
+from heisskleber.mqtt import MqttConf
+
+DEVICE = {"host": "broker.local", "port": 1883, "user": "device", "password": "secret", "qos": 1, "timeout": 30}
+
+
+def _check_type(value: Any, expected_type: Any) -> bool:
+    """Type check of a single value before the validators were compiled."""
+    if get_origin(expected_type) is Literal:
+        if value not in get_args(expected_type):
+            raise TypeError
+        return True
+    return isinstance(value, expected_type)
+
+
+def legacy_post_init(self: BaseConf) -> None:
+    """Type check of BaseConf.__post_init__ before the validators were compiled."""
+    for field in fields(self):
+        value = getattr(self, field.name)
+        if value is None:
+            continue
+        if hasattr(field.type, "__origin__") and field.type.__origin__ is Union:
+            if not any(_check_type(value, t) for t in field.type.__args__):
+                raise TypeError
+            continue
+        if not _check_type(value, field.type):
+            raise TypeError
+
+
+def legacy_from_dict(cls: type[BaseConf], config_dict: dict[str, Any]) -> BaseConf:
+    """BaseConf.from_dict before the valid field names were cached."""
+    valid_fields = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in config_dict.items() if k in valid_fields})
+
+
+@dataclass
+class LegacyMqttConf(MqttConf):
+    """MqttConf with the previous validation."""
+
+    __post_init__ = legacy_post_init
+
+
+def main() -> None:
+    """Run the benchmark and print the time per config."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=50_000, help="Number of configs per measurement")
+    args = parser.parse_args()
+
+    cases = {
+        "legacy from_dict": lambda: legacy_from_dict(LegacyMqttConf, DEVICE),
+        "compiled from_dict": lambda: MqttConf.from_dict(DEVICE),
+        "legacy __init__": lambda: LegacyMqttConf(**DEVICE),
+        "compiled __init__": lambda: MqttConf(**DEVICE),
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=args.number, repeat=3)) / args.number
+        print(f"{name:<20}{seconds * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
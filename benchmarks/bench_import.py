@@ -0,0 +1,47 @@
+"""Measure the import time of heisskleber and its backends in fresh interpreters.
+
+Run with `python benchmarks/bench_import.py`. For a per-module breakdown use `python -X importtime -c "import heisskleber"`.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import heisskleber",
+    "from heisskleber import UdpSender",
+    "from heisskleber import MqttSender",
+    "from heisskleber import ZmqSender",
+    "import heisskleber; heisskleber.create_sender('udp')",
+]
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, repeat: int) -> list[float]:
+    """Return the import times of the statement in seconds, one per fresh interpreter."""
+    return [
+        float(subprocess.check_output([sys.executable, "-c", TIMER.format(statement=statement)], text=True))  # noqa: S603
+        for _ in range(repeat)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print the median import time of every statement."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of interpreters per statement")
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        times = measure(statement, args.repeat)
+        print(f"{statistics.median(times) * 1000:8.1f} ms  {statement}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Compare the loopback throughput of the UDP, TCP and ZMQ transports on the default event loop and uvloop.
+
+Run with `python benchmarks/bench_loops.py`. uvloop is skipped if it is not installed (`pip install heisskleber[uvloop]`),
+ZMQ is skipped if pyzmq is not installed.
+Every case sends `--number` small JSON messages over localhost and reports the received messages per second.
+The senders keep at most WINDOW messages in flight. UDP may still lose datagrams, so the share of received
+messages is reported as well.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import heisskleber
+from heisskleber.tcp import TcpConf, TcpReceiver
+from heisskleber.udp import UdpConf, UdpReceiver, UdpSender
+
+BATCH = 100
+WINDOW = 500  # messages in flight before the sender waits for the receiver, so UDP does not overrun the socket
+MESSAGE = {"epoch": 1718000000.123456, "sensor": "imu-01", "x": 0.1, "y": 0.2, "z": 9.81}
+
+
+class _Progress:
+    """Count received messages and the time of the last one."""
+
+    def __init__(self) -> None:
+        self.received = 0
+        self.start = self.end = time.perf_counter()
+        self.finished = False
+        self.caught_up = asyncio.Event()
+
+    def add(self, received: int) -> None:
+        self.received += received
+        self.end = time.perf_counter()
+        self.caught_up.set()
+
+    async def wait_for_receiver(self, sent: int) -> None:
+        while not self.finished and sent - self.received > WINDOW:
+            self.caught_up.clear()
+            await self.caught_up.wait()
+
+    def result(self) -> tuple[float, int]:
+        return self.end - self.start, self.received
+
+
+async def _receive_all(receiver: Any, number: int, progress: _Progress, timeout: float = 2.0) -> None:
+    """Receive until `number` messages arrived or none arrived for `timeout` seconds."""
+    while progress.received < number:
+        try:
+            batch = await asyncio.wait_for(receiver.receive_many(max_items=1000), timeout)
+        except asyncio.TimeoutError:
+            break
+        progress.add(len(batch))
+    progress.finished = True
+    progress.caught_up.set()
+
+
+async def _send_all(sender: Any, number: int, progress: _Progress, **kwargs: Any) -> None:
+    for sent in range(BATCH, number + BATCH, BATCH):
+        await sender.send_many([MESSAGE] * BATCH, **kwargs)
+        await progress.wait_for_receiver(sent)
+
+
+async def bench_udp(number: int, port: int) -> tuple[float, int]:
+    """Send datagrams with UdpSender to a UdpReceiver."""
+    receiver: UdpReceiver[Any] = UdpReceiver(UdpConf(port=port, max_queue_size=2 * WINDOW))
+    sender: UdpSender[Any] = UdpSender(UdpConf(port=port))
+    await receiver.start()
+    await sender.start()
+    progress = _Progress()
+    await asyncio.gather(_receive_all(receiver, number, progress), _send_all(sender, number, progress))
+    await sender.stop()
+    await receiver.stop()
+    return progress.result()
+
+
+async def bench_tcp(number: int, port: int) -> tuple[float, int]:
+    """Stream lines from an asyncio server to a TcpReceiver."""
+    line = heisskleber.core.json_packer(MESSAGE) + b"\n"
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        for _ in range(0, number, BATCH):
+            writer.write(line * BATCH)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", port)
+    receiver: TcpReceiver[Any] = TcpReceiver(TcpConf(host="127.0.0.1", port=port))
+    progress = _Progress()
+    await receiver.start()
+    await _receive_all(receiver, number, progress)
+    await receiver.stop()
+    server.close()
+    return progress.result()
+
+
+async def bench_zmq(number: int, port: int) -> tuple[float, int]:
+    """Publish with ZmqSender through an XSUB/XPUB proxy to a ZmqReceiver."""
+    import zmq
+    from zmq.devices import ThreadProxy
+
+    from heisskleber.zmq import ZmqConf, ZmqReceiver, ZmqSender
+
+    config = ZmqConf(publisher_port=port, subscriber_port=port + 1)
+    proxy = ThreadProxy(zmq.XSUB, zmq.XPUB)
+    proxy.bind_in(config.publisher_address)
+    proxy.bind_out(config.subscriber_address)
+    proxy.start()
+    receiver: ZmqReceiver[Any] = ZmqReceiver(config, topic="bench")
+    sender: ZmqSender[Any] = ZmqSender(config)
+    await receiver.start()
+    await sender.start()
+    await asyncio.sleep(0.5)  # let the subscription reach the publisher
+    progress = _Progress()
+    await asyncio.gather(_receive_all(receiver, number, progress), _send_all(sender, number, progress, topic="bench"))
+    await sender.stop()
+    await receiver.stop()
+    proxy.context_factory().term()
+    return progress.result()
+
+
+CASES: dict[str, Callable[[int, int], Coroutine[Any, Any, tuple[float, int]]]] = {
+    "udp": bench_udp,
+    "tcp": bench_tcp,
+    "zmq": bench_zmq,
+}
+
+
+def main() -> None:
+    """Run every transport on every available loop and print one line per combination."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000, help="Number of messages per measurement")
+    parser.add_argument("--port", type=int, default=47000, help="First of the local ports to use")
+    args = parser.parse_args()
+
+    loops: list[heisskleber.core.runner.LoopName] = ["asyncio"]
+    if importlib.util.find_spec("uvloop") is not None:
+        loops.append("uvloop")
+    else:
+        print("uvloop is not installed, only the default loop is measured.")
+
+    print(f"{'transport':<11}{'loop':<9}{'msg/s':>12}{'received':>10}")
+    for name, case in CASES.items():
+        if name == "zmq" and importlib.util.find_spec("zmq") is None:
+            print(f"{name:<11}{'pyzmq not installed':>31}")
+            continue
+        for port_offset, loop in enumerate(loops):
+            port = args.port + 10 * port_offset
+            elapsed, received = heisskleber.run(case(args.number, port), loop=loop)
+            print(f"{name:<11}{loop:<9}{received / elapsed:>12,.0f}{received / args.number:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
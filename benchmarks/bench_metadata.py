@@ -0,0 +1,58 @@
+"""Compare the memory and time spent on message metadata as dictionary and as Metadata object.
+
+Run with `python benchmarks/bench_metadata.py`. The metadata of `--messages` messages is kept alive, as in a
+buffer of received messages, and measured with tracemalloc. The payloads are unpacked beforehand, so only
+the metadata is measured.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from heisskleber.core import Metadata, json_unpacker
+
+Attach = Callable[[dict[str, Any], int], Any]
+
+
+def attach_dict(extra: dict[str, Any], sequence: int) -> Any:
+    """Add the fields to the unpacker's dictionary, as the receivers do by default."""
+    extra["topic"] = "sensors/imu"
+    extra["sequence"] = sequence
+    extra["transport"] = "mqtt"
+    return extra
+
+
+def attach_metadata(extra: dict[str, Any], sequence: int) -> Any:
+    """Create a Metadata object, as the receivers do with slotted_metadata."""
+    return Metadata(extra, topic="sensors/imu", sequence=sequence, transport="mqtt")
+
+
+def retained_bytes(attach: Attach, messages: int) -> int:
+    """Return the bytes allocated for the metadata of all messages, which are kept alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [attach(json_unpacker(b"{}")[1], sequence) for sequence in range(messages)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> None:
+    """Run the benchmark and print one line per variant."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100_000, help="Number of messages kept alive")
+    parser.add_argument("--number", type=int, default=1_000_000, help="Number of messages per time measurement")
+    args = parser.parse_args()
+
+    print(f"{'metadata':<10}{'bytes/message':>15}{'time [ns]':>12}")
+    for name, attach in (("dict", attach_dict), ("Metadata", attach_metadata)):
+        size = retained_bytes(attach, args.messages) / args.messages
+        elapsed = min(timeit.repeat(lambda: attach({}, 1), number=args.number, repeat=3)) / args.number  # noqa: B023
+        print(f"{name:<10}{size:>15.1f}{elapsed * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Replay a recorded log as fast as possible and report the throughput of the receiving side.
+
+Run with `python benchmarks/bench_replay.py capture.hklog --packstyle json`, with a log written by the Recorder,
+to benchmark a change against real traffic. Without a log, a synthetic log of `--number` messages is recorded first.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from heisskleber.core import Receiver, get_packer, get_unpacker
+from heisskleber.replay import Recorder, ReplayConf, ReplayReceiver
+
+
+class _SyntheticReceiver(Receiver[Any]):
+    """Returns `number` telemetry messages on ten topics."""
+
+    def __init__(self, number: int, packstyle: str) -> None:
+        self.unpacker = get_unpacker(packstyle)
+        self._packer = get_packer(packstyle)
+        self._number = number
+
+    async def receive(self, **kwargs: Any) -> tuple[Any, dict[str, Any]]:
+        self._number -= 1
+        data, extra = self.unpacker(self._packer({"epoch": time.time(), "sensor": "imu-01", "x": 0.1, "z": 9.81}))
+        extra["topic"] = f"sensors/{self._number % 10}"
+        return data, extra
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return "SyntheticReceiver"
+
+
+async def record_synthetic(path: Path, number: int, packstyle: str) -> None:
+    """Record a synthetic log of `number` messages."""
+    async with Recorder(_SyntheticReceiver(number, packstyle), path) as recorder:
+        for _ in range(number):
+            await recorder.receive()
+
+
+async def replay(path: Path, packstyle: str, batch: int) -> tuple[int, float]:
+    """Replay the log with receive_many() and return the number of messages and the elapsed seconds."""
+    received = 0
+    async with ReplayReceiver(ReplayConf(path=str(path), speed=0, packstyle=packstyle)) as receiver:
+        start = time.perf_counter()
+        while True:
+            try:
+                received += len(await receiver.receive_many(batch))
+            except StopAsyncIteration:  # noqa: PERF203
+                break
+        return received, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("log", nargs="?", type=Path, help="Log written by the Recorder")
+    parser.add_argument("--packstyle", default="json", help="Unpacker of the recorded payloads")
+    parser.add_argument("--number", type=int, default=100_000, help="Messages of the synthetic log")
+    parser.add_argument("--batch", type=int, default=100, help="max_items per receive_many() call")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.log
+        if path is None:
+            path = Path(directory) / "synthetic.hklog"
+            asyncio.run(record_synthetic(path, args.number, args.packstyle))
+        received, elapsed = asyncio.run(replay(path, args.packstyle, args.batch))
+        size = path.stat().st_size
+    print(f"{received} messages ({size / 1e6:.1f} MB) in {elapsed:.2f} s: {received / elapsed:,.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,78 @@
-"""Heisskleber."""
+"""Heisskleber.
+
+Backends are imported on first access, e.g. `from heisskleber import UdpSender` does not import
+the dependencies of the mqtt, zmq or serial backends.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from heisskleber.core import Receiver, Sender, create_receiver, create_sender
+
+if TYPE_CHECKING:
+    from heisskleber.console import ConsoleConf, ConsoleReceiver, ConsoleSender
+    from heisskleber.core import run
+    from heisskleber.file import FileConf, FileReader, FileWriter
+    from heisskleber.mqtt import MqttConf, MqttReceiver, MqttSender
+    from heisskleber.replay import Recorder, ReplayConf, ReplayReceiver
+    from heisskleber.serial import SerialConf, SerialReceiver, SerialSender
+    from heisskleber.tcp import TcpConf, TcpReceiver, TcpSender
+    from heisskleber.udp import UdpConf, UdpReceiver, UdpSender
+    from heisskleber.zmq import ZmqConf, ZmqReceiver, ZmqSender
+
+_lazy_imports = {
+    # console
+    "ConsoleConf": "heisskleber.console",
+    "ConsoleReceiver": "heisskleber.console",
+    "ConsoleSender": "heisskleber.console",
+    # file
+    "FileConf": "heisskleber.file",
+    "FileReader": "heisskleber.file",
+    "FileWriter": "heisskleber.file",
+    # mqtt
+    "MqttConf": "heisskleber.mqtt",
+    "MqttReceiver": "heisskleber.mqtt",
+    "MqttSender": "heisskleber.mqtt",
+    # replay
+    "Recorder": "heisskleber.replay",
+    "ReplayConf": "heisskleber.replay",
+    "ReplayReceiver": "heisskleber.replay",
+    # serial
+    "SerialConf": "heisskleber.serial",
+    "SerialReceiver": "heisskleber.serial",
+    "SerialSender": "heisskleber.serial",
+    # tcp
+    "TcpConf": "heisskleber.tcp",
+    "TcpReceiver": "heisskleber.tcp",
+    "TcpSender": "heisskleber.tcp",
+    # udp
+    "UdpConf": "heisskleber.udp",
+    "UdpReceiver": "heisskleber.udp",
+    "UdpSender": "heisskleber.udp",
+    # zmq
+    "ZmqConf": "heisskleber.zmq",
+    "ZmqReceiver": "heisskleber.zmq",
+    "ZmqSender": "heisskleber.zmq",
+    # factories
+    "run": "heisskleber.core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import backend classes and the runner on first access."""
+    try:
+        module = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported backend classes along with the module attributes."""
+    return sorted([*globals(), *_lazy_imports])
 
-from heisskleber.console import ConsoleConf, ConsoleReceiver, ConsoleSender
-from heisskleber.core import Receiver, Sender
-from heisskleber.file import FileConf, FileReader, FileWriter
-from heisskleber.mqtt import MqttConf, MqttReceiver, MqttSender
-from heisskleber.serial import SerialConf, SerialReceiver, SerialSender
-from heisskleber.tcp import TcpConf, TcpReceiver, TcpSender
-from heisskleber.udp import UdpConf, UdpReceiver, UdpSender
-from heisskleber.zmq import ZmqConf, ZmqReceiver, ZmqSender
 
 __all__ = [
     # console
@@ -23,6 +88,10 @@ __all__ = [
     "MqttReceiver",
     "MqttSender",
     "Receiver",
+    # replay
+    "Recorder",
+    "ReplayConf",
+    "ReplayReceiver",
     "Sender",
     # serial
     "SerialConf",
@@ -40,5 +109,9 @@ __all__ = [
     "ZmqConf",
     "ZmqReceiver",
     "ZmqSender",
+    # factories
+    "create_receiver",
+    "create_sender",
+    "run",
 ]
 __version__ = "1.0.0"
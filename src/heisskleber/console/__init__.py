@@ -6,4 +6,4 @@ from .sender import ConsoleSender
 
 register("console", ConsoleSender, ConsoleReceiver, ConsoleConf)
 
-__all__ = ["ConsoleReceiver", "ConsoleSender"]
+__all__ = ["ConsoleConf", "ConsoleReceiver", "ConsoleSender"]
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from heisskleber.core.buffer import OverflowPolicy
 from heisskleber.core.config import BaseConf
 
 
@@ -9,3 +10,5 @@ class ConsoleConf(BaseConf):
 
     verbose: bool = False
     pretty: bool = False
+    max_queue_size: int = 10
+    overflow: OverflowPolicy = "block"
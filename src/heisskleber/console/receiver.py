@@ -2,7 +2,7 @@ import asyncio
 import sys
 from typing import Any, TypeVar
 
-from heisskleber.core import Receiver, Unpacker, json_unpacker
+from heisskleber.core import MessageBuffer, Metrics, Receiver, Unpacker, json_unpacker
 
 from .config import ConsoleConf
 
@@ -17,7 +17,7 @@ class ConsoleReceiver(Receiver[T]):
         config: ConsoleConf,
         unpacker: Unpacker[T] = json_unpacker,  # type: ignore[assignment]
     ) -> None:
-        self.queue: asyncio.Queue[tuple[T, dict[str, Any]]] = asyncio.Queue(maxsize=10)
+        self.queue: MessageBuffer[tuple[T, dict[str, Any]]] = MessageBuffer(config.max_queue_size, config.overflow)
         self.unpacker = unpacker
         self.config = config
         self.task: asyncio.Task[None] | None = None
@@ -36,6 +36,9 @@ class ConsoleReceiver(Receiver[T]):
         data, extra = await self.queue.get()
         return data, extra
 
+    def _register_metrics(self, metrics: Metrics) -> None:
+        metrics.watch_buffer(self.queue)
+
     def __repr__(self) -> str:
         """Return string representation of ConsoleSource."""
         return f"{self.__class__.__name__}"
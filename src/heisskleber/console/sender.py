@@ -1,4 +1,5 @@
 import json
+from collections.abc import Iterable
 from typing import Any, TypeVar
 
 from heisskleber.core import Packer, Sender
@@ -23,10 +24,20 @@ class ConsoleSender(Sender[T]):
     async def send(self, data: T, topic: str | None = None, **kwargs: dict[str, Any]) -> None:
         """Serialize data and write to console output."""
         serialized = self.packer(data)
-        serialized = serialized.decode() if isinstance(serialized, bytes | bytearray) else serialized
+        serialized = str(serialized, "utf-8") if not isinstance(serialized, str) else serialized
         output = f"{topic}:\t{serialized}" if topic else serialized
         print(output)  # noqa: T201
 
+    async def send_many(self, items: Iterable[T], topic: str | None = None, **kwargs: dict[str, Any]) -> None:
+        """Serialize a batch of data and write it to console output with a single print call."""
+        lines = []
+        for data in items:
+            serialized = self.packer(data)
+            serialized = str(serialized, "utf-8") if not isinstance(serialized, str) else serialized
+            lines.append(f"{topic}:\t{serialized}" if topic else serialized)
+        if lines:
+            print("\n".join(lines))  # noqa: T201
+
     def __repr__(self) -> str:
         """Return string reprensentation of ConsoleSink."""
         return f"{self.__class__.__name__}(pretty={self.pretty}, verbose={self.verbose})"
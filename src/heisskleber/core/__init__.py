@@ -1,40 +1,359 @@
-"""Core classes of the heisskleber library."""
+"""Core classes of the heisskleber library.
 
-from typing import Any
+Optional features, e.g. offloading, Prometheus export and compression, are imported on first access.
+"""
 
+import importlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .buffer import OVERFLOW_POLICIES, MessageBuffer, OverflowPolicy
 from .config import BaseConf, ConfigType
-from .packer import JSONPacker, Packer, PackerError, Payload
+from .framing import (
+    FRAMINGS,
+    CobsFramer,
+    DelimiterFramer,
+    Framer,
+    FramingError,
+    LengthPrefixFramer,
+    SlipFramer,
+    create_framer,
+)
+from .latency import LatencyHistogram
+from .metadata import METADATA_FIELDS, Metadata
+from .metrics import LoggingExporter, Metrics, MetricsExporter, collect_metrics, export_metrics
+from .packer import (
+    CborPacker,
+    DataclassPacker,
+    JSONPacker,
+    MsgpackPacker,
+    MsgspecJSONPacker,
+    OrjsonPacker,
+    Packer,
+    PackerError,
+    Payload,
+    RawPacker,
+    StructPacker,
+    fast_json_packer,
+)
 from .receiver import Receiver
+from .retry import CircuitState, RetryPolicy, RetryStats
 from .sender import Sender
-from .unpacker import JSONUnpacker, Unpacker, UnpackerError
+from .unpacker import (
+    CborUnpacker,
+    DataclassUnpacker,
+    JSONUnpacker,
+    MsgpackUnpacker,
+    MsgspecJSONUnpacker,
+    OrjsonUnpacker,
+    RawUnpacker,
+    StructBatchUnpacker,
+    StructUnpacker,
+    Unpacker,
+    UnpackerError,
+    fast_json_unpacker,
+)
+
+if TYPE_CHECKING:
+    from .compression import COMPRESSION_ALGORITHMS, CompressedPacker, CompressedUnpacker, train_zstd_dictionary
+    from .offload import OffloadReceiver, OffloadSender
+    from .pipeline import Pipeline, Stage, StageStats
+    from .prometheus import PrometheusExporter, render_prometheus
+    from .router import TopicRouter, TopicStream
+    from .runner import get_loop_factory, run
+
+_lazy_imports = {
+    # compression
+    "COMPRESSION_ALGORITHMS": "heisskleber.core.compression",
+    "CompressedPacker": "heisskleber.core.compression",
+    "CompressedUnpacker": "heisskleber.core.compression",
+    "train_zstd_dictionary": "heisskleber.core.compression",
+    # offload
+    "OffloadReceiver": "heisskleber.core.offload",
+    "OffloadSender": "heisskleber.core.offload",
+    # pipeline
+    "Pipeline": "heisskleber.core.pipeline",
+    "Stage": "heisskleber.core.pipeline",
+    "StageStats": "heisskleber.core.pipeline",
+    # prometheus
+    "PrometheusExporter": "heisskleber.core.prometheus",
+    "render_prometheus": "heisskleber.core.prometheus",
+    # router
+    "TopicRouter": "heisskleber.core.router",
+    "TopicStream": "heisskleber.core.router",
+    # runner
+    "get_loop_factory": "heisskleber.core.runner",
+    "run": "heisskleber.core.runner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import optional features on first access."""
+    try:
+        module = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported features along with the module attributes."""
+    return sorted([*globals(), *_lazy_imports])
+
 
 json_packer = JSONPacker()
 json_unpacker = JSONUnpacker()
 
 
-_sender_registry: dict[str, type[Sender[Any]]] = {}
-_receiver_registry: dict[str, type[Receiver[Any]]] = {}
-_config_registry: dict[str, type[BaseConf]] = {}
+T = TypeVar("T")
+
+# Built-in backends are registered as "module:attribute" import strings, so that their dependencies
+# (aiomqtt, pyzmq, pyserial, ...) are only imported once a backend is used.
+_builtin_backends = {
+    "console": ("ConsoleSender", "ConsoleReceiver", "ConsoleConf"),
+    "file": ("FileWriter", "FileReader", "FileConf"),
+    "mqtt": ("MqttSender", "MqttReceiver", "MqttConf"),
+    "serial": ("SerialSender", "SerialReceiver", "SerialConf"),
+    "tcp": ("TcpSender", "TcpReceiver", "TcpConf"),
+    "udp": ("UdpSender", "UdpReceiver", "UdpConf"),
+    "zmq": ("ZmqSender", "ZmqReceiver", "ZmqConf"),
+}
+
+_sender_registry: dict[str, type[Sender[Any]] | str] = {
+    name: f"heisskleber.{name}:{sender}" for name, (sender, _, _) in _builtin_backends.items()
+}
+_receiver_registry: dict[str, type[Receiver[Any]] | str] = {
+    name: f"heisskleber.{name}:{receiver}" for name, (_, receiver, _) in _builtin_backends.items()
+}
+_config_registry: dict[str, type[BaseConf] | str] = {
+    name: f"heisskleber.{name}:{config}" for name, (_, _, config) in _builtin_backends.items()
+}
+
+_packer_registry: dict[str, Callable[[], Packer[Any]]] = {
+    "json": lambda: json_packer,
+    "fastjson": fast_json_packer,
+    "orjson": OrjsonPacker,
+    "msgspec": MsgspecJSONPacker,
+    "msgpack": MsgpackPacker,
+    "cbor": CborPacker,
+    "raw": RawPacker,
+}
+_unpacker_registry: dict[str, Callable[[], Unpacker[Any]]] = {
+    "json": lambda: json_unpacker,
+    "fastjson": fast_json_unpacker,
+    "orjson": OrjsonUnpacker,
+    "msgspec": MsgspecJSONUnpacker,
+    "msgpack": MsgpackUnpacker,
+    "cbor": CborUnpacker,
+    "raw": RawUnpacker,
+}
+
 
+def register(
+    name: str,
+    sender: type[Sender[Any]] | str,
+    receiver: type[Receiver[Any]] | str,
+    config: type[BaseConf] | str,
+) -> None:
+    """Register the sender, receiver and config classes of a backend.
 
-def register(name: str, sender: type[Sender[Any]], receiver: type[Receiver[Any]], config: type[BaseConf]) -> None:
-    """Register classes."""
+    Classes can be given as "module:attribute" import strings, which are imported on first use.
+    """
     _sender_registry[name] = sender
     _receiver_registry[name] = receiver
     _config_registry[name] = config
 
 
+def register_codec(name: str, packer: Callable[[], Packer[Any]], unpacker: Callable[[], Unpacker[Any]]) -> None:
+    """Register factories for a packer and unpacker pair, to be selected by name in the configuration."""
+    _packer_registry[name] = packer
+    _unpacker_registry[name] = unpacker
+
+
+def get_packer(name: str) -> Packer[Any]:
+    """Create the packer registered under the given name.
+
+    Built-in names are "json" (standard library), "orjson", "msgspec" and "fastjson",
+    which selects the fastest installed JSON library and falls back to the standard library,
+    as well as the binary formats "msgpack" and "cbor", and "raw", which passes payloads through unchanged.
+    A compression algorithm can be appended with "+", e.g. "json+zlib", see CompressedPacker.
+
+    Raises:
+        ValueError: If no packer is registered under the name or the compression algorithm is unknown.
+        ImportError: If the library backing the packer or the compression is not installed.
+
+    """
+    codec, _, algorithm = name.partition("+")
+    try:
+        factory = _packer_registry[codec]
+    except KeyError:
+        raise ValueError(f"Unknown packer {codec!r}, choose one of {sorted(_packer_registry)}.") from None
+    if not algorithm:
+        return factory()
+    from .compression import CompressedPacker
+
+    return CompressedPacker(factory(), algorithm)  # type: ignore[arg-type]
+
+
+def get_unpacker(name: str) -> Unpacker[Any]:
+    """Create the unpacker registered under the given name.
+
+    Built-in names are "json" (standard library), "orjson", "msgspec" and "fastjson",
+    which selects the fastest installed JSON library and falls back to the standard library,
+    as well as the binary formats "msgpack" and "cbor", and "raw", which passes payloads through unchanged.
+    A compression algorithm can be appended with "+", e.g. "json+zlib", see CompressedUnpacker.
+
+    Raises:
+        ValueError: If no unpacker is registered under the name or the compression algorithm is unknown.
+        ImportError: If the library backing the unpacker is not installed.
+
+    """
+    codec, _, algorithm = name.partition("+")
+    try:
+        factory = _unpacker_registry[codec]
+    except KeyError:
+        raise ValueError(f"Unknown unpacker {codec!r}, choose one of {sorted(_unpacker_registry)}.") from None
+    if not algorithm:
+        return factory()
+    from .compression import COMPRESSION_ALGORITHMS, CompressedUnpacker
+
+    if algorithm not in COMPRESSION_ALGORITHMS:
+        raise ValueError(f"Unknown compression algorithm {algorithm!r}, choose one of {COMPRESSION_ALGORITHMS}.")
+    return CompressedUnpacker(factory())
+
+
+def _resolve(registry: dict[str, T | str], name: str, kind: str) -> T:
+    try:
+        entry = registry[name]
+    except KeyError:
+        raise ValueError(f"Unknown {kind} {name!r}, choose one of {sorted(registry)}.") from None
+    if isinstance(entry, str):
+        module, _, attribute = entry.partition(":")
+        entry = getattr(importlib.import_module(module), attribute)
+        registry[name] = entry
+    return entry
+
+
+def create_config(name: str, config: BaseConf | dict[str, Any] | None = None) -> BaseConf:
+    """Create the config of the backend registered under the given name.
+
+    Arguments:
+        name: Name of the backend, e.g. "mqtt" or "udp".
+        config: A config instance, which is returned as it is, or a dictionary of config values.
+            Defaults to the default config of the backend.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+
+    """
+    if isinstance(config, BaseConf):
+        return config
+    config_class = _resolve(_config_registry, name, "backend")
+    return config_class() if config is None else config_class.from_dict(config)
+
+
+def create_sender(name: str, config: BaseConf | dict[str, Any] | None = None, **kwargs: Any) -> Sender[Any]:
+    """Create a sender of the backend registered under the given name.
+
+    Only the selected backend and its dependencies are imported.
+
+    Arguments:
+        name: Name of the backend, e.g. "mqtt" or "udp".
+        config: A config instance or a dictionary of config values, see create_config().
+        **kwargs: Passed on to the sender, e.g. a packer.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+
+    Example:
+        >>> sender = create_sender("udp", {"host": "127.0.0.1", "port": 5000})
+
+    """
+    sender = _resolve(_sender_registry, name, "backend")
+    return sender(create_config(name, config), **kwargs)  # type: ignore[call-arg]
+
+
+def create_receiver(name: str, config: BaseConf | dict[str, Any] | None = None, **kwargs: Any) -> Receiver[Any]:
+    """Create a receiver of the backend registered under the given name.
+
+    Only the selected backend and its dependencies are imported.
+
+    Arguments:
+        name: Name of the backend, e.g. "mqtt" or "udp".
+        config: A config instance or a dictionary of config values, see create_config().
+        **kwargs: Passed on to the receiver, e.g. an unpacker or the mqtt topic.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+
+    """
+    receiver = _resolve(_receiver_registry, name, "backend")
+    return receiver(create_config(name, config), **kwargs)  # type: ignore[call-arg]
+
+
 __all__ = [
+    "COMPRESSION_ALGORITHMS",
+    "FRAMINGS",
+    "METADATA_FIELDS",
+    "OVERFLOW_POLICIES",
     "BaseConf",
+    "CircuitState",
+    "CobsFramer",
+    "CompressedPacker",
+    "CompressedUnpacker",
     "ConfigType",
+    "DataclassPacker",
+    "DataclassUnpacker",
+    "DelimiterFramer",
+    "Framer",
+    "FramingError",
+    "LatencyHistogram",
+    "LengthPrefixFramer",
+    "LoggingExporter",
+    "MessageBuffer",
+    "Metadata",
+    "Metrics",
+    "MetricsExporter",
+    "OffloadReceiver",
+    "OffloadSender",
+    "OverflowPolicy",
     "Packer",
     "PackerError",
     "Payload",
+    "Pipeline",
+    "PrometheusExporter",
+    "RawPacker",
+    "RawUnpacker",
     "Receiver",
+    "RetryPolicy",
+    "RetryStats",
     "Sender",
+    "SlipFramer",
+    "Stage",
+    "StageStats",
+    "StructBatchUnpacker",
+    "StructPacker",
+    "StructUnpacker",
+    "TopicRouter",
+    "TopicStream",
     "Unpacker",
     "UnpackerError",
+    "collect_metrics",
+    "create_config",
+    "create_framer",
+    "create_receiver",
+    "create_sender",
+    "export_metrics",
+    "get_loop_factory",
+    "get_packer",
+    "get_unpacker",
     "json_packer",
     "json_unpacker",
     "register",
+    "register_codec",
+    "render_prometheus",
+    "run",
+    "train_zstd_dictionary",
 ]
@@ -0,0 +1,204 @@
+"""Bounded message buffer with selectable overflow policies."""
+
+import asyncio
+import pickle
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable, Iterable
+from typing import IO, Any, Literal, TypeVar, get_args
+
+T = TypeVar("T")
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest", "coalesce", "spill"]
+OVERFLOW_POLICIES: tuple[str, ...] = get_args(OverflowPolicy)
+
+_LENGTH_BYTES = 4
+
+
+class _Spilled:
+    """An item that has been pickled for the spill file."""
+
+    __slots__ = ("record",)
+
+    def __init__(self, record: bytes) -> None:
+        self.record = record
+
+
+def _same_key(item: Any) -> None:
+    return None
+
+
+class MessageBuffer(asyncio.Queue[T]):
+    """An asyncio.Queue that handles overflow according to a policy and counts what it dropped.
+
+    Policies:
+        block: put() waits for free space and put_nowait() raises asyncio.QueueFull, like asyncio.Queue.
+        drop_oldest: The oldest item is dropped to make room for the new one.
+        drop_newest: The new item is dropped.
+        coalesce: Only the latest item per key is kept. A new item replaces the queued item with the same key
+            in place, otherwise the oldest item is dropped if the buffer is full. Replaced items count as dropped.
+        spill: Items that do not fit into memory are pickled to a temporary file and read back in order.
+            Items that would exceed `max_spill_bytes` are dropped.
+
+    Only the block policy ever makes put() wait.
+
+    Arguments:
+        maxsize: Number of items held in memory. If 0, the buffer is unbounded and only coalesce drops items.
+        policy: The overflow policy.
+        key: Returns the key of an item for the coalesce policy, e.g. its topic.
+            Defaults to the same key for all items, i.e. only the latest item is kept.
+        spill_directory: Directory of the spill file. Defaults to the system's temporary directory.
+        max_spill_bytes: Maximum size of the spill file. None is unlimited.
+
+    Attributes:
+        dropped: Number of dropped items.
+        high_water_mark: Highest number of buffered items, including spilled ones.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: OverflowPolicy = "block",
+        *,
+        key: Callable[[T], Hashable] | None = None,
+        spill_directory: str | None = None,
+        max_spill_bytes: int | None = None,
+    ) -> None:
+        if policy not in OVERFLOW_POLICIES:
+            msg = f"Unknown overflow policy {policy!r}, choose one of {', '.join(OVERFLOW_POLICIES)}."
+            raise ValueError(msg)
+        self.policy = policy
+        self.key: Callable[[T], Hashable] = key or _same_key
+        self.spill_directory = spill_directory
+        self.max_spill_bytes = max_spill_bytes
+        self.dropped = 0
+        self.high_water_mark = 0
+        self._spill_file: IO[bytes] | None = None
+        self._spilled = 0
+        self._read_position = 0
+        self._write_position = 0
+        super().__init__(maxsize)
+
+    def put_nowait(self, item: T) -> None:
+        """Put an item into the buffer, applying the overflow policy if it is full.
+
+        Raises:
+            asyncio.QueueFull: If the buffer is full and the policy is block.
+
+        """
+        policy = self.policy
+        if policy == "coalesce":
+            key = self.key(item)
+            if key in self._queue:
+                self._queue[key] = item
+                self.dropped += 1
+                return
+        if policy == "spill":
+            if self._spilled or 0 < self.maxsize <= len(self._queue):
+                record = pickle.dumps(item)
+                if self.max_spill_bytes is not None and (
+                    self._write_position - self._read_position + len(record) > self.max_spill_bytes
+                ):
+                    self.dropped += 1
+                    return
+                item = _Spilled(record)  # type: ignore[assignment]
+        elif self.full():
+            if policy == "drop_newest":
+                self.dropped += 1
+                return
+            if policy != "block":  # drop_oldest, coalesce
+                self.get_nowait()
+                self.task_done()
+                self.dropped += 1
+
+        super().put_nowait(item)
+        self.high_water_mark = max(self.high_water_mark, self.qsize())
+
+    async def put(self, item: T) -> None:
+        """Put an item into the buffer, waiting for free space only if the policy is block."""
+        if self.policy == "block":
+            await super().put(item)
+        else:
+            self.put_nowait(item)
+
+    async def put_many(self, items: Iterable[T]) -> None:
+        """Put items into the buffer in order, waiting for free space only if the policy is block.
+
+        Items are put without suspending while there is space, so a batch that fits costs no await.
+        """
+        if self.policy != "block":
+            for item in items:
+                self.put_nowait(item)
+            return
+        for item in items:
+            if self.full():
+                await super().put(item)
+            else:
+                self.put_nowait(item)
+
+    def qsize(self) -> int:
+        """Return the number of buffered items, including spilled ones."""
+        return len(self._queue) + self._spilled
+
+    def full(self) -> bool:
+        """Return True if the buffer holds maxsize items in memory. A spilling buffer is never full."""
+        return self.policy != "spill" and super().full()
+
+    def close(self) -> None:
+        """Close and delete the spill file. Spilled items are lost."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spilled = self._read_position = self._write_position = 0
+
+    # asyncio.Queue storage hooks
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: Any = OrderedDict() if self.policy == "coalesce" else deque()
+
+    def _put(self, item: T) -> None:
+        if isinstance(item, _Spilled):
+            self._spill(item.record)
+        elif self.policy == "coalesce":
+            self._queue[self.key(item)] = item
+        else:
+            self._queue.append(item)
+
+    def _get(self) -> T:
+        if self.policy == "coalesce":
+            return self._queue.popitem(last=False)[1]  # type: ignore[no-any-return]
+        item = self._queue.popleft()
+        if self._spilled:
+            self._queue.append(self._unspill())
+        return item  # type: ignore[no-any-return]
+
+    def _spill(self, record: bytes) -> None:
+        if self._spill_file is None:
+            import tempfile
+
+            self._spill_file = tempfile.TemporaryFile(dir=self.spill_directory)  # noqa: SIM115
+        self._spill_file.seek(self._write_position)
+        self._spill_file.write(len(record).to_bytes(_LENGTH_BYTES, "little"))
+        self._spill_file.write(record)
+        self._write_position += _LENGTH_BYTES + len(record)
+        self._spilled += 1
+
+    def _unspill(self) -> Any:
+        spill_file: IO[bytes] = self._spill_file  # type: ignore[assignment]
+        spill_file.seek(self._read_position)
+        length = int.from_bytes(spill_file.read(_LENGTH_BYTES), "little")
+        record = spill_file.read(length)
+        self._read_position += _LENGTH_BYTES + length
+        self._spilled -= 1
+        if not self._spilled:  # start over instead of growing the file forever
+            spill_file.seek(0)
+            spill_file.truncate()
+            self._read_position = self._write_position = 0
+        return pickle.loads(record)  # noqa: S301
+
+    def __repr__(self) -> str:
+        """Return string representation of the buffer."""
+        return (
+            f"{self.__class__.__name__}(maxsize={self.maxsize}, policy={self.policy}, "
+            f"size={self.qsize()}, dropped={self.dropped})"
+        )
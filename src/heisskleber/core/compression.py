@@ -0,0 +1,214 @@
+"""Compressing wrappers for packers and unpackers."""
+
+import base64
+import binascii
+import lzma
+import zlib
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any, Literal, TypeVar
+
+from .packer import JSONPacker, Packer, PackerError, Payload, as_buffer
+from .unpacker import JSONUnpacker, Unpacker, UnpackerError
+
+T = TypeVar("T")
+
+Algorithm = Literal["zlib", "lzma", "zstd", "lz4"]
+COMPRESSION_ALGORITHMS: tuple[str, ...] = ("zlib", "lzma", "zstd", "lz4")
+
+# The first byte of a compressed payload names the algorithm, 0 marks a payload that was left uncompressed.
+# All header bytes are below 0x20, so they can not be confused with the first character of a base64 payload.
+_RAW = 0
+_BASE64_START = 0x20
+_HEADERS = {name: index for index, name in enumerate(COMPRESSION_ALGORITHMS, start=1)}
+_ALGORITHMS = {index: name for name, index in _HEADERS.items()}
+
+_Compress = Callable[[bytes | bytearray | memoryview], bytes]
+
+
+def _compressor(algorithm: str, level: int | None, dictionary: bytes | None) -> _Compress:
+    if algorithm == "zlib":
+        return partial(zlib.compress, level=-1 if level is None else level)
+    if algorithm == "lzma":
+        return partial(lzma.compress, preset=6 if level is None else level)
+    if algorithm == "zstd":
+        import zstandard
+
+        dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary is not None else None
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level, dict_data=dict_data)
+        return compressor.compress  # type: ignore[no-any-return]
+    if algorithm == "lz4":
+        import lz4.frame
+
+        return partial(lz4.frame.compress, compression_level=0 if level is None else level)
+    msg = f"Unknown compression algorithm {algorithm!r}, choose one of {', '.join(COMPRESSION_ALGORITHMS)}."
+    raise ValueError(msg)
+
+
+def _decompressor(algorithm: str, dictionary: bytes | None) -> _Compress:
+    if algorithm == "zlib":
+        return zlib.decompress
+    if algorithm == "lzma":
+        return lzma.decompress
+    if algorithm == "zstd":
+        import zstandard
+
+        dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary is not None else None
+        return zstandard.ZstdDecompressor(dict_data=dict_data).decompress  # type: ignore[no-any-return]
+    import lz4.frame
+
+    return lz4.frame.decompress  # type: ignore[no-any-return]
+
+
+def train_zstd_dictionary(samples: Iterable[bytes], size: int = 16384) -> bytes:
+    """Train a zstd dictionary on sample payloads, e.g. a few thousand packed messages.
+
+    Small messages compress poorly on their own, as there is little repetition within a single message.
+    A dictionary trained on typical messages provides the repetition instead.
+    The same dictionary has to be passed to the CompressedPacker and the CompressedUnpacker.
+
+    Raises:
+        ImportError: If zstandard is not installed.
+
+    """
+    import zstandard
+
+    return zstandard.train_dictionary(size, list(samples)).as_bytes()  # type: ignore[no-any-return]
+
+
+class CompressedPacker(Packer[T]):
+    """Compresses the payloads of another packer.
+
+    Every payload starts with one header byte that names the algorithm, so a CompressedUnpacker
+    decompresses payloads of any algorithm. Payloads smaller than `threshold` bytes, and payloads that
+    would not get smaller, are sent uncompressed behind a header byte of 0.
+
+    zlib and lzma are part of the standard library, zstd needs `zstandard`_ and lz4 needs `lz4`_.
+
+    Arguments:
+        packer: The packer whose payloads are compressed. Defaults to JSONPacker.
+        algorithm: One of "zlib", "lzma", "zstd" and "lz4".
+        level: Compression level of the algorithm. Defaults to the algorithm's default.
+        threshold: Payloads below this size in bytes are left uncompressed.
+        dictionary: A zstd dictionary, see train_zstd_dictionary(). Only used by zstd.
+        base64: Encode the payloads as base64, e.g. for line-based files of the FileWriter,
+            as compressed payloads may contain line breaks.
+
+    Raises:
+        ValueError: If the algorithm is unknown.
+        ImportError: If the library of the algorithm is not installed.
+
+    Example:
+        >>> packer = CompressedPacker(JSONPacker(), "zlib")
+        >>> payload = packer({"values": [0.0] * 100})
+        >>> len(payload) < len(JSONPacker()({"values": [0.0] * 100}))
+        True
+
+    .. _zstandard: https://github.com/indygreg/python-zstandard
+    .. _lz4: https://github.com/python-lz4/python-lz4
+
+    """
+
+    emits_bytes = True
+
+    def __init__(  # noqa: PLR0913
+        self,
+        packer: Packer[T] | None = None,
+        algorithm: Algorithm = "zlib",
+        *,
+        level: int | None = None,
+        threshold: int = 64,
+        dictionary: bytes | None = None,
+        base64: bool = False,
+    ) -> None:
+        self.packer: Packer[T] = packer or JSONPacker()  # type: ignore[assignment]
+        self.algorithm = algorithm
+        self.level = level
+        self.threshold = threshold
+        self.dictionary = dictionary
+        self.base64 = base64
+        self._compress = _compressor(algorithm, level, dictionary)
+        self._header = bytes([_HEADERS[algorithm]])
+
+    def __call__(self, data: T) -> bytes:
+        """Pack and compress the data."""
+        payload = as_buffer(self.packer(data))
+        packed = bytes([_RAW]) + payload
+        if len(payload) >= self.threshold:
+            try:
+                compressed = self._header + self._compress(payload)
+            except Exception as err:
+                raise PackerError(data) from err
+            if len(compressed) < len(packed):
+                packed = compressed
+        return base64.b64encode(packed) if self.base64 else packed
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state without the compressor, which is recreated after unpickling, e.g. in a process pool."""
+        return {key: value for key, value in self.__dict__.items() if key != "_compress"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state and recreate the compressor."""
+        self.__dict__.update(state)
+        self._compress = _compressor(self.algorithm, self.level, self.dictionary)
+
+    def __repr__(self) -> str:
+        """Return string representation of the packer."""
+        return f"{self.__class__.__name__}({self.packer!r}, algorithm={self.algorithm})"
+
+
+class CompressedUnpacker(Unpacker[T]):
+    """Decompresses payloads of a CompressedPacker and unpacks them with another unpacker.
+
+    The algorithm is read from the header byte of every payload, base64 encoded payloads are detected as well.
+
+    Arguments:
+        unpacker: The unpacker of the decompressed payloads. Defaults to JSONUnpacker.
+        dictionary: The zstd dictionary the payloads were compressed with.
+
+    Raises:
+        UnpackerError: If the payload is corrupt or uses an unknown algorithm.
+        ImportError: If the library of the payload's algorithm is not installed.
+
+    Example:
+        >>> unpacker = CompressedUnpacker(JSONUnpacker())
+        >>> data, metadata = unpacker(CompressedPacker(JSONPacker(), "lzma")({"key": "value"}))
+        >>> print(data)
+        {'key': 'value'}
+
+    """
+
+    def __init__(self, unpacker: Unpacker[T] | None = None, dictionary: bytes | None = None) -> None:
+        self.unpacker: Unpacker[T] = unpacker or JSONUnpacker()  # type: ignore[assignment]
+        self.dictionary = dictionary
+        self._decompressors: dict[int, _Compress] = {}
+
+    def __call__(self, payload: Payload) -> tuple[T, dict[str, Any]]:
+        """Decompress and unpack the payload."""
+        buffer = as_buffer(payload, "ascii")
+        if buffer and buffer[0] >= _BASE64_START:
+            try:
+                buffer = base64.b64decode(buffer, validate=True)
+            except binascii.Error as e:
+                raise UnpackerError(payload) from e
+        if not buffer or (buffer[0] != _RAW and buffer[0] not in _ALGORITHMS):
+            raise UnpackerError(payload)
+        if buffer[0] == _RAW:
+            return self.unpacker(buffer[1:])
+        try:
+            decompress = self._decompressors[buffer[0]]
+        except KeyError:
+            decompress = self._decompressors[buffer[0]] = _decompressor(_ALGORITHMS[buffer[0]], self.dictionary)
+        try:
+            decompressed = decompress(buffer[1:])
+        except Exception as e:  # zlib.error, lzma.LZMAError, zstandard.ZstdError, RuntimeError of lz4
+            raise UnpackerError(payload) from e
+        return self.unpacker(decompressed)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state without the decompressors, which are recreated on demand after unpickling."""
+        return {**self.__dict__, "_decompressors": {}}
+
+    def __repr__(self) -> str:
+        """Return string representation of the unpacker."""
+        return f"{self.__class__.__name__}({self.unpacker!r})"
@@ -1,11 +1,11 @@
 """Configuration baseclass."""
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, fields
-from pathlib import Path
-from typing import Any, Literal, Self, TextIO, TypeVar, Union, get_args, get_origin
-
-import yaml
+from pathlib import Path, PurePath
+from types import UnionType
+from typing import Any, Literal, Self, TextIO, TypeVar, Union, get_args, get_origin, get_type_hints
 
 logger = logging.getLogger("heisskleber")
 
@@ -16,6 +16,8 @@ ConfigType = TypeVar(
 
 
 def _parse_yaml(file: TextIO) -> dict[str, Any]:
+    import yaml
+
     try:
         return dict(yaml.safe_load(file))
     except yaml.YAMLError as e:
@@ -48,32 +50,128 @@ def _parser(path: Path) -> dict[str, Any]:
         raise ValueError
 
 
-def _check_type(value: Any, expected_type: Any) -> bool:
+Validator = Callable[[Any], Any]
+
+
+def _type_name(expected_type: Any) -> str:
+    return getattr(expected_type, "__name__", str(expected_type))
+
+
+def _compile_validator(expected_type: Any) -> Validator | None:  # noqa: C901, PLR0911
+    """Return a function that checks a value against the type and returns it, possibly coerced.
+
+    Returns None if every value is valid. The validators raise TypeError on a mismatch.
+    ints are converted for float fields, strings for Path fields.
+    """
+    if expected_type is Any or expected_type is object:
+        return None
     origin = get_origin(expected_type)
-    if origin is Literal:  # Explicitly check literal
-        if value not in get_args(expected_type):
-            logger.exception("%s is not part of %s", value, get_args(expected_type))
-            raise TypeError
-        return True
-    return isinstance(value, expected_type)
+    if origin is Literal:
+        values = get_args(expected_type)
+
+        def check_literal(value: Any) -> Any:
+            if value not in values:
+                raise TypeError(f"expected one of {values}, got {value!r}")
+            return value
+
+        return check_literal
+    if origin is Union or origin is UnionType:
+        candidates = [_compile_validator(t) for t in get_args(expected_type)]
+        if any(candidate is None for candidate in candidates):
+            return None
+
+        def check_union(value: Any) -> Any:
+            for candidate in candidates:
+                try:
+                    return candidate(value)  # type: ignore[misc]
+                except TypeError:  # noqa: PERF203
+                    continue
+            raise TypeError(f"expected {expected_type}, got {type(value).__name__}")
+
+        return check_union
+    if origin is not None:
+        expected_type = origin  # only the container type of generics such as list[str] is checked
+    if not isinstance(expected_type, type):
+        return None
+    if expected_type is float:
+
+        def check_float(value: Any) -> Any:
+            if isinstance(value, float):
+                return value
+            if isinstance(value, int) and not isinstance(value, bool):
+                return float(value)
+            raise TypeError(f"expected float, got {type(value).__name__}")
+
+        return check_float
+    if issubclass(expected_type, PurePath):
+
+        def check_path(value: Any) -> Any:
+            if isinstance(value, expected_type):
+                return value
+            if isinstance(value, str):
+                return expected_type(value)
+            raise TypeError(f"expected {_type_name(expected_type)}, got {type(value).__name__}")
+
+        return check_path
+
+    def check_instance(value: Any) -> Any:
+        if isinstance(value, expected_type):
+            return value
+        raise TypeError(f"expected {_type_name(expected_type)}, got {type(value).__name__}")
+
+    return check_instance
+
+
+@dataclass(frozen=True)
+class _CompiledConf:
+    field_names: frozenset[str]
+    validators: tuple[tuple[str, Validator], ...]
+
+
+_compiled_confs: dict[type, _CompiledConf] = {}
 
 
 @dataclass
 class BaseConf:
-    """Default configuration class for generic configuration info."""
+    """Default configuration class for generic configuration info.
+
+    Field values are checked against the field types on instantiation. None is accepted for every field.
+    ints are accepted for float fields and strings for Path fields, and are converted.
+    The validators are compiled once per class, on first instantiation.
+    """
 
     def __post_init__(self) -> None:
         """Check if all attributes are the same type as the original defition of the dataclass."""
-        for field in fields(self):
-            value = getattr(self, field.name)
+        for name, validate in self._compiled().validators:
+            value = getattr(self, name)
             if value is None:  # Allow optional fields
                 continue
-            if hasattr(field.type, "__origin__") and field.type.__origin__ is Union:
-                if not any(_check_type(value, t) for t in field.type.__args__):
-                    raise TypeError
-                continue
-            if not _check_type(value, field.type):  # Failed field comparison
-                raise TypeError
+            try:
+                converted = validate(value)
+            except TypeError as e:
+                raise TypeError(f"{self.__class__.__name__}.{name}: {e}") from None
+            if converted is not value:
+                object.__setattr__(self, name, converted)
+
+    @classmethod
+    def _compiled(cls) -> _CompiledConf:
+        try:
+            return _compiled_confs[cls]
+        except KeyError:
+            pass
+        try:
+            hints = get_type_hints(cls)
+        except (NameError, TypeError):  # unresolvable forward references, fall back to the raw annotations
+            hints = {}
+        class_fields = fields(cls)
+        validators = []
+        for field in class_fields:
+            validator = _compile_validator(hints.get(field.name, field.type))
+            if validator is not None:
+                validators.append((field.name, validator))
+        compiled = _CompiledConf(frozenset(field.name for field in class_fields), tuple(validators))
+        _compiled_confs[cls] = compiled
+        return compiled
 
     @classmethod
     def from_dict(cls, config_dict: dict[str, Any]) -> Self:
@@ -120,7 +218,7 @@ class BaseConf:
             TypeError raised as expected
 
         """
-        valid_fields = {f.name for f in fields(cls)}
+        valid_fields = cls._compiled().field_names
         filtered_dict = {k: v for k, v in config_dict.items() if k in valid_fields}
         return cls(**filtered_dict)
 
@@ -0,0 +1,358 @@
+"""Split byte streams into frames and frame payloads for sending."""
+
+import struct
+from abc import ABC, abstractmethod
+
+Buffer = bytes | bytearray | memoryview
+
+FRAMINGS: tuple[str, ...] = ("delimiter", "u16be", "u16le", "u32be", "u32le", "cobs", "slip")
+
+
+class FramingError(Exception):
+    """Raised when a stream can not be split into frames, or a payload can not be framed."""
+
+
+class Framer(ABC):
+    """Incremental decoder of a byte stream into frames, and encoder of payloads into frames.
+
+    feed() accepts chunks of any size and returns all frames they complete at once, so stream transports
+    can read large buffers per call. The incomplete tail of the stream is kept until the next call,
+    hence a framer instance belongs to a single stream and has to be reset when the stream is reconnected.
+
+    Arguments:
+        max_size: Maximum size of a frame in bytes, None for unlimited.
+
+    Attributes:
+        dropped: Number of corrupt or oversized frames that were dropped.
+
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self.max_size = max_size
+        self.dropped = 0
+        self._buffer = bytearray()
+
+    @abstractmethod
+    def encode(self, payload: Buffer) -> bytes:
+        """Return the payload as a frame.
+
+        Raises:
+            FramingError: If the payload can not be framed, e.g. because it is too long for a length prefix.
+
+        """
+
+    @abstractmethod
+    def feed(self, data: Buffer) -> list[bytes]:
+        """Append a chunk of the stream and return the payloads of all frames that are now complete.
+
+        Raises:
+            FramingError: If the stream can not be split any further, e.g. after an oversized length prefix.
+
+        """
+
+    @abstractmethod
+    def flush(self) -> list[bytes]:
+        """Return the incomplete tail as the last frame, e.g. at the end of a stream, and reset the framer.
+
+        Raises:
+            FramingError: If the tail is not a valid frame.
+
+        """
+
+    def split(self, data: Buffer) -> list[bytes]:
+        """Return the payloads of all frames of a self-contained buffer, such as a datagram.
+
+        The last frame does not need to be terminated.
+        """
+        return self.feed(data) + self.flush()
+
+    def reset(self) -> None:
+        """Discard the incomplete tail, e.g. when the stream is reconnected."""
+        self._buffer.clear()
+
+
+class DelimiterFramer(Framer):
+    r"""Frames that end with a delimiter, e.g. lines.
+
+    The delimiter is removed from the received payloads and empty frames are skipped.
+    Payloads must not contain the delimiter, see CobsFramer and SlipFramer for binary payloads.
+    Frames that exceed max_size are dropped, an incomplete one up to the next delimiter, so the limit does not
+    depend on how the stream was chunked.
+
+    Arguments:
+        delimiter: The bytes that end a frame.
+        max_size: Maximum size of a frame in bytes, None for unlimited.
+
+    Example:
+        >>> framer = DelimiterFramer(b"\n")
+        >>> framer.feed(b"a\nb\nc")
+        [b'a', b'b']
+        >>> framer.feed(b"\n")
+        [b'c']
+
+    """
+
+    def __init__(self, delimiter: bytes = b"\n", max_size: int | None = None) -> None:
+        if not delimiter:
+            msg = "The delimiter must not be empty."
+            raise ValueError(msg)
+        super().__init__(max_size)
+        self.delimiter = delimiter
+        self._scanned = 0  # the buffer before this position does not contain the delimiter
+        self._discarding = False  # the tail belongs to an oversized frame
+
+    def encode(self, payload: Buffer) -> bytes:
+        """Return the payload followed by the delimiter."""
+        return b"".join((payload, self.delimiter))
+
+    def feed(self, data: Buffer) -> list[bytes]:
+        """Append a chunk of the stream and return the payloads of all complete frames."""
+        buffer = self._buffer
+        buffer += data
+        delimiter = self.delimiter
+        end = buffer.find(delimiter, self._scanned)
+        frames: list[bytes] = []
+        if end >= 0:
+            start = 0
+            max_size = len(buffer) if self.max_size is None else self.max_size
+            with memoryview(buffer) as view:
+                while end >= 0:
+                    if self._discarding:
+                        self._discarding = False
+                    elif end - start > max_size:
+                        self.dropped += 1
+                    elif end > start:
+                        frames.append(view[start:end].tobytes())  # single copy out of the read buffer
+                    start = end + len(delimiter)
+                    end = buffer.find(delimiter, start)
+            del buffer[:start]
+        # a delimiter may be split between two chunks, so its beginning is scanned again
+        self._scanned = max(len(buffer) - len(delimiter) + 1, 0)
+        if self.max_size is not None and len(buffer) > self.max_size:
+            self.dropped += not self._discarding
+            self._discarding = True
+            self._buffer.clear()
+            self._scanned = 0
+        return self._decode_all(frames)
+
+    def flush(self) -> list[bytes]:
+        """Return the unterminated tail as the last frame and reset the framer."""
+        frames = [bytes(self._buffer)] if self._buffer and not self._discarding else []
+        self.reset()
+        return self._decode_all(frames)
+
+    def reset(self) -> None:
+        """Discard the incomplete tail."""
+        super().reset()
+        self._scanned = 0
+        self._discarding = False
+
+    def _decode_all(self, frames: list[bytes]) -> list[bytes]:
+        """Decode the payloads of the frames, dropping corrupt frames."""
+        return frames
+
+    def __repr__(self) -> str:
+        """Return string representation of the framer."""
+        return f"{self.__class__.__name__}({self.delimiter!r})"
+
+
+def _cobs_decode(frame: bytes) -> bytes | None:
+    """Return the decoded frame, or None if it is truncated."""
+    decoded = bytearray()
+    position = 0
+    while position < len(frame):
+        code = frame[position]
+        end = position + code
+        if end > len(frame):
+            return None
+        decoded += frame[position + 1 : end]
+        position = end
+        if code != 0xFF and position < len(frame):  # noqa: PLR2004
+            decoded.append(0)
+    return bytes(decoded)
+
+
+class CobsFramer(DelimiterFramer):
+    r"""Frames encoded with `Consistent Overhead Byte Stuffing`_ and terminated by a zero byte.
+
+    COBS removes all zero bytes from the payload at an overhead of one byte per 254 bytes,
+    so any binary payload can be framed. Corrupt frames are dropped, and decoding resumes after the next zero byte.
+
+    Example:
+        >>> framer = CobsFramer()
+        >>> framer.encode(b"\x11\x00\x22")
+        b'\x02\x11\x02"\x00'
+        >>> framer.feed(framer.encode(b"\x11\x00\x22"))
+        [b'\x11\x00"']
+
+    .. _Consistent Overhead Byte Stuffing: https://en.wikipedia.org/wiki/Consistent_Overhead_Byte_Stuffing
+
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        super().__init__(b"\x00", max_size)
+
+    def encode(self, payload: Buffer) -> bytes:
+        """Return the COBS encoded payload, terminated by a zero byte."""
+        encoded = bytearray()
+        for block in bytes(payload).split(b"\x00"):
+            start = 0
+            while len(block) - start >= 0xFE:  # noqa: PLR2004
+                encoded.append(0xFF)  # 254 bytes, not followed by a zero
+                encoded += block[start : start + 0xFE]
+                start += 0xFE
+            encoded.append(len(block) - start + 1)
+            encoded += block[start:]
+        encoded.append(0)
+        return bytes(encoded)
+
+    def _decode_all(self, frames: list[bytes]) -> list[bytes]:
+        decoded = [_cobs_decode(frame) for frame in frames]
+        valid = [frame for frame in decoded if frame is not None]
+        self.dropped += len(decoded) - len(valid)
+        return valid
+
+
+_SLIP_END = b"\xc0"
+_SLIP_ESC = b"\xdb"
+_SLIP_ESC_END = b"\xdb\xdc"
+_SLIP_ESC_ESC = b"\xdb\xdd"
+
+
+class SlipFramer(DelimiterFramer):
+    r"""Frames encoded with `SLIP`_ (RFC 1055).
+
+    END bytes (0xC0) in the payload are escaped, so any binary payload can be framed.
+    Frames are terminated by END. Empty frames, e.g. from END bytes sent to flush line noise, are skipped.
+
+    Example:
+        >>> framer = SlipFramer()
+        >>> framer.encode(b"\x01\xc0")
+        b'\x01\xdb\xdc\xc0'
+        >>> framer.feed(b"\xc0\x01\xdb\xdc\xc0")
+        [b'\x01\xc0']
+
+    .. _SLIP: https://datatracker.ietf.org/doc/html/rfc1055
+
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        super().__init__(_SLIP_END, max_size)
+
+    def encode(self, payload: Buffer) -> bytes:
+        """Return the escaped payload, terminated by END."""
+        return bytes(payload).replace(_SLIP_ESC, _SLIP_ESC_ESC).replace(_SLIP_END, _SLIP_ESC_END) + _SLIP_END
+
+    def _decode_all(self, frames: list[bytes]) -> list[bytes]:
+        # ESC is always escaped, so every remaining ESC starts an escape sequence
+        return [frame.replace(_SLIP_ESC_END, _SLIP_END).replace(_SLIP_ESC_ESC, _SLIP_ESC) for frame in frames]
+
+
+class LengthPrefixFramer(Framer):
+    r"""Frames that start with their length as unsigned integer.
+
+    Arguments:
+        size: Size of the length prefix in bytes, 2 or 4.
+        byteorder: Byte order of the length prefix, "big" (network byte order) or "little".
+        max_size: Maximum size of a frame in bytes, None for unlimited. A longer frame raises a FramingError
+            as soon as its prefix is read, as the stream can not be split any further.
+
+    Raises:
+        ValueError: If size or byteorder is not supported.
+
+    Example:
+        >>> framer = LengthPrefixFramer(2, "big")
+        >>> framer.encode(b"abc")
+        b'\x00\x03abc'
+        >>> framer.feed(b"\x00\x03abc\x00")
+        [b'abc']
+
+    """
+
+    def __init__(self, size: int = 4, byteorder: str = "big", max_size: int | None = None) -> None:
+        if size not in (2, 4) or byteorder not in ("big", "little"):
+            msg = f"Unsupported length prefix of {size} bytes in {byteorder} byte order, use 2 or 4 and big or little."
+            raise ValueError(msg)
+        super().__init__(max_size)
+        self.size = size
+        self.byteorder = byteorder
+        self._prefix = struct.Struct((">" if byteorder == "big" else "<") + ("H" if size == 2 else "I"))  # noqa: PLR2004
+        self._limit = 2 ** (8 * size) - 1
+
+    def encode(self, payload: Buffer) -> bytes:
+        """Return the payload with its length as prefix."""
+        length = len(payload) if not isinstance(payload, memoryview) else payload.nbytes
+        if length > self._limit:
+            msg = f"Payload of {length} bytes is too long for a length prefix of {self.size} bytes."
+            raise FramingError(msg)
+        return b"".join((self._prefix.pack(length), payload))
+
+    def feed(self, data: Buffer) -> list[bytes]:
+        """Append a chunk of the stream and return the payloads of all complete frames."""
+        buffer = self._buffer
+        buffer += data
+        unpack_from = self._prefix.unpack_from
+        size = self.size
+        frames: list[bytes] = []
+        start = 0
+        oversized = None
+        with memoryview(buffer) as view:
+            while len(buffer) - start >= size:
+                (length,) = unpack_from(buffer, start)
+                if self.max_size is not None and length > self.max_size:
+                    if not frames:  # frames before the oversized one are returned first, the next call raises
+                        oversized = length
+                    break
+                end = start + size + length
+                if end > len(buffer):
+                    break
+                frames.append(view[start + size : end].tobytes())  # single copy out of the read buffer
+                start = end
+        del buffer[:start]
+        if oversized is not None:
+            self.reset()
+            self.dropped += 1
+            msg = f"Frame of {oversized} bytes exceeds the maximum size of {self.max_size} bytes."
+            raise FramingError(msg)
+        return frames
+
+    def flush(self) -> list[bytes]:
+        """Reset the framer.
+
+        Raises:
+            FramingError: If an incomplete frame is left.
+
+        """
+        if self._buffer:
+            self.reset()
+            msg = "Incomplete length-prefixed frame."
+            raise FramingError(msg)
+        return []
+
+    def __repr__(self) -> str:
+        """Return string representation of the framer."""
+        return f"{self.__class__.__name__}(size={self.size}, byteorder={self.byteorder})"
+
+
+def create_framer(name: str, delimiter: bytes = b"\n", max_size: int | None = None) -> Framer:
+    """Create a framer by name, as used by the transport configurations.
+
+    Arguments:
+        name: One of "delimiter", "u16be", "u16le", "u32be", "u32le" (length prefixes), "cobs" and "slip".
+        delimiter: The delimiter of the "delimiter" framing.
+        max_size: Maximum size of a frame in bytes, None for unlimited.
+
+    Raises:
+        ValueError: If the name is unknown.
+
+    """
+    if name == "delimiter":
+        return DelimiterFramer(delimiter, max_size)
+    if name == "cobs":
+        return CobsFramer(max_size)
+    if name == "slip":
+        return SlipFramer(max_size)
+    if name in ("u16be", "u16le", "u32be", "u32le"):
+        return LengthPrefixFramer(int(name[1:3]) // 8, "big" if name.endswith("be") else "little", max_size)
+    msg = f"Unknown framing {name!r}, choose one of {', '.join(FRAMINGS)}."
+    raise ValueError(msg)
@@ -0,0 +1,111 @@
+"""Arrival timestamps of received messages and latency histograms."""
+
+import time
+from bisect import bisect_left
+from collections.abc import Mapping, MutableMapping, Sequence
+from typing import Any
+
+Arrival = tuple[float, float]
+
+# 10 us to 100 s in 1-2-5 steps
+DEFAULT_BOUNDS = (*(factor * 10.0**exponent for exponent in range(-5, 2) for factor in (1, 2, 5)), 100.0)
+
+
+def arrival() -> Arrival:
+    """Return the current time.monotonic() and time.time(), taken by receivers when a message arrives."""
+    return time.monotonic(), time.time()
+
+
+def stamp(meta: MutableMapping[str, Any], arrived: Arrival) -> None:
+    """Add the arrival times to the metadata of a message, as "arrival" (monotonic) and "arrival_time" (wall clock)."""
+    meta["arrival"], meta["arrival_time"] = arrived
+
+
+class LatencyHistogram:
+    """Histogram of latencies in seconds, e.g. of the messages of a receiver with enabled timestamps.
+
+    Receivers with `timestamps` in their configuration take the arrival times of every message as early as
+    possible, before the message waits in any queue, and add them to the metadata: "arrival" is the
+    time.monotonic() and "arrival_time" the time.time() of the arrival.
+
+    Arguments:
+        bounds: Ascending upper bounds of the buckets in seconds. Defaults to 10 us up to 100 s in 1-2-5 steps.
+            Latencies above the last bound are counted in an overflow bucket.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> async for data, meta in receiver:
+        ...     await process(data)
+        ...     histogram.observe_since_arrival(meta)  # time spent queued and processing
+        ...     histogram.observe_end_to_end(data["epoch"])  # since the sender's timestamp, needs synchronized clocks
+        >>> histogram.summary()
+        {'count': 1000, 'mean': 0.0012, 'p50': 0.001, 'p90': 0.002, 'p99': 0.005, 'max': 0.0043}
+
+    """
+
+    def __init__(self, bounds: Sequence[float] | None = None) -> None:
+        self.bounds = tuple(bounds) if bounds is not None else DEFAULT_BOUNDS
+        if list(self.bounds) != sorted(self.bounds):
+            raise ValueError("Bucket bounds must be ascending.")
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count a latency."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def observe_since_arrival(self, meta: Mapping[str, Any], now: float | None = None) -> None:
+        """Count the time since the message arrived, i.e. spent in queues and processing, on the monotonic clock."""
+        self.observe((time.monotonic() if now is None else now) - meta["arrival"])
+
+    def observe_transit(self, meta: Mapping[str, Any], sent: float) -> None:
+        """Count the time from the sender's time.time() timestamp to the arrival, e.g. the network latency."""
+        self.observe(meta["arrival_time"] - sent)
+
+    def observe_end_to_end(self, sent: float, now: float | None = None) -> None:
+        """Count the time from the sender's time.time() timestamp until now."""
+        self.observe((time.time() if now is None else now) - sent)
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket that holds the q-quantile, or the maximum for the overflow bucket.
+
+        Returns 0.0 if nothing was observed.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}.")
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            total += count
+            if total >= rank and total:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Return count, mean, 50th, 90th and 99th percentile and maximum."""
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+    def reset(self) -> None:
+        """Reset all counts."""
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        """Return string representation of the histogram."""
+        return f"{self.__class__.__name__}(count={self.count}, p50={self.quantile(0.5)}, max={self.max})"
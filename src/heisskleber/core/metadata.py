@@ -0,0 +1,148 @@
+"""Compact metadata of received messages."""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+METADATA_FIELDS = ("topic", "source", "filepath", "timestamp", "sequence", "transport", "arrival", "arrival_time")
+
+
+class Metadata(MutableMapping[str, Any]):
+    """Metadata of a received message, with slots for the fields that receivers set on every message.
+
+    A dictionary allocates its hash table with the first key and grows it with further keys, for every message.
+    Metadata keeps the common fields in slots instead, which take a fixed 8 bytes each, and only allocates
+    a dictionary for other keys, e.g. metadata returned by an unpacker. It implements the mapping interface,
+    so code that reads `meta["topic"]` or `meta.get("topic")` works with either. Unset fields are missing keys.
+    Creating a Metadata object takes longer than filling a dictionary, it pays off when messages are kept,
+    e.g. in buffers and batches, and allocations dominate.
+
+    Receivers return Metadata instead of a dictionary if their configuration sets `slotted_metadata`,
+    see the MqttReceiver, ZmqReceiver and FileReader. The arrival times of receivers with enabled
+    `timestamps` are kept in the "arrival" and "arrival_time" slots, see LatencyHistogram.
+
+    Arguments:
+        extra: Metadata of the unpacker. Its keys are moved into the slots or kept, without copying the dictionary.
+        topic: The topic of the message, e.g. of MQTT or ZMQ.
+        source: The address of the sender.
+        filepath: The file the message was read from.
+        timestamp: The time of reception.
+        sequence: The number of the message, counted by the receiver from 1.
+        transport: The name of the transport, e.g. "mqtt".
+
+    Example:
+        >>> meta = Metadata({"records": 2}, topic="sensors/imu", sequence=1)
+        >>> meta["topic"], meta.get("timestamp"), meta == {"topic": "sensors/imu", "sequence": 1, "records": 2}
+        ('sensors/imu', None, True)
+
+    """
+
+    __slots__ = (*METADATA_FIELDS, "_extra")
+
+    topic: str
+    source: Any
+    filepath: str
+    timestamp: float
+    sequence: int
+    transport: str
+    arrival: float
+    arrival_time: float
+    _extra: dict[str, Any] | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        extra: Mapping[str, Any] | None = None,
+        *,
+        topic: str | None = None,
+        source: Any = None,
+        filepath: str | None = None,
+        timestamp: float | None = None,
+        sequence: int | None = None,
+        transport: str | None = None,
+    ) -> None:
+        # Unset slots are missing keys, so None is only stored if it is set explicitly as an item.
+        if topic is not None:
+            self.topic = topic
+        if source is not None:
+            self.source = source
+        if filepath is not None:
+            self.filepath = filepath
+        if timestamp is not None:
+            self.timestamp = timestamp
+        if sequence is not None:
+            self.sequence = sequence
+        if transport is not None:
+            self.transport = transport
+        self._extra = None
+        if extra:
+            if isinstance(extra, dict) and extra.keys().isdisjoint(METADATA_FIELDS):
+                self._extra = extra
+            else:
+                self.update(extra)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a field or other key."""
+        if key in METADATA_FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a field, or another key in the dictionary of other keys."""
+        if key in METADATA_FIELDS:
+            setattr(self, key, value)
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Unset a field or delete another key."""
+        if key in METADATA_FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the set fields, then the other keys."""
+        for name in METADATA_FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        """Return the number of set fields and other keys."""
+        count = sum(hasattr(self, name) for name in METADATA_FIELDS)
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether the field is set or the key exists."""
+        if key in METADATA_FIELDS:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def copy(self) -> dict[str, Any]:
+        """Return the metadata as dictionary, like dict.copy()."""
+        return dict(self)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the metadata as dictionary, e.g. to pass it to a process pool."""
+        return dict(self)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the metadata from a dictionary."""
+        self._extra = None
+        self.update(state)
+
+    def __repr__(self) -> str:
+        """Return string representation of the metadata."""
+        return f"{self.__class__.__name__}({dict(self)!r})"
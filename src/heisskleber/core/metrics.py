@@ -0,0 +1,177 @@
+"""Opt-in metrics of receivers and senders."""
+
+import asyncio
+import itertools
+import logging
+import time
+import weakref
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from .buffer import MessageBuffer
+
+logger = logging.getLogger("heisskleber.metrics")
+
+_ids = itertools.count(1)
+
+
+@dataclass(eq=False)
+class Metrics:
+    """Counters of a single receiver or sender.
+
+    Counters are updated by the instrumented packer or unpacker and by the transport itself.
+    Gauges are functions that are evaluated when a snapshot is taken, e.g. the current queue depth.
+
+    Attributes:
+        name: Name of the instrumented receiver or sender, its repr().
+        kind: "receiver" or "sender".
+        id: Number of the metrics, unique within the process. Tells apart components with the same name,
+            e.g. two MQTT receivers of one broker.
+        messages: Number of payloads that were unpacked or packed.
+        bytes: Total size of these payloads.
+        errors: Number of payloads that failed to unpack or pack.
+        codec_seconds: Total time spent in the unpacker or packer.
+        high_water_mark: Highest observed depth of the internal queue.
+        drops: Number of messages dropped by the overflow policy of the internal queue.
+        last_message: time.monotonic() of the last unpacked or packed payload.
+        gauges: Named functions that return current values, such as "queue_depth" or "reconnects".
+            A gauge replaces the counter of the same name in snapshots.
+
+    """
+
+    name: str
+    kind: str
+    id: int = field(default_factory=lambda: next(_ids))
+    messages: int = 0
+    bytes: int = 0
+    errors: int = 0
+    codec_seconds: float = 0.0
+    high_water_mark: int = 0
+    drops: int = 0
+    last_message: float | None = None
+    gauges: dict[str, Callable[[], float]] = field(default_factory=dict)
+
+    def observe_queue(self, depth: int) -> None:
+        """Update the high-water mark with the current queue depth."""
+        self.high_water_mark = max(self.high_water_mark, depth)
+
+    def watch_buffer(self, buffer: "MessageBuffer[Any]") -> None:
+        """Report the depth, high-water mark and drops of a message buffer."""
+        self.gauges["queue_depth"] = buffer.qsize
+        self.gauges["high_water_mark"] = lambda: buffer.high_water_mark
+        self.gauges["drops"] = lambda: buffer.dropped
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current counters and gauges as a dictionary."""
+        snapshot: dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "id": self.id,
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "codec_seconds": self.codec_seconds,
+            "high_water_mark": self.high_water_mark,
+            "drops": self.drops,
+            "last_message_age": time.monotonic() - self.last_message if self.last_message is not None else None,
+        }
+        for name, gauge in self.gauges.items():
+            snapshot[name] = gauge()
+        return snapshot
+
+
+class MetricsExporter(Protocol):
+    """Receives metric snapshots of all instrumented receivers and senders, see export_metrics()."""
+
+    def export(self, snapshots: list[dict[str, Any]]) -> None:
+        """Export the snapshots."""
+
+
+class LoggingExporter:
+    """Log every snapshot on the heisskleber.metrics logger."""
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        self.level = level
+
+    def export(self, snapshots: list[dict[str, Any]]) -> None:
+        """Log the snapshots."""
+        for snapshot in snapshots:
+            logger.log(self.level, "%(name)s: %(snapshot)s", {"name": snapshot["name"], "snapshot": snapshot})
+
+
+_instances: "weakref.WeakSet[Metrics]" = weakref.WeakSet()
+
+
+def collect_metrics() -> list[dict[str, Any]]:
+    """Return snapshots of the metrics of all live receivers and senders with enabled metrics."""
+    return sorted((metrics.snapshot() for metrics in list(_instances)), key=lambda s: (s["kind"], s["name"], s["id"]))
+
+
+async def export_metrics(exporter: MetricsExporter, interval: float = 10.0) -> None:
+    """Pass snapshots of all metrics to the exporter every `interval` seconds, until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        exporter.export(collect_metrics())
+
+
+class _InstrumentedCodec:
+    """Wraps a packer or unpacker, measuring calls, payload sizes and time spent.
+
+    Other attributes of the wrapped codec, such as emits_bytes or record_size, are passed through.
+    """
+
+    def __init__(self, codec: Callable[[Any], Any], metrics: Metrics, unpacks: bool) -> None:
+        self.codec = codec
+        self.metrics = metrics
+        self.unpacks = unpacks
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.codec, name)
+
+    def __call__(self, value: Any) -> Any:
+        metrics = self.metrics
+        start = time.perf_counter()
+        try:
+            result = self.codec(value)
+        except Exception:
+            metrics.errors += 1
+            raise
+        end = time.perf_counter()
+        metrics.codec_seconds += end - start
+        metrics.messages += 1
+        metrics.bytes += len(value if self.unpacks else result)
+        metrics.last_message = time.monotonic()
+        return result
+
+
+def instrument(component: Any, kind: str, codec_attributes: Iterable[str]) -> Metrics:
+    """Enable metrics on a receiver or sender, see Receiver.enable_metrics().
+
+    Wraps the first codec attribute the component has and registers the metrics for collect_metrics().
+    """
+    if component.metrics is not None:
+        return component.metrics  # type: ignore[no-any-return]
+    metrics = Metrics(name=repr(component), kind=kind)
+    for attribute in codec_attributes:
+        codec = component.__dict__.get(attribute)
+        if callable(codec):
+            setattr(component, attribute, _InstrumentedCodec(codec, metrics, unpacks=kind == "receiver"))
+            break
+    component.metrics = metrics
+    component._register_metrics(metrics)
+    _instances.add(metrics)
+    return metrics
+
+
+def uninstrument(component: Any, codec_attributes: Iterable[str]) -> None:
+    """Disable metrics on a receiver or sender and restore its original codec."""
+    if component.metrics is None:
+        return
+    for attribute in codec_attributes:
+        codec = component.__dict__.get(attribute)
+        if isinstance(codec, _InstrumentedCodec):
+            setattr(component, attribute, codec.codec)
+    _instances.discard(component.metrics)
+    component.metrics = None
@@ -0,0 +1,327 @@
+"""Run CPU-heavy unpackers and packers in a process or thread pool."""
+
+import asyncio
+import os
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+from .metrics import Metrics
+from .packer import Packer, Payload
+from .receiver import Receiver
+from .sender import Sender
+from .unpacker import Unpacker
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["process", "thread"]
+
+# The codec of a process pool worker, installed once per worker by _install_codec.
+_worker_codec: Any = None
+
+
+def _install_codec(codec: Any) -> None:
+    global _worker_codec
+    _worker_codec = codec
+
+
+def _unpack_batch(unpacker: Unpacker[Any] | None, payloads: list[bytes | str | bytearray]) -> tuple[list[Any], float]:
+    """Unpack payloads in order and measure the time spent.
+
+    Errors are returned in place of the result, to be raised by the receiver.
+    """
+    unpack = unpacker or _worker_codec
+    start = time.perf_counter()
+    results: list[Any] = []
+    for payload in payloads:
+        try:
+            results.append(unpack(payload))
+        except Exception as e:  # noqa: BLE001, PERF203
+            results.append(e)
+    return results, time.perf_counter() - start
+
+
+def _pack_batch(packer: Packer[Any] | None, items: list[Any]) -> tuple[list[Payload], float]:
+    pack = packer or _worker_codec
+    start = time.perf_counter()
+    payloads = [pack(data) for data in items]
+    seconds = time.perf_counter() - start
+    return [payload.tobytes() if isinstance(payload, memoryview) else payload for payload in payloads], seconds
+
+
+def _count(metrics: Metrics, sizes: list[int], seconds: float, errors: int = 0) -> None:
+    """Count the payloads that were unpacked or packed in the pool, like an instrumented codec would."""
+    metrics.errors += errors
+    metrics.codec_seconds += seconds
+    if sizes:
+        metrics.messages += len(sizes)
+        metrics.bytes += sum(sizes)
+        metrics.last_message = time.monotonic()
+
+
+class _Offload:
+    """Owns or borrows the executor of an offloading receiver or sender."""
+
+    def __init__(self, codec: Any, executor: Executor | ExecutorKind, workers: int | None) -> None:
+        if not isinstance(executor, Executor) and executor not in ("process", "thread"):
+            msg = f"Unknown executor {executor!r}, choose process, thread or pass an Executor."
+            raise ValueError(msg)
+        self.codec = codec
+        self.kind = executor
+        self.workers = workers or os.cpu_count() or 1
+        self.executor: Executor | None = executor if isinstance(executor, Executor) else None
+
+    def start(self) -> Executor:
+        if self.executor is None:
+            if self.kind == "process":
+                # Install the codec once per worker, instead of pickling it with every batch.
+                self.executor = ProcessPoolExecutor(self.workers, initializer=_install_codec, initargs=(self.codec,))
+            else:
+                self.executor = ThreadPoolExecutor(self.workers)
+        return self.executor
+
+    @property
+    def submitted_codec(self) -> Any:
+        """The codec passed along with every batch, None if the workers have it installed."""
+        return None if self.kind == "process" else self.codec
+
+    def stop(self) -> None:
+        if self.executor is not None and not isinstance(self.kind, Executor):
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def __repr__(self) -> str:
+        kind = type(self.kind).__name__ if isinstance(self.kind, Executor) else self.kind
+        return f"executor={kind}, workers={self.workers}"
+
+
+class OffloadReceiver(Receiver[T]):
+    """Unpack the payloads of another receiver in a process or thread pool, preserving their order.
+
+    The wrapped receiver has to pass its payloads through unchanged, i.e. use the RawUnpacker
+    (packstyle "raw"). Batches of payloads from its receive_many() are submitted to the pool while earlier
+    batches are still being unpacked, so several cores unpack at once while the event loop stays responsive.
+    The results are returned in order of arrival.
+
+    The metadata of the wrapped receiver, such as the topic, is merged into the metadata of the unpacker.
+    Unpacker errors are raised by the receive() call that would have returned the message.
+    With enabled metrics, the unpacked payloads and errors are counted as they return from the pool.
+
+    Arguments:
+        receiver: The receiver of the raw payloads.
+        unpacker: The unpacker to run in the pool. For a process pool, it has to be picklable.
+        executor: "process" or "thread" to create a pool of `workers` workers, or an existing Executor.
+        workers: Number of workers. Defaults to the number of CPUs.
+        batch_size: Maximum number of payloads per submission.
+        prefetch: Number of batches in flight. Defaults to twice the number of workers.
+
+    Example:
+        >>> raw = MqttReceiver(MqttConf(packstyle="raw"), topic="#")
+        >>> async with OffloadReceiver(raw, DecompressingUnpacker(), executor="process") as receiver:
+        ...     async for data, meta in receiver:
+        ...         print(meta["topic"], data)
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        receiver: Receiver[Payload],
+        unpacker: Unpacker[T],
+        executor: Executor | ExecutorKind = "process",
+        *,
+        workers: int | None = None,
+        batch_size: int = 100,
+        prefetch: int | None = None,
+    ) -> None:
+        self.receiver = receiver
+        self.unpacker = unpacker
+        self.batch_size = batch_size
+        self._offload = _Offload(unpacker, executor, workers)
+        self._pending: asyncio.Queue[tuple[asyncio.Future[Any], list[dict[str, Any]], list[int]]] = asyncio.Queue(
+            prefetch or 2 * self._offload.workers
+        )
+        self._ready: deque[tuple[Any, dict[str, Any]]] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self._ended = False
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Return the next unpacked message.
+
+        An error of the wrapped receiver is raised once the messages before it are returned. The next call
+        receives from the wrapped receiver again, except after StopAsyncIteration, which is raised by every call.
+
+        Raises:
+            UnpackerError: If the payload could not be unpacked.
+            StopAsyncIteration: If the wrapped receiver has ended.
+
+        """
+        if not self._ready:
+            await self._next_batch()
+        return self._pop()
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Return up to `max_items` unpacked messages, waiting only for the next unpacked batch.
+
+        Messages before an unpacker error are returned, the error is raised by the next call.
+        """
+        if not self._ready:
+            await self._next_batch()
+        messages: list[tuple[T, dict[str, Any]]] = []
+        while self._ready and len(messages) < max_items:
+            if messages and isinstance(self._ready[0][0], BaseException):
+                break
+            messages.append(self._pop())
+        return messages
+
+    def _pop(self) -> tuple[T, dict[str, Any]]:
+        result, meta = self._ready.popleft()
+        if isinstance(result, BaseException):
+            raise result
+        data, extra = result
+        extra.update(meta)
+        return data, extra
+
+    async def _next_batch(self) -> None:
+        if self._task is None:
+            await self.start()
+        elif self._task.done() and self._pending.empty():  # the error of the wrapped receiver was raised
+            if self._ended:
+                raise StopAsyncIteration
+            self._task = asyncio.create_task(self._submit())
+        future, metas, sizes = await self._pending.get()
+        results, seconds = await future
+        self._ready.extend(zip(results, metas, strict=True))
+        if self.metrics is not None:
+            unpacked = [size for result, size in zip(results, sizes, strict=True) if not isinstance(result, Exception)]
+            _count(self.metrics, unpacked, seconds, errors=len(results) - len(unpacked))
+
+    async def _submit(self) -> None:
+        """Receive batches of raw payloads and submit them to the pool, in order."""
+        loop = asyncio.get_running_loop()
+        executor = self._offload.start()
+        codec = self._offload.submitted_codec
+        while True:
+            try:
+                batch = await self.receiver.receive_many(self.batch_size)
+            except Exception as e:  # noqa: BLE001
+                # raised by receive() once the batches before the error are consumed
+                self._ended = isinstance(e, StopAsyncIteration)
+                failed: asyncio.Future[Any] = loop.create_future()
+                failed.set_exception(e)
+                await self._pending.put((failed, [], []))
+                return
+            payloads = [payload.tobytes() if isinstance(payload, memoryview) else payload for payload, _ in batch]
+            future = loop.run_in_executor(executor, _unpack_batch, codec, payloads)
+            await self._pending.put((future, [meta for _, meta in batch], [len(payload) for payload in payloads]))
+
+    async def start(self) -> None:
+        """Start the wrapped receiver and the submission of payloads to the pool."""
+        if self._task is not None:
+            return
+        await self.receiver.start()
+        self._task = asyncio.create_task(self._submit())
+
+    async def stop(self) -> None:
+        """Stop the submission, the wrapped receiver and an owned pool."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task and task.cancelled():
+                    raise
+            self._task = None
+        self._ended = False
+        await self.receiver.stop()
+        self._offload.stop()
+
+    def __repr__(self) -> str:
+        """Return string representation of the offloading receiver."""
+        return f"{self.__class__.__name__}({self.receiver!r}, {self._offload!r})"
+
+
+class OffloadSender(Sender[T]):
+    """Pack data in a process or thread pool and pass the payloads to another sender, preserving their order.
+
+    The wrapped sender has to send payloads unchanged, i.e. use the RawPacker (packstyle "raw").
+    send_many() splits its items into batches that are packed in parallel, so prefer it over send(),
+    which pays the round trip to the pool for every single message.
+    With enabled metrics, the packed payloads are counted as they return from the pool. A batch that fails
+    counts as one error.
+
+    Arguments:
+        sender: The sender of the packed payloads.
+        packer: The packer to run in the pool. For a process pool, it has to be picklable.
+        executor: "process" or "thread" to create a pool of `workers` workers, or an existing Executor.
+        workers: Number of workers. Defaults to the number of CPUs.
+        batch_size: Maximum number of items per submission.
+
+    """
+
+    def __init__(
+        self,
+        sender: Sender[Payload],
+        packer: Packer[T],
+        executor: Executor | ExecutorKind = "process",
+        *,
+        workers: int | None = None,
+        batch_size: int = 100,
+    ) -> None:
+        self.sender = sender
+        self.packer = packer
+        self.batch_size = batch_size
+        self._offload = _Offload(packer, executor, workers)
+
+    async def send(self, data: T, **kwargs: Any) -> None:
+        """Pack the data in the pool and send it with the wrapped sender.
+
+        Raises:
+            PackerError: The data could not be packed.
+
+        """
+        (payload,) = await self._pack([data])
+        await self.sender.send(payload, **kwargs)
+
+    async def send_many(self, items: Iterable[T], **kwargs: Any) -> None:
+        """Pack batches of items in parallel and send them in order with the wrapped sender.
+
+        Raises:
+            PackerError: Some data could not be packed. Nothing is sent in that case.
+
+        """
+        items = list(items)
+        batches = [items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        packed = await asyncio.gather(*(self._pack(batch) for batch in batches))
+        await self.sender.send_many([payload for payloads in packed for payload in payloads], **kwargs)
+
+    async def _pack(self, items: list[T]) -> list[Payload]:
+        executor = self._offload.start()
+        try:
+            payloads, seconds = await asyncio.get_running_loop().run_in_executor(
+                executor, _pack_batch, self._offload.submitted_codec, items
+            )
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.errors += 1
+            raise
+        if self.metrics is not None:
+            _count(self.metrics, [len(payload) for payload in payloads], seconds)
+        return payloads
+
+    async def start(self) -> None:
+        """Start the wrapped sender."""
+        await self.sender.start()
+
+    async def stop(self) -> None:
+        """Stop the wrapped sender and an owned pool."""
+        await self.sender.stop()
+        self._offload.stop()
+
+    def __repr__(self) -> str:
+        """Return string representation of the offloading sender."""
+        return f"{self.__class__.__name__}({self.sender!r}, {self._offload!r})"
@@ -1,12 +1,20 @@
 """Packer and unpacker for network data."""
 
 import json
+import struct
 from abc import abstractmethod
-from typing import Any, Protocol, TypeAlias, TypeVar
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, TypeVar
+
+from .schema import compile_schema, record_struct
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
 T_contra = TypeVar("T_contra", contravariant=True)
+T = TypeVar("T")
 
-Payload: TypeAlias = str | bytes | bytearray
+Payload: TypeAlias = str | bytes | bytearray | memoryview
 
 
 class PackerError(Exception):
@@ -24,9 +32,14 @@ class PackerError(Exception):
 
     def __init__(self, data: Any) -> None:
         """Initialize the error with the failed payload and cause."""
+        self.data = data
         message = "Failed to pack data."
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Rebuild the error from its data, e.g. when it is returned from a process pool."""
+        return self.__class__, (self.data,)
+
 
 class Packer(Protocol[T_contra]):
     """Packer Interface.
@@ -34,6 +47,9 @@ class Packer(Protocol[T_contra]):
     This class defines a protocol for packing data.
     It takes data and converts it into a bytes payload.
 
+    Packers that only ever return bytes-like payloads can declare this by setting
+    the class attribute `emits_bytes = True`.
+
     Attributes:
         None
 
@@ -55,6 +71,23 @@ class Packer(Protocol[T_contra]):
         """
 
 
+def as_buffer(payload: Payload, encoding: str = "utf-8") -> bytes | bytearray | memoryview:
+    """Return the payload as a bytes-like object.
+
+    String payloads are encoded, bytes-like payloads are returned as they are, without copying.
+    """
+    return payload.encode(encoding) if isinstance(payload, str) else payload
+
+
+def packs_bytes(packer: Packer[Any]) -> bool:
+    """Return whether the packer declares that it only emits bytes-like payloads.
+
+    Packers declare this with a truthy `emits_bytes` attribute, see JSONPacker.
+    Senders use it to skip converting between str and bytes, e.g. the FileWriter writes such payloads in binary mode.
+    """
+    return bool(getattr(packer, "emits_bytes", False))
+
+
 class JSONPacker(Packer[dict[str, Any]]):
     """Converts a dictionary into JSON-formatted bytes.
 
@@ -74,9 +107,244 @@ class JSONPacker(Packer[dict[str, Any]]):
 
     """
 
+    emits_bytes = True
+
     def __call__(self, data: dict[str, Any]) -> bytes:
         """Pack the data."""
         try:
             return json.dumps(data).encode()
         except (UnicodeEncodeError, TypeError) as err:
             raise PackerError(data) from err
+
+
+class RawPacker(Packer[Payload]):
+    """Passes already packed payloads through unchanged, e.g. payloads packed in a process pool, see OffloadSender.
+
+    Example:
+        >>> packer = RawPacker()
+        >>> result = packer(b"raw")
+        b'raw'
+
+    """
+
+    def __call__(self, data: Payload) -> Payload:
+        """Return the data."""
+        return data
+
+
+class OrjsonPacker(Packer[dict[str, Any]]):
+    """Converts a dictionary into JSON-formatted bytes using `orjson`_.
+
+    orjson serializes directly to bytes and is several times faster than the standard library.
+    The output is compact, i.e. without whitespace between separators.
+
+    Raises:
+        ImportError: If orjson is not installed.
+
+    Example:
+        >>> packer = OrjsonPacker()
+        >>> packer({"key": "value"})
+        b'{"key":"value"}'
+
+    .. _orjson: https://github.com/ijl/orjson
+
+    """
+
+    emits_bytes = True
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._error = orjson.JSONEncodeError
+
+    def __call__(self, data: dict[str, Any]) -> bytes:
+        """Pack the data."""
+        try:
+            return self._dumps(data)
+        except self._error as err:
+            raise PackerError(data) from err
+
+
+class MsgspecJSONPacker(Packer[dict[str, Any]]):
+    """Converts a dictionary into JSON-formatted bytes using `msgspec`_.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+
+    Example:
+        >>> packer = MsgspecJSONPacker()
+        >>> packer({"key": "value"})
+        b'{"key":"value"}'
+
+    .. _msgspec: https://jcristharif.com/msgspec/
+
+    """
+
+    emits_bytes = True
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encode: Callable[[Any], bytes] = msgspec.json.Encoder().encode
+        self._error: type[Exception] = msgspec.EncodeError
+
+    def __call__(self, data: dict[str, Any]) -> bytes:
+        """Pack the data."""
+        try:
+            return self._encode(data)
+        except (self._error, TypeError, UnicodeEncodeError) as err:
+            raise PackerError(data) from err
+
+
+def fast_json_packer() -> Packer[dict[str, Any]]:
+    """Return the fastest available JSON packer.
+
+    Tries orjson and msgspec, in this order, and falls back to the standard library JSONPacker.
+    """
+    for packer in (OrjsonPacker, MsgspecJSONPacker):
+        try:
+            return packer()
+        except ImportError:  # noqa: PERF203
+            continue
+    return JSONPacker()
+
+
+class DataclassPacker(Packer[T]):
+    """Serializes instances of a dataclass or TypedDict.
+
+    Instances are converted into a dictionary by an encoder that is compiled once per type and cached,
+    which is considerably faster than `dataclasses.asdict`. The dictionary is then serialized by the inner packer.
+
+    Arguments:
+        cls: The dataclass or TypedDict to serialize.
+        packer: The packer that serializes the dictionary. Defaults to JSONPacker.
+
+    Raises:
+        TypeError: If cls is neither a dataclass nor a TypedDict.
+
+    Example:
+        >>> packer = DataclassPacker(Reading)
+        >>> packer(Reading(sensor="t1", value=21.0))
+        b'{"sensor": "t1", "value": 21.0}'
+
+    """
+
+    def __init__(self, cls: type[T], packer: Packer[dict[str, Any]] | None = None) -> None:
+        self.cls = cls
+        self.packer = packer or JSONPacker()
+        self.emits_bytes = packs_bytes(self.packer)
+        self._encode = compile_schema(cls).encode
+
+    def __call__(self, data: T) -> Payload:
+        """Pack the data."""
+        try:
+            encoded = self._encode(data)
+        except AttributeError as err:
+            raise PackerError(data) from err
+        return self.packer(encoded)
+
+
+class MsgpackPacker(Packer[dict[str, Any]]):
+    """Converts a dictionary into `MessagePack`_ bytes.
+
+    MessagePack is a binary format: floats are stored in 9 bytes instead of their decimal representation,
+    which makes the payload smaller and faster to create than JSON.
+
+    Raises:
+        ImportError: If msgpack is not installed.
+
+    Example:
+        >>> packer = MsgpackPacker()
+        >>> len(packer({"key": "value"}))
+        11
+
+    .. _MessagePack: https://msgpack.org
+
+    """
+
+    emits_bytes = True
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._packb: Callable[..., bytes] = msgpack.packb
+
+    def __call__(self, data: dict[str, Any]) -> bytes:
+        """Pack the data."""
+        try:
+            return self._packb(data, use_bin_type=True)
+        except (TypeError, ValueError, OverflowError) as err:
+            raise PackerError(data) from err
+
+
+class CborPacker(Packer[dict[str, Any]]):
+    """Converts a dictionary into `CBOR`_ bytes.
+
+    Raises:
+        ImportError: If cbor2 is not installed.
+
+    Example:
+        >>> packer = CborPacker()
+        >>> len(packer({"key": "value"}))
+        11
+
+    .. _CBOR: https://cbor.io
+
+    """
+
+    emits_bytes = True
+
+    def __init__(self) -> None:
+        import cbor2
+
+        self._dumps: Callable[[Any], bytes] = cbor2.dumps
+        self._error: type[Exception] = cbor2.CBOREncodeError
+
+    def __call__(self, data: dict[str, Any]) -> bytes:
+        """Pack the data."""
+        try:
+            return self._dumps(data)
+        except (self._error, TypeError) as err:
+            raise PackerError(data) from err
+
+
+class StructPacker(Packer[Any]):
+    """Converts dictionaries or dataclasses into fixed-length binary records.
+
+    The record layout is given as a sequence of (name, format) pairs, with format characters of
+    the `struct`_ module, see StructUnpacker. Mappings are read by key, any other object by attribute.
+
+    Arguments:
+        fields: Names and struct format characters of the record fields, e.g. [("epoch", "d"), ("x", "f")].
+        byte_order: One of "<" (little-endian, default), ">" or "!" (big-endian) and "=" (native).
+
+    Raises:
+        ValueError: If the byte order is not supported or a field does not hold exactly one value.
+        struct.error: If a format character is invalid.
+
+    Example:
+        >>> packer = StructPacker([("epoch", "d"), ("counter", "I")])
+        >>> packer({"epoch": 1.5, "counter": 7}) == struct.pack("<dI", 1.5, 7)
+        True
+
+    .. _struct: https://docs.python.org/3/library/struct.html#format-characters
+
+    """
+
+    emits_bytes = True
+
+    def __init__(self, fields: "Sequence[tuple[str, str]]", byte_order: str = "<") -> None:
+        self.fields = list(fields)
+        self.names = tuple(name for name, _ in self.fields)
+        self._struct = record_struct(self.fields, byte_order)
+        self.record_size = self._struct.size
+
+    def __call__(self, data: Any) -> bytes:
+        """Pack a single record."""
+        try:
+            if isinstance(data, Mapping):
+                return self._struct.pack(*[data[name] for name in self.names])
+            return self._struct.pack(*[getattr(data, name) for name in self.names])
+        except (struct.error, KeyError, AttributeError) as err:
+            raise PackerError(data) from err
@@ -0,0 +1,306 @@
+"""Pipeline engine that forwards data from receivers to senders."""
+
+import asyncio
+import contextlib
+import inspect
+import itertools
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from .receiver import Receiver
+from .sender import Sender
+from .unpacker import UnpackerError
+from .utils import drain_queue
+
+logger = logging.getLogger("heisskleber.pipeline")
+
+Item = tuple[Any, dict[str, Any]]
+Transform = Callable[[Any, dict[str, Any]], Item | Awaitable[Item | None] | None]
+
+
+def topic_kwargs(meta: dict[str, Any]) -> dict[str, Any]:
+    """Forward the topic of the received metadata to the senders, if there is one."""
+    return {"topic": meta["topic"]} if "topic" in meta else {}
+
+
+@dataclass
+class Stage:
+    """A transform stage between the receivers and the senders of a pipeline.
+
+    Attributes:
+        func: Called with (data, metadata) of every message, sync or async.
+            Returns the transformed (data, metadata) tuple, or None to drop the message.
+        concurrency: Number of workers running the transform. With more than one worker,
+            messages may leave the stage out of order.
+        name: Name of the stage in the statistics, defaults to the name of func.
+
+    """
+
+    func: Transform
+    concurrency: int = 1
+    name: str = ""
+
+
+@dataclass
+class StageStats:
+    """Statistics of a single pipeline stage.
+
+    Attributes:
+        name: Name of the stage, e.g. "source[0]:MqttReceiver(...)", "stage[1]:double" or "sink[0]:ZmqSender(...)".
+            The index is the position among the receivers, stages or senders of the pipeline.
+        processed: Number of messages that passed the stage.
+        dropped: Number of messages that were dropped, either filtered by a transform or because a sink queue was full.
+        errors: Number of messages that raised an error in the stage.
+        queue_depth: Number of messages waiting in the input queue of the stage.
+        max_queue_depth: Highest observed queue depth.
+        throughput: Processed messages per second since the pipeline was started.
+
+    """
+
+    name: str
+    processed: int = 0
+    dropped: int = 0
+    errors: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    throughput: float = 0.0
+
+
+class Pipeline:
+    """Forward data from one or more receivers through optional transform stages to one or more senders.
+
+    Stages are connected by bounded queues, so a slow stage applies backpressure on the receivers.
+    Every sender has its own queue and worker: if a sender falls behind, messages are dropped for that
+    sender only (or the pipeline blocks, if `block_on_full` is set), while the other senders continue.
+    Sender workers forward everything that is queued with a single send_many() call.
+
+    Arguments:
+        receivers: A receiver or a sequence of receivers to read from.
+        senders: A sender or a sequence of senders to forward to.
+        stages: Transform stages, applied in order. Plain callables are wrapped into a Stage.
+        queue_size: Maximum size of every inter-stage and sender queue.
+        batch_size: Maximum number of messages a sender worker hands to send_many() at once.
+        block_on_full: Wait for a full sender queue instead of dropping the message for that sender.
+        send_kwargs: Creates the keyword arguments of send_many() from the message metadata.
+            Defaults to forwarding the topic.
+        report_interval: If set, log the stage statistics every `report_interval` seconds.
+
+    Example:
+        >>> async def main():
+        ...     pipeline = Pipeline(
+        ...         MqttReceiver(MqttConf(), topic="#"),
+        ...         [ZmqSender(ZmqConf()), FileWriter(FileConf())],
+        ...         stages=[lambda data, meta: (data, meta) if data["value"] > 0 else None],
+        ...     )
+        ...     await pipeline.run()
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        receivers: Receiver[Any] | Sequence[Receiver[Any]],
+        senders: Sender[Any] | Sequence[Sender[Any]],
+        stages: Sequence[Stage | Transform] = (),
+        *,
+        queue_size: int = 1000,
+        batch_size: int = 100,
+        block_on_full: bool = False,
+        send_kwargs: Callable[[dict[str, Any]], dict[str, Any]] = topic_kwargs,
+        report_interval: float | None = None,
+    ) -> None:
+        self.receivers = [receivers] if isinstance(receivers, Receiver) else list(receivers)
+        self.senders = [senders] if isinstance(senders, Sender) else list(senders)
+        self.stages = [stage if isinstance(stage, Stage) else Stage(stage) for stage in stages]
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.block_on_full = block_on_full
+        self.send_kwargs = send_kwargs
+        self.report_interval = report_interval
+
+        self._stage_queues: list[asyncio.Queue[Item]] = []
+        self._sender_queues: list[asyncio.Queue[Item]] = []
+        self._stats: list[tuple[StageStats, asyncio.Queue[Item] | None]] = []
+        self._started_at: float | None = None
+
+    async def run(self) -> None:
+        """Start all receivers and senders and forward data until all receivers are exhausted.
+
+        Messages that are already in flight are delivered before the pipeline returns.
+        Cancelling run() stops the pipeline immediately.
+        """
+        loop = asyncio.get_running_loop()
+        self._stage_queues = [asyncio.Queue(self.queue_size) for _ in range(len(self.stages) + 1)]
+        self._sender_queues = [asyncio.Queue(self.queue_size) for _ in self.senders]
+        self._stats = []
+
+        async with contextlib.AsyncExitStack() as stack:
+            for receiver in self.receivers:
+                await stack.enter_async_context(receiver)
+            for sender in self.senders:
+                await stack.enter_async_context(sender)
+            self._started_at = loop.time()
+
+            source_tasks = [
+                asyncio.create_task(self._source(receiver, self._stats_for(f"source[{index}]:{receiver!r}")))
+                for index, receiver in enumerate(self.receivers)
+            ]
+            layers: list[tuple[list[asyncio.Queue[Item]], list[asyncio.Task[None]]]] = []
+            for index, stage in enumerate(self.stages):
+                queue_in, queue_out = self._stage_queues[index], self._stage_queues[index + 1]
+                stats = self._stats_for(
+                    f"stage[{index}]:{stage.name or getattr(stage.func, '__name__', index)}", queue_in
+                )
+                workers = [
+                    asyncio.create_task(self._transform(stage, queue_in, queue_out, stats))
+                    for _ in range(stage.concurrency)
+                ]
+                layers.append(([queue_in], workers))
+            dispatch_stats = self._stats_for("dispatch", self._stage_queues[-1])
+            sender_stats = [
+                self._stats_for(f"sink[{index}]:{sender!r}", queue)
+                for index, (sender, queue) in enumerate(zip(self.senders, self._sender_queues, strict=True))
+            ]
+            layers.append(
+                ([self._stage_queues[-1]], [asyncio.create_task(self._dispatch(dispatch_stats, sender_stats))])
+            )
+            layers.append(
+                (
+                    self._sender_queues,
+                    [
+                        asyncio.create_task(self._sink(sender, queue, stats))
+                        for sender, queue, stats in zip(self.senders, self._sender_queues, sender_stats, strict=True)
+                    ],
+                )
+            )
+            reporter = asyncio.create_task(self._report()) if self.report_interval else None
+
+            all_tasks = [*source_tasks, *itertools.chain.from_iterable(tasks for _, tasks in layers)]
+            if reporter:
+                all_tasks.append(reporter)
+            try:
+                await asyncio.gather(*source_tasks)
+                for queues, tasks in layers:
+                    for queue in queues:
+                        await queue.join()
+                    for task in tasks:
+                        task.cancel()
+            finally:
+                for task in all_tasks:
+                    task.cancel()
+                await asyncio.gather(*all_tasks, return_exceptions=True)
+
+    def stats(self) -> list[StageStats]:
+        """Return a snapshot of the statistics of every stage, in pipeline order."""
+        elapsed = (asyncio.get_running_loop().time() - self._started_at) if self._started_at is not None else 0.0
+        snapshot = []
+        for stats, queue in self._stats:
+            snapshot.append(
+                replace(
+                    stats,
+                    queue_depth=queue.qsize() if queue is not None else 0,
+                    throughput=stats.processed / elapsed if elapsed > 0 else 0.0,
+                )
+            )
+        return snapshot
+
+    def _stats_for(self, name: str, queue: asyncio.Queue[Item] | None = None) -> StageStats:
+        stats = StageStats(name)
+        self._stats.append((stats, queue))
+        return stats
+
+    async def _source(self, receiver: Receiver[Any], stats: StageStats) -> None:
+        queue = self._stage_queues[0]
+        iterator = aiter(receiver)
+        while True:
+            try:
+                item = await anext(iterator)
+            except StopAsyncIteration:
+                return
+            except UnpackerError:
+                logger.exception("%(receiver)s: failed to unpack message", {"receiver": receiver})
+                stats.errors += 1
+                continue
+            await queue.put(item)
+            stats.processed += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, queue.qsize())
+
+    async def _transform(
+        self, stage: Stage, queue_in: asyncio.Queue[Item], queue_out: asyncio.Queue[Item], stats: StageStats
+    ) -> None:
+        while True:
+            data, meta = await queue_in.get()
+            try:
+                result = stage.func(data, meta)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception:
+                logger.exception("Pipeline stage %(stage)s failed", {"stage": stats.name})
+                stats.errors += 1
+            else:
+                if result is None:
+                    stats.dropped += 1
+                else:
+                    await queue_out.put(result)
+                    stats.processed += 1
+                    stats.max_queue_depth = max(stats.max_queue_depth, queue_out.qsize())
+            finally:
+                queue_in.task_done()
+
+    async def _dispatch(self, stats: StageStats, sender_stats: list[StageStats]) -> None:
+        queue_in = self._stage_queues[-1]
+        while True:
+            data, meta = await queue_in.get()
+            item = (data, self.send_kwargs(meta))
+            for queue, sink_stats in zip(self._sender_queues, sender_stats, strict=True):
+                if self.block_on_full:
+                    await queue.put(item)
+                elif queue.full():
+                    sink_stats.dropped += 1
+                    continue
+                else:
+                    queue.put_nowait(item)
+                sink_stats.max_queue_depth = max(sink_stats.max_queue_depth, queue.qsize())
+            stats.processed += 1
+            queue_in.task_done()
+
+    async def _sink(self, sender: Sender[Any], queue: asyncio.Queue[Item], stats: StageStats) -> None:
+        while True:
+            batch = await drain_queue(queue, self.batch_size)
+            try:
+                # consecutive messages with equal send arguments are sent as one batch
+                for kwargs, group in itertools.groupby(batch, key=lambda item: item[1]):
+                    items = [data for data, _ in group]
+                    try:
+                        await sender.send_many(items, **kwargs)
+                    except Exception:
+                        logger.exception("%(sender)s: failed to send batch", {"sender": sender})
+                        stats.errors += len(items)
+                    else:
+                        stats.processed += len(items)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)  # type: ignore[arg-type]
+            for stats in self.stats():
+                logger.info(
+                    "%(name)s: %(throughput).1f msg/s, queue %(depth)d (max %(max)d), dropped %(dropped)d, errors %(errors)d",
+                    {
+                        "name": stats.name,
+                        "throughput": stats.throughput,
+                        "depth": stats.queue_depth,
+                        "max": stats.max_queue_depth,
+                        "dropped": stats.dropped,
+                        "errors": stats.errors,
+                    },
+                )
+
+    def __repr__(self) -> str:
+        """Return string representation of the pipeline."""
+        return (
+            f"{self.__class__.__name__}(receivers={self.receivers}, stages={len(self.stages)}, senders={self.senders})"
+        )
@@ -0,0 +1,129 @@
+"""Serve the metrics of all receivers and senders in the Prometheus text format."""
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import Any
+
+from .metrics import collect_metrics
+
+logger = logging.getLogger("heisskleber.metrics")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# snapshot key: (metric name, type, help)
+_METRICS = {
+    "messages": ("heisskleber_messages_total", "counter", "Messages unpacked or packed."),
+    "bytes": ("heisskleber_bytes_total", "counter", "Bytes of unpacked or packed payloads."),
+    "errors": ("heisskleber_errors_total", "counter", "Payloads that failed to unpack or pack."),
+    "codec_seconds": ("heisskleber_codec_seconds_total", "counter", "Seconds spent in the unpacker or packer."),
+    "drops": ("heisskleber_drops_total", "counter", "Messages dropped because the queue was full."),
+    "reconnects": ("heisskleber_reconnects_total", "counter", "Reconnects after the connection was lost."),
+    "queue_depth": ("heisskleber_queue_depth", "gauge", "Messages in the internal queue."),
+    "high_water_mark": ("heisskleber_queue_high_water_mark", "gauge", "Highest observed depth of the internal queue."),
+    "last_message_age": ("heisskleber_last_message_age_seconds", "gauge", "Seconds since the last message."),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(snapshots: list[dict[str, Any]]) -> str:
+    """Render metric snapshots, as returned by collect_metrics(), in the Prometheus text exposition format.
+
+    Samples are labelled with the name, kind and id of the metrics. The id keeps the series of components
+    with the same name apart. Values that are None, e.g. the age of the last message before any message was
+    seen, are omitted.
+    """
+    samples: dict[str, list[str]] = {key: [] for key in _METRICS}
+    for snapshot in snapshots:
+        labels = f'name="{_escape(snapshot["name"])}",kind="{_escape(snapshot["kind"])}"'
+        if "id" in snapshot:
+            labels += f',id="{snapshot["id"]}"'
+        for key, value in snapshot.items():
+            if key in samples and value is not None:
+                samples[key].append(f"{_METRICS[key][0]}{{{labels}}} {value}")
+
+    lines: list[str] = []
+    for key, (name, kind, description) in _METRICS.items():
+        if samples[key]:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples[key])
+    return "\n".join(lines) + "\n"
+
+
+class PrometheusExporter:
+    """Minimal asyncio HTTP server that serves collect_metrics() on GET /metrics.
+
+    Only the standard library is used, so it can run on gateways where no metrics agent can be installed.
+    Metrics have to be enabled on every receiver and sender that should be reported, see Receiver.enable_metrics().
+
+    Arguments:
+        host: Address to listen on. Defaults to localhost only.
+        port: Port to listen on, 0 picks a free port.
+
+    Example:
+        >>> async with PrometheusExporter(port=9464):
+        ...     await pipeline.run()
+
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9464) -> None:
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start serving. If port is 0, the port attribute is set to the actual port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("%(self)s serving metrics", {"self": self})
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5.0)
+            method, path, *_ = request.split(b"\r\n", 1)[0].decode("latin-1").split(" ")
+            if method != "GET":
+                status, body = "405 Method Not Allowed", b""
+            elif path.split("?", 1)[0] not in ("/metrics", "/"):
+                status, body = "404 Not Found", b""
+            else:
+                status, body = "200 OK", render_prometheus(collect_metrics()).encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError, ValueError, ConnectionError):
+            logger.debug("%(self)s invalid request", {"self": self})
+        finally:
+            writer.close()
+
+    async def __aenter__(self) -> "PrometheusExporter":  # noqa: PYI034
+        """Start serving."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving."""
+        await self.stop()
+
+    def __repr__(self) -> str:
+        """Return string representation of the exporter."""
+        return f"{self.__class__.__name__}(host={self.host}, port={self.port})"
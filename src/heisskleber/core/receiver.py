@@ -1,11 +1,15 @@
 """Asynchronous data source interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import Any, Generic
 
+from .metrics import Metrics, instrument, uninstrument
 from .unpacker import T_co, Unpacker
 
+_CODEC_ATTRIBUTES = ("unpacker", "unpack")
+
 
 class Receiver(ABC, Generic[T_co]):
     """Abstract interface for asynchronous data sources.
@@ -19,6 +23,7 @@ class Receiver(ABC, Generic[T_co]):
 
     Attributes:
         unpacker: Component responsible for deserializing incoming data into type T_co.
+        metrics: Counters of the receiver, None unless enabled with enable_metrics().
 
     Example:
         >>> async with CustomSource(unpacker) as source:
@@ -28,6 +33,8 @@ class Receiver(ABC, Generic[T_co]):
     """
 
     unpacker: Unpacker[T_co]
+    metrics: Metrics | None = None
+    _pending_receive: "asyncio.Task[Any] | None" = None
 
     @abstractmethod
     async def receive(self, **kwargs: Any) -> tuple[T_co, dict[str, Any]]:
@@ -43,6 +50,84 @@ class Receiver(ABC, Generic[T_co]):
 
         """
 
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T_co, dict[str, Any]]]:
+        """Receive a batch of messages from the implemented input stream.
+
+        Waits for the first message, then keeps collecting messages until either `max_items` messages
+        have been received or `timeout` seconds have passed since the first message arrived.
+
+        This default implementation calls receive() repeatedly. Implementations with an internal
+        buffer override it to drain the buffer in a single pass. A receive() that is still running
+        when the timeout passes is not cancelled, as it may already have read data, e.g. from a serial port.
+        Its message is returned first by the next receive_many() call or iteration step.
+
+        Arguments:
+            max_items: The maximum number of messages to return.
+            timeout: Seconds to wait for further messages after the first one.
+                Defaults to 0, i.e. no further waiting: buffered implementations return what is already
+                available, this default implementation returns a single message.
+            **kwargs: Passed on to receive().
+
+        Returns:
+            list[tuple[T_co, dict[str, Any]]]: A non-empty list of (data, metadata) tuples, in order of arrival.
+
+        """
+        batch = [await self._receive_pending(**kwargs)]
+        if timeout <= 0:
+            return batch
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(batch) < max_items:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            self._pending_receive = receiving = asyncio.ensure_future(self.receive(**kwargs))
+            await asyncio.wait({receiving}, timeout=remaining)
+            if not receiving.done() or receiving.exception() is not None:
+                break  # returned or raised by the next call
+            self._pending_receive = None
+            batch.append(receiving.result())
+        return batch
+
+    async def _receive_pending(self, **kwargs: Any) -> tuple[T_co, dict[str, Any]]:
+        """Return the message of a receive() left running by receive_many(), or receive the next message."""
+        receiving = self._pending_receive
+        if receiving is None:
+            return await self.receive(**kwargs)
+        try:
+            item: tuple[T_co, dict[str, Any]] = await asyncio.shield(receiving)
+        except asyncio.CancelledError:
+            if receiving.cancelled():
+                self._pending_receive = None
+            raise  # otherwise the pending receive keeps running for the next call
+        except BaseException:
+            self._pending_receive = None
+            raise
+        self._pending_receive = None
+        return item
+
+    def enable_metrics(self) -> Metrics:
+        """Start counting messages, bytes, unpack time, queue depth, drops and reconnects of this receiver.
+
+        Metrics are disabled by default and cost nothing until enabled. Once enabled, they are
+        available through the returned object, `receiver.metrics.snapshot()` and collect_metrics().
+
+        Returns:
+            Metrics: The metrics of this receiver.
+
+        """
+        return instrument(self, "receiver", _CODEC_ATTRIBUTES)
+
+    def disable_metrics(self) -> None:
+        """Stop counting and restore the original unpacker."""
+        uninstrument(self, _CODEC_ATTRIBUTES)
+
+    def _register_metrics(self, metrics: Metrics) -> None:
+        """Add transport specific gauges, such as the depth of an internal queue, to the metrics."""
+
     @abstractmethod
     async def start(self) -> None:
         """Initialize and start any background processes and tasks of the source."""
@@ -79,7 +164,7 @@ class Receiver(ABC, Generic[T_co]):
             StopAsyncIteration: When the receiver has no more data.
             Any other exceptions that might occur during receive().
         """
-        data, meta = await self.receive()
+        data, meta = await self._receive_pending()
         return data, meta
 
     async def __aenter__(self) -> "Receiver[T_co]":
@@ -109,4 +194,7 @@ class Receiver(ABC, Generic[T_co]):
             traceback: The traceback of the exception that was raised, if any.
 
         """
+        if self._pending_receive is not None:
+            self._pending_receive.cancel()
+            self._pending_receive = None
         await self.stop()
@@ -0,0 +1,215 @@
+"""Retry policy with exponential backoff, jitter and a circuit breaker."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, NoReturn, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+logger = logging.getLogger("heisskleber.retry")
+
+
+class CircuitState(Enum):
+    """State of the circuit breaker of a retry policy."""
+
+    CLOSED = "closed"  # attempts are retried with exponential backoff
+    OPEN = "open"  # too many consecutive failures, wait reset_timeout before the next attempt
+    HALF_OPEN = "half_open"  # a single trial attempt after reset_timeout, closes the circuit on success
+
+
+@dataclass
+class RetryStats:
+    """Counters of a retry policy.
+
+    Attributes:
+        attempts: Number of attempts started by run().
+        successes: Number of successful attempts.
+        failures: Number of failed attempts.
+        retries: Number of failures that were followed by a retry.
+        giveups: Number of times the policy gave up and raised the error.
+        consecutive_failures: Number of failures since the last success.
+        circuit_opened: Number of times the circuit breaker opened.
+        last_error: The error of the last failed attempt.
+
+    """
+
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    giveups: int = 0
+    consecutive_failures: int = 0
+    circuit_opened: int = 0
+    last_error: BaseException | None = None
+
+
+class RetryPolicy:
+    """Decide if and when a failed operation is retried.
+
+    The delay before retry n is `initial_delay * multiplier ** (n - 1)`, capped at `max_delay`.
+    With full jitter, the actual delay is drawn uniformly between 0 and that value, so that many
+    clients that lost the same server do not reconnect in lockstep.
+
+    After `failure_threshold` consecutive failures the circuit breaker opens: the next attempt is
+    delayed by `reset_timeout`, and is a single trial (half-open). A success closes the circuit again.
+
+    A policy keeps state, so every component needs its own instance.
+
+    Arguments:
+        initial_delay: Delay in seconds before the first retry.
+        max_delay: Upper limit of the delay in seconds.
+        multiplier: Growth factor of the delay per consecutive failure.
+        jitter: Draw the delay uniformly between 0 and the backoff delay ("full jitter").
+        max_attempts: Give up after this many consecutive failed attempts. None retries forever.
+        deadline: Give up if the operation has not succeeded within this many seconds since the first failure.
+        catch: Exception types that are retried, all others are raised immediately.
+        failure_threshold: Consecutive failures that open the circuit breaker. None disables the circuit breaker.
+        reset_timeout: Seconds the circuit stays open before a trial attempt.
+        name: Name of the retried operation in log messages.
+        on_retry: Called with (attempt, delay, error) before waiting for a retry.
+        on_giveup: Called with (attempts, error) before the error is raised.
+        on_state_change: Called with (old state, new state) when the circuit breaker changes state.
+
+    Example:
+        >>> policy = RetryPolicy(initial_delay=0.5, max_delay=30, max_attempts=10, catch=ConnectionError)
+        >>> reader, writer = await policy.run(asyncio.open_connection, "localhost", 6000)
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        max_attempts: int | None = None,
+        deadline: float | None = None,
+        catch: type[BaseException] | tuple[type[BaseException], ...] = Exception,
+        failure_threshold: int | None = None,
+        reset_timeout: float = 30.0,
+        name: str = "operation",
+        on_retry: Callable[[int, float, BaseException], None] | None = None,
+        on_giveup: Callable[[int, BaseException], None] | None = None,
+        on_state_change: Callable[[CircuitState, CircuitState], None] | None = None,
+    ) -> None:
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.catch = catch
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self.on_retry = on_retry
+        self.on_giveup = on_giveup
+        self.on_state_change = on_state_change
+
+        self.stats = RetryStats()
+        self.state = CircuitState.CLOSED
+        self._first_failure: float | None = None
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retrying after the given number of consecutive failures."""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** max(attempt - 1, 0))
+        return random.uniform(0, delay) if self.jitter else delay  # noqa: S311
+
+    def success(self) -> None:
+        """Record a successful attempt, which resets the backoff and closes the circuit."""
+        self.stats.successes += 1
+        self.stats.consecutive_failures = 0
+        self._first_failure = None
+        self._set_state(CircuitState.CLOSED)
+
+    def failure(self, error: BaseException) -> float:
+        """Record a failed attempt and return the delay in seconds before the next attempt.
+
+        Raises:
+            error: If the policy gives up, i.e. max_attempts or the deadline is exceeded.
+
+        """
+        now = time.monotonic()
+        stats = self.stats
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        stats.last_error = error
+        if self._first_failure is None:
+            self._first_failure = now
+        attempt = stats.consecutive_failures
+
+        if self.max_attempts is not None and attempt >= self.max_attempts:
+            self._give_up(error)
+
+        delay = self.backoff(attempt)
+        if self.state is CircuitState.HALF_OPEN or (
+            self.failure_threshold is not None and attempt >= self.failure_threshold
+        ):
+            if self.state is not CircuitState.OPEN:
+                stats.circuit_opened += 1
+            self._set_state(CircuitState.OPEN)
+            delay = max(delay, self.reset_timeout)
+
+        if self.deadline is not None and now - self._first_failure + delay > self.deadline:
+            self._give_up(error)
+
+        stats.retries += 1
+        if self.on_retry is not None:
+            self.on_retry(attempt, delay, error)
+        return delay
+
+    async def run(self, func: Callable[P, Coroutine[Any, Any, T]], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Await func(*args, **kwargs) until it succeeds or the policy gives up.
+
+        Errors that are not instances of `catch`, including cancellation, are raised immediately.
+
+        Raises:
+            The last error of func, if the policy gives up.
+
+        """
+        while True:
+            if self.state is CircuitState.OPEN:
+                self._set_state(CircuitState.HALF_OPEN)
+            self.stats.attempts += 1
+            try:
+                result = await func(*args, **kwargs)
+            except self.catch as e:
+                delay = self.failure(e)
+                logger.warning(
+                    "%(name)s failed: %(err)s. Retrying in %(seconds).2f seconds",
+                    {"name": self.name, "err": e, "seconds": delay},
+                )
+                await asyncio.sleep(delay)
+            else:
+                self.success()
+                return result
+
+    def _give_up(self, error: BaseException) -> NoReturn:
+        self.stats.giveups += 1
+        attempts = self.stats.consecutive_failures
+        self.stats.consecutive_failures = 0
+        self._first_failure = None
+        if self.on_giveup is not None:
+            self.on_giveup(attempts, error)
+        raise error
+
+    def _set_state(self, state: CircuitState) -> None:
+        if state is self.state:
+            return
+        old, self.state = self.state, state
+        if self.on_state_change is not None:
+            self.on_state_change(old, state)
+
+    def __repr__(self) -> str:
+        """Return string representation of the retry policy."""
+        return (
+            f"{self.__class__.__name__}(initial_delay={self.initial_delay}, max_delay={self.max_delay}, "
+            f"max_attempts={self.max_attempts}, state={self.state.value})"
+        )
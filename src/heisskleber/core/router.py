@@ -0,0 +1,202 @@
+"""Dispatch messages to handlers and sub-streams by topic, with MQTT wildcards or ZMQ prefixes."""
+
+from collections.abc import Callable, Coroutine
+from itertools import count
+from typing import Any, Generic, Literal, TypeVar
+
+from .buffer import MessageBuffer, OverflowPolicy
+from .receiver import Receiver
+
+T = TypeVar("T")
+
+Handler = Callable[[T, dict[str, Any]], Coroutine[Any, Any, None]]
+TopicStyle = Literal["mqtt", "prefix"]
+
+
+class _Node:
+    """Node of the topic trie. Keys are topic levels (mqtt) or characters (prefix)."""
+
+    __slots__ = ("children", "targets")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.targets: list[tuple[int, Any]] = []
+
+
+class TopicStream(Receiver[T]):
+    """Receiver of the messages a TopicRouter routed to one pattern, see TopicRouter.stream().
+
+    Starting and stopping the stream does not affect the router, which has to be running.
+    """
+
+    def __init__(self, router: "TopicRouter[T]", pattern: str, buffer: MessageBuffer[tuple[T, dict[str, Any]]]) -> None:
+        self.router = router
+        self.pattern = pattern
+        self.buffer = buffer
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Return the next message that matches the pattern."""
+        return await self.buffer.get()
+
+    async def __call__(self, data: T, meta: dict[str, Any]) -> None:
+        """Buffer a routed message, the stream is a handler of its router."""
+        await self.buffer.put((data, meta))
+
+    async def start(self) -> None:
+        """Do nothing, the router feeds the stream."""
+
+    async def stop(self) -> None:
+        """Stop routing messages to this stream."""
+        self.router.remove(self.pattern, self)
+
+    def __repr__(self) -> str:
+        """Return string representation of the stream."""
+        return f"{self.__class__.__name__}(pattern={self.pattern!r})"
+
+
+class TopicRouter(Generic[T]):
+    """Dispatch messages to async handlers and sub-streams by their meta["topic"].
+
+    Patterns are stored in a trie, so matching a topic takes time proportional to its depth,
+    independent of the number of patterns. The matches of every seen topic are cached.
+
+    Topic styles:
+        mqtt: Levels are separated by "/". "+" matches exactly one level, "#" as the last level matches
+            the parent level and any number of levels below. Wildcards do not match topics starting with "$".
+        prefix: A pattern matches every topic that starts with it, like ZMQ subscriptions.
+
+    Arguments:
+        receiver: The receiver that run() dispatches from.
+        style: The topic style, "mqtt" or "prefix".
+        cache_size: Number of topics whose matches are cached. The cache is cleared when it is full.
+
+    Example:
+        >>> router = TopicRouter(MqttReceiver(config, topic="#"))
+        >>> @router.route("sensors/+/temperature")
+        ... async def on_temperature(data, meta):
+        ...     print(meta["topic"], data)
+        >>> alarms = router.stream("alarms/#")
+        >>> asyncio.create_task(router.run())
+        >>> data, meta = await alarms.receive()
+
+    """
+
+    def __init__(
+        self, receiver: Receiver[T] | None = None, *, style: TopicStyle = "mqtt", cache_size: int = 4096
+    ) -> None:
+        if style not in ("mqtt", "prefix"):
+            msg = f"Unknown topic style {style!r}, choose mqtt or prefix."
+            raise ValueError(msg)
+        self.receiver = receiver
+        self.style = style
+        self.cache_size = cache_size
+        self.unmatched = 0
+        self._root = _Node()
+        self._cache: dict[str, tuple[Handler[T], ...]] = {}
+        self._order = count()
+
+    def add(self, pattern: str, handler: Handler[T]) -> None:
+        """Call `await handler(data, meta)` for every message whose topic matches the pattern."""
+        node = self._root
+        for key in self._keys(pattern):
+            node = node.children.setdefault(key, _Node())
+        node.targets.append((next(self._order), handler))
+        self._cache.clear()
+
+    def remove(self, pattern: str, handler: Handler[T]) -> None:
+        """Stop calling the handler for the pattern."""
+        node: _Node | None = self._root
+        for key in self._keys(pattern):
+            node = node.children.get(key)  # type: ignore[union-attr]
+            if node is None:
+                return
+        node.targets = [target for target in node.targets if target[1] != handler]  # type: ignore[union-attr]
+        self._cache.clear()
+
+    def route(self, pattern: str) -> Callable[[Handler[T]], Handler[T]]:
+        """Register the decorated async function as handler of the pattern."""
+
+        def decorator(handler: Handler[T]) -> Handler[T]:
+            self.add(pattern, handler)
+            return handler
+
+        return decorator
+
+    def stream(self, pattern: str, maxsize: int = 0, overflow: OverflowPolicy = "block") -> TopicStream[T]:
+        """Return a receiver of all messages whose topic matches the pattern.
+
+        Arguments:
+            pattern: The topic pattern.
+            maxsize: Number of messages buffered for the stream. 0 is unbounded.
+            overflow: The overflow policy of the stream's buffer. If it blocks, the router waits for the stream.
+
+        """
+        stream = TopicStream(self, pattern, MessageBuffer(maxsize, overflow))
+        self.add(pattern, stream)
+        return stream
+
+    def match(self, topic: str) -> tuple[Handler[T], ...]:
+        """Return the handlers of all patterns that match the topic, in order of registration."""
+        try:
+            return self._cache[topic]
+        except KeyError:
+            pass
+        found: list[tuple[int, Handler[T]]] = []
+        if self.style == "mqtt":
+            self._match_levels(self._root, topic.split("/"), 0, found, topic.startswith("$"))
+        else:
+            self._match_prefix(topic, found)
+        handlers = tuple(handler for _, handler in sorted(found, key=lambda target: target[0]))
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[topic] = handlers
+        return handlers
+
+    async def dispatch(self, data: T, meta: dict[str, Any]) -> int:
+        """Pass a message to all handlers that match meta["topic"] and return their number."""
+        handlers = self.match(meta.get("topic", ""))
+        if not handlers:
+            self.unmatched += 1
+        for handler in handlers:
+            await handler(data, meta)
+        return len(handlers)
+
+    async def run(self, max_items: int = 100) -> None:
+        """Receive batches of messages from the receiver and dispatch them, until cancelled."""
+        if self.receiver is None:
+            msg = "TopicRouter.run() needs a receiver."
+            raise RuntimeError(msg)
+        while True:
+            for data, meta in await self.receiver.receive_many(max_items):
+                await self.dispatch(data, meta)
+
+    def _keys(self, pattern: str) -> list[str] | str:
+        return pattern.split("/") if self.style == "mqtt" else pattern
+
+    def _match_levels(
+        self, node: _Node, levels: list[str], depth: int, found: list[tuple[int, Any]], system: bool
+    ) -> None:
+        wildcards = not (system and depth == 0)  # $SYS/... is not matched by wildcards on the first level
+        if wildcards and (multi := node.children.get("#")) is not None:
+            found.extend(multi.targets)
+        if depth == len(levels):
+            found.extend(node.targets)
+            return
+        if (child := node.children.get(levels[depth])) is not None:
+            self._match_levels(child, levels, depth + 1, found, system)
+        if wildcards and (single := node.children.get("+")) is not None:
+            self._match_levels(single, levels, depth + 1, found, system)
+
+    def _match_prefix(self, topic: str, found: list[tuple[int, Any]]) -> None:
+        node = self._root
+        found.extend(node.targets)
+        for char in topic:
+            child = node.children.get(char)
+            if child is None:
+                return
+            node = child
+            found.extend(node.targets)
+
+    def __repr__(self) -> str:
+        """Return string representation of the router."""
+        return f"{self.__class__.__name__}(receiver={self.receiver!r}, style={self.style})"
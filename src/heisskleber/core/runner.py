@@ -0,0 +1,86 @@
+"""Run an asyncio program on the fastest available event loop."""
+
+import asyncio
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, Literal, TypeVar
+
+T = TypeVar("T")
+
+LoopName = Literal["auto", "asyncio", "uvloop"]
+
+
+def get_loop_factory(loop: LoopName = "auto") -> Callable[[], asyncio.AbstractEventLoop]:
+    """Return a function that creates a new event loop of the given kind.
+
+    Arguments:
+        loop: "uvloop", "asyncio" for the default loop of the standard library, or "auto" for uvloop if it is
+            installed, else the default loop. uvloop is installed with the `uvloop` extra and does not support Windows.
+
+    Raises:
+        ImportError: If loop is "uvloop" and uvloop is not installed.
+        ValueError: If the loop name is unknown.
+
+    """
+    if loop not in ("auto", "asyncio", "uvloop"):
+        msg = f"Unknown event loop {loop!r}, choose auto, asyncio or uvloop."
+        raise ValueError(msg)
+    if loop == "asyncio":
+        return asyncio.new_event_loop
+    try:
+        import uvloop
+    except ImportError:
+        if loop == "uvloop":
+            raise
+        return asyncio.new_event_loop
+    return uvloop.new_event_loop  # type: ignore[no-any-return]
+
+
+def run(
+    main: Coroutine[Any, Any, T] | Callable[[], Coroutine[Any, Any, T]],
+    *,
+    loop: LoopName = "auto",
+    debug: bool | None = None,
+    eager_tasks: bool = False,
+) -> T:
+    """Run the coroutine on a new event loop and return its result, like asyncio.run().
+
+    By default, uvloop is used if it is installed, which speeds up the network transports.
+    On exit, remaining tasks are cancelled and async generators and the default executor are shut down.
+
+    Arguments:
+        main: The coroutine, or a coroutine function without arguments.
+        loop: The event loop, see get_loop_factory().
+        debug: Run the loop in asyncio debug mode. None keeps the default, which honours PYTHONASYNCIODEBUG.
+        eager_tasks: Start tasks eagerly, so tasks that finish without waiting never get scheduled (Python 3.12+).
+            This changes when tasks start running, so it is disabled by default.
+
+    Raises:
+        ValueError: If eager_tasks is requested on Python < 3.12.
+
+    Example:
+        >>> async def main() -> None:
+        ...     async with MqttReceiver(config, topic="#") as receiver:
+        ...         async for data, meta in receiver:
+        ...             print(data)
+        >>> heisskleber.run(main)
+
+    """
+    coroutine = main() if callable(main) else main
+    factory = get_loop_factory(loop)
+    if eager_tasks and sys.version_info < (3, 12):
+        coroutine.close()
+        msg = "Eager tasks need Python 3.12 or newer."
+        raise ValueError(msg)
+
+    if sys.version_info < (3, 11):  # no asyncio.Runner
+        if factory is asyncio.new_event_loop:
+            return asyncio.run(coroutine) if debug is None else asyncio.run(coroutine, debug=debug)
+        import uvloop
+
+        return uvloop.run(coroutine, debug=debug)  # type: ignore[no-any-return]
+
+    with asyncio.Runner(debug=debug, loop_factory=factory) as runner:
+        if eager_tasks:
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)  # type: ignore[attr-defined]
+        return runner.run(coroutine)
@@ -0,0 +1,277 @@
+"""Compiled converters between dictionaries and dataclasses or TypedDicts, and layouts of binary records."""
+
+import dataclasses
+import struct
+import types
+from collections.abc import Callable, Sequence
+from typing import Any, Generic, Literal, TypeVar, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+T = TypeVar("T")
+
+Converter = Callable[[Any], Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class Schema(Generic[T]):
+    """Specialized encoder and decoder for a dataclass or TypedDict.
+
+    Schemas are compiled once per type by `compile_schema` and cached, so converting a message
+    does not inspect the type's fields again.
+
+    Attributes:
+        cls: The dataclass or TypedDict the schema was compiled for.
+        decode: Create and validate an instance of cls from a dictionary.
+            Raises TypeError or ValueError if a field has the wrong type, KeyError if a required field is missing.
+        encode: Convert an instance of cls into a dictionary of plain values.
+
+    """
+
+    cls: type[T]
+    decode: Callable[[dict[str, Any]], T]
+    encode: Callable[[T], dict[str, Any]]
+
+
+STRUCT_BYTE_ORDERS = ("<", ">", "!", "=")
+
+_schema_cache: dict[type[Any], Schema[Any]] = {}
+_compiling: set[type[Any]] = set()
+
+
+def compile_schema(cls: type[T]) -> Schema[T]:
+    """Return the compiled schema of a dataclass or TypedDict, compiling it on first use.
+
+    Raises:
+        TypeError: If cls is neither a dataclass nor a TypedDict.
+
+    """
+    try:
+        return _schema_cache[cls]
+    except KeyError:
+        pass
+
+    schema: Schema[T]
+    _compiling.add(cls)
+    try:
+        if dataclasses.is_dataclass(cls):
+            schema = _compile_dataclass(cls)
+        elif is_typeddict(cls):
+            schema = _compile_typeddict(cls)
+        else:
+            raise TypeError(f"{cls!r} is neither a dataclass nor a TypedDict.")
+    finally:
+        _compiling.discard(cls)
+    _schema_cache[cls] = schema
+    return schema
+
+
+def _decode_function(cls: type[Any]) -> Converter:
+    if cls in _compiling:  # a recursive type, its schema is looked up once it is compiled
+        return lambda value: _schema_cache[cls].decode(value)
+    return compile_schema(cls).decode
+
+
+def _encode_function(cls: type[Any]) -> Converter:
+    if cls in _compiling:
+        return lambda value: _schema_cache[cls].encode(value)
+    return compile_schema(cls).encode
+
+
+def _compile_dataclass(cls: Any) -> Schema[Any]:
+    hints = get_type_hints(cls)
+    init_fields = [field for field in dataclasses.fields(cls) if field.init]
+    namespace: dict[str, Any] = {"cls": cls}
+
+    decode_lines = ["def decode(d):", "    kw = {}"]
+    encode_items = []
+    for index, field in enumerate(init_fields):
+        decoder = _converter(hints[field.name])
+        encoder = _encoder(hints[field.name])
+        value = f"d[{field.name!r}]"
+        if decoder is not None:
+            namespace[f"dec{index}"] = decoder
+            value = f"dec{index}({value})"
+        required = field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+        if required:
+            decode_lines.append(f"    kw[{field.name!r}] = {value}")
+        else:
+            decode_lines.append(f"    if {field.name!r} in d: kw[{field.name!r}] = {value}")
+        attribute = f"obj.{field.name}"
+        if encoder is not None:
+            namespace[f"enc{index}"] = encoder
+            attribute = f"enc{index}({attribute})"
+        encode_items.append(f"{field.name!r}: {attribute}")
+    decode_lines.append("    return cls(**kw)")
+
+    source = "\n".join([*decode_lines, "def encode(obj):", f"    return {{{', '.join(encode_items)}}}"])
+    exec(source, namespace)  # noqa: S102 - generated from field names of a dataclass
+    return Schema(cls, namespace["decode"], namespace["encode"])
+
+
+def _compile_typeddict(cls: Any) -> Schema[Any]:
+    hints = get_type_hints(cls)
+    required_keys: frozenset[str] = cls.__required_keys__
+    decoders = [(name, name in required_keys, _converter(hint)) for name, hint in hints.items()]
+
+    def decode(d: dict[str, Any]) -> dict[str, Any]:
+        result = {}
+        for name, required, decoder in decoders:
+            if not required and name not in d:
+                continue
+            value = d[name]
+            result[name] = decoder(value) if decoder is not None else value
+        return result
+
+    def encode(obj: dict[str, Any]) -> dict[str, Any]:
+        return obj
+
+    return Schema(cls, decode, encode)
+
+
+def _converter(hint: Any) -> Converter | None:  # noqa: C901, PLR0911
+    """Return a function that validates and converts a decoded value to the type hint, None if any value is valid."""
+    if hint is Any or hint is object:
+        return None
+    if hint is type(None):
+        return _check_instance(type(None))
+    if hint is float:
+        return _to_float
+    if hint is int:
+        return _to_int
+    if dataclasses.is_dataclass(hint) or is_typeddict(hint):
+        decode = _decode_function(hint)
+        check_dict = _check_instance(dict)
+        return lambda value: decode(check_dict(value))
+
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin is Literal:
+        return _check_literal(args)
+    if origin is Union or origin is types.UnionType:
+        return _union(tuple(_converter(arg) for arg in args))
+    if origin in (list, set, frozenset):
+        return _sequence(origin, _converter(args[0]) if args else None)
+    if origin is tuple:
+        # only homogeneous tuples, tuple[X, ...], are validated item by item
+        homogeneous = len(args) == 2 and args[1] is Ellipsis  # noqa: PLR2004
+        return _sequence(tuple, _converter(args[0]) if homogeneous else None)
+    if origin is dict:
+        value = _converter(args[1]) if args else None
+        return _mapping(value)
+    if origin is not None:
+        return _check_instance(origin)
+    if isinstance(hint, type):
+        return _check_instance(hint)
+    return None
+
+
+def _encoder(hint: Any) -> Converter | None:
+    """Return a function that converts a field value into plain values, None if the value can be used as it is."""
+    if dataclasses.is_dataclass(hint):
+        return _encode_function(hint)  # type: ignore[arg-type]
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin is Union or origin is types.UnionType:
+        if any(dataclasses.is_dataclass(arg) for arg in args):
+            return _encode_value
+        return None
+    if origin in (list, set, frozenset, tuple) and args and dataclasses.is_dataclass(args[0]):
+        item = _encode_function(args[0])  # type: ignore[arg-type]
+        return lambda value: [item(v) for v in value]
+    if origin is dict and len(args) == 2 and dataclasses.is_dataclass(args[1]):  # noqa: PLR2004
+        value_encoder = _encode_function(args[1])  # type: ignore[arg-type]
+        return lambda value: {k: value_encoder(v) for k, v in value.items()}
+    return None
+
+
+def _encode_value(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return compile_schema(type(value)).encode(value)
+    return value
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError(f"Expected float, got {type(value).__name__}.")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise TypeError(f"Expected int, got {type(value).__name__}.")
+
+
+def _check_instance(expected: type[Any]) -> Converter:
+    def check(value: Any) -> Any:
+        if not isinstance(value, expected):
+            raise TypeError(f"Expected {expected.__name__}, got {type(value).__name__}.")
+        return value
+
+    return check
+
+
+def _check_literal(values: tuple[Any, ...]) -> Converter:
+    def check(value: Any) -> Any:
+        if value not in values:
+            raise ValueError(f"{value!r} is not one of {values}.")
+        return value
+
+    return check
+
+
+def _union(converters: tuple[Converter | None, ...]) -> Converter | None:
+    if any(converter is None for converter in converters):
+        return None
+
+    def convert(value: Any) -> Any:
+        for converter in converters:
+            try:
+                return converter(value)  # type: ignore[misc]
+            except (TypeError, ValueError, KeyError):  # noqa: PERF203
+                continue
+        raise TypeError(f"{value!r} does not match any type of the union.")
+
+    return convert
+
+
+def _sequence(origin: type[Any], item: Converter | None) -> Converter:
+    # JSON and most binary formats decode every sequence to a list
+    def convert(value: Any) -> Any:
+        if not isinstance(value, list | tuple | set | frozenset):
+            raise TypeError(f"Expected {origin.__name__}, got {type(value).__name__}.")
+        if item is None:
+            return value if isinstance(value, origin) else origin(value)
+        return origin(item(v) for v in value)
+
+    return convert
+
+
+def _mapping(value_converter: Converter | None) -> Converter:
+    def convert(value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise TypeError(f"Expected dict, got {type(value).__name__}.")
+        if value_converter is None:
+            return value
+        return {k: value_converter(v) for k, v in value.items()}
+
+    return convert
+
+
+def record_struct(fields: Sequence[tuple[str, str]], byte_order: str) -> struct.Struct:
+    """Return the struct of a binary record with the given (name, format) fields, see StructUnpacker.
+
+    Raises:
+        ValueError: If the byte order is not supported or the format of a field does not hold exactly one value,
+            e.g. "3f" or "x". Counts of strings, e.g. "10s", are allowed.
+        struct.error: If a format character is invalid.
+
+    """
+    if byte_order not in STRUCT_BYTE_ORDERS:
+        raise ValueError(f"Byte order must be one of {STRUCT_BYTE_ORDERS}, got {byte_order!r}.")
+    for name, code in fields:
+        field = struct.Struct(byte_order + code)
+        if len(field.unpack(bytes(field.size))) != 1:
+            raise ValueError(f"Field {name!r} must hold exactly one value, got format {code!r}.")
+    return struct.Struct(byte_order + "".join(code for _, code in fields))
@@ -1,13 +1,17 @@
 """Asyncronous data sink interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from types import TracebackType
 from typing import Any, Generic, TypeVar
 
+from .metrics import Metrics, instrument, uninstrument
 from .packer import Packer
 
 T = TypeVar("T")
 
+_CODEC_ATTRIBUTES = ("packer", "pack")
+
 
 class Sender(ABC, Generic[T]):
     """Abstract interface for asynchronous data sinks.
@@ -18,10 +22,12 @@ class Sender(ABC, Generic[T]):
 
     Attributes:
         packer: Component responsible for serializing type T data before sending.
+        metrics: Counters of the sender, None unless enabled with enable_metrics().
 
     """
 
     packer: Packer[T]
+    metrics: Metrics | None = None
 
     @abstractmethod
     async def send(self, data: T, **kwargs: Any) -> None:
@@ -33,6 +39,39 @@ class Sender(ABC, Generic[T]):
 
         """
 
+    async def send_many(self, items: Iterable[T], **kwargs: Any) -> None:
+        """Send a batch of data through the implemented output stream.
+
+        This default implementation awaits send() for every item. Implementations override it
+        to pack the whole batch in one pass and hand it to the transport without per-item awaits.
+
+        Arguments:
+            items: The data items to be sent, in order.
+            **kwargs: Additional implementation-specific arguments, applied to every item.
+
+        """
+        for data in items:
+            await self.send(data, **kwargs)
+
+    def enable_metrics(self) -> Metrics:
+        """Start counting messages, bytes, pack time, queue depth, drops and reconnects of this sender.
+
+        Metrics are disabled by default and cost nothing until enabled. Once enabled, they are
+        available through the returned object, `sender.metrics.snapshot()` and collect_metrics().
+
+        Returns:
+            Metrics: The metrics of this sender.
+
+        """
+        return instrument(self, "sender", _CODEC_ATTRIBUTES)
+
+    def disable_metrics(self) -> None:
+        """Stop counting and restore the original packer."""
+        uninstrument(self, _CODEC_ATTRIBUTES)
+
+    def _register_metrics(self, metrics: Metrics) -> None:
+        """Add transport specific gauges, such as the depth of an internal queue, to the metrics."""
+
     @abstractmethod
     async def start(self) -> None:
         """Initialize and start the sink's background processes and tasks."""
@@ -1,12 +1,19 @@
 """Unpacker protocol definition and example implemetation."""
 
 import json
+import struct
 from abc import abstractmethod
-from typing import Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from .schema import compile_schema, record_struct
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
 T_co = TypeVar("T_co", covariant=True)
+T = TypeVar("T")
 
-Payload = str | bytes | bytearray
+Payload = str | bytes | bytearray | memoryview
 
 
 class UnpackerError(Exception):
@@ -25,11 +32,18 @@ class UnpackerError(Exception):
     def __init__(self, payload: Payload) -> None:
         """Initialize the error with the failed payload and cause."""
         self.payload = payload
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
         dots = b"..." if isinstance(payload, bytes | bytearray) else "..."
         preview = payload[: self.PREVIEW_LENGTH] + dots if len(payload) > self.PREVIEW_LENGTH else payload
         message = f"Failed to unpack payload: {preview!r}. "
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Rebuild the error from its payload, e.g. when it is returned from a process pool."""
+        payload = self.payload.tobytes() if isinstance(self.payload, memoryview) else self.payload
+        return self.__class__, (payload,)
+
 
 class Unpacker(Protocol[T_co]):
     """Unpacker Interface.
@@ -37,6 +51,9 @@ class Unpacker(Protocol[T_co]):
     This abstract base class defines an interface for unpacking payloads.
     It takes a payload of bytes, creates a data dictionary and an optional topic,
     and returns a tuple containing the topic and data.
+
+    Transports may hand over receive buffers as memoryview without copying them,
+    so unpackers should accept any bytes-like payload.
     """
 
     @abstractmethod
@@ -57,11 +74,27 @@ class Unpacker(Protocol[T_co]):
         """
 
 
+def record_size(unpacker: Unpacker[Any]) -> int | None:
+    """Return the size of the fixed-length records the unpacker expects, or None for variable-length payloads.
+
+    Unpackers of fixed-length binary records declare this with a `record_size` attribute, see StructUnpacker.
+    Stream-based receivers, such as the SerialReceiver, use it to read whole records instead of lines.
+    """
+    size = getattr(unpacker, "record_size", None)
+    return int(size) if size else None
+
+
+def is_batched(unpacker: Unpacker[Any]) -> bool:
+    """Return whether the unpacker accepts payloads of several concatenated records, see StructBatchUnpacker."""
+    return bool(getattr(unpacker, "batched", False))
+
+
 class JSONUnpacker(Unpacker[dict[str, Any]]):
     """Deserializes JSON-formatted bytes into dictionaries.
 
     Arguments:
         payload: JSON-formatted bytes to deserialize.
+            The standard library can not parse memoryview, such payloads are copied to bytes first.
 
     Returns:
         tuple[dict[str, Any], dict[str, Any]]: A tuple containing:
@@ -82,6 +115,306 @@ class JSONUnpacker(Unpacker[dict[str, Any]]):
     def __call__(self, payload: Payload) -> tuple[dict[str, Any], dict[str, Any]]:
         """Unpack the payload."""
         try:
-            return json.loads(payload), {}
+            return json.loads(payload.tobytes() if isinstance(payload, memoryview) else payload), {}
         except json.JSONDecodeError as e:
             raise UnpackerError(payload) from e
+
+
+class RawUnpacker(Unpacker[Payload]):
+    """Passes payloads through unchanged, e.g. to unpack them later in a process pool, see OffloadReceiver.
+
+    Example:
+        >>> unpacker = RawUnpacker()
+        >>> data, metadata = unpacker(b"raw")
+        >>> print(data)
+        b'raw'
+
+    """
+
+    def __call__(self, payload: Payload) -> tuple[Payload, dict[str, Any]]:
+        """Return the payload."""
+        return payload, {}
+
+
+class OrjsonUnpacker(Unpacker[dict[str, Any]]):
+    """Deserializes JSON-formatted bytes into dictionaries using `orjson`_.
+
+    Accepts bytes, bytearray, memoryview and str payloads without copying them first.
+
+    Raises:
+        ImportError: If orjson is not installed.
+
+    Example:
+        >>> unpacker = OrjsonUnpacker()
+        >>> data, metadata = unpacker(b'{"hotglue": "very_nais"}')
+        >>> print(data)
+        {'hotglue': 'very_nais'}
+
+    .. _orjson: https://github.com/ijl/orjson
+
+    """
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+        self._error = orjson.JSONDecodeError
+
+    def __call__(self, payload: Payload) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Unpack the payload."""
+        try:
+            return self._loads(payload), {}
+        except self._error as e:
+            raise UnpackerError(payload) from e
+
+
+class MsgspecJSONUnpacker(Unpacker[dict[str, Any]]):
+    """Deserializes JSON-formatted bytes into dictionaries using `msgspec`_.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+
+    Example:
+        >>> unpacker = MsgspecJSONUnpacker()
+        >>> data, metadata = unpacker(b'{"hotglue": "very_nais"}')
+        >>> print(data)
+        {'hotglue': 'very_nais'}
+
+    .. _msgspec: https://jcristharif.com/msgspec/
+
+    """
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode: Callable[[Payload], Any] = msgspec.json.Decoder().decode
+        self._error: type[Exception] = msgspec.DecodeError
+
+    def __call__(self, payload: Payload) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Unpack the payload."""
+        try:
+            return self._decode(payload), {}
+        except self._error as e:
+            raise UnpackerError(payload) from e
+
+
+def fast_json_unpacker() -> Unpacker[dict[str, Any]]:
+    """Return the fastest available JSON unpacker.
+
+    Tries orjson and msgspec, in this order, and falls back to the standard library JSONUnpacker.
+    """
+    for unpacker in (OrjsonUnpacker, MsgspecJSONUnpacker):
+        try:
+            return unpacker()
+        except ImportError:  # noqa: PERF203
+            continue
+    return JSONUnpacker()
+
+
+class DataclassUnpacker(Unpacker[T]):
+    """Deserializes payloads into instances of a dataclass or TypedDict.
+
+    The payload is first deserialized into a dictionary by the inner unpacker, then converted with a
+    decoder that is compiled once per type and cached. The decoder validates the field types:
+    ints are accepted for float fields and converted, all other mismatches raise an UnpackerError.
+    Nested dataclasses, TypedDicts, Optional, Union, Literal, list and dict fields are supported.
+
+    Arguments:
+        cls: The dataclass or TypedDict to create from the payload.
+        unpacker: The unpacker that deserializes the payload into a dictionary. Defaults to JSONUnpacker.
+
+    Raises:
+        TypeError: If cls is neither a dataclass nor a TypedDict.
+
+    Example:
+        >>> @dataclass
+        ... class Reading:
+        ...     sensor: str
+        ...     value: float
+        >>> unpacker = DataclassUnpacker(Reading)
+        >>> data, metadata = unpacker(b'{"sensor": "t1", "value": 21}')
+        >>> print(data)
+        Reading(sensor='t1', value=21.0)
+
+    """
+
+    def __init__(self, cls: type[T], unpacker: Unpacker[dict[str, Any]] | None = None) -> None:
+        self.cls = cls
+        self.unpacker = unpacker or JSONUnpacker()
+        self._decode = compile_schema(cls).decode
+
+    def __call__(self, payload: Payload) -> tuple[T, dict[str, Any]]:
+        """Unpack the payload."""
+        data, extra = self.unpacker(payload)
+        try:
+            return self._decode(data), extra
+        except (TypeError, ValueError, KeyError) as e:
+            raise UnpackerError(payload) from e
+
+
+class MsgpackUnpacker(Unpacker[dict[str, Any]]):
+    """Deserializes `MessagePack`_ bytes into dictionaries.
+
+    Accepts bytes, bytearray and memoryview payloads without copying them first.
+
+    Raises:
+        ImportError: If msgpack is not installed.
+
+    Example:
+        >>> unpacker = MsgpackUnpacker()
+        >>> data, metadata = unpacker(MsgpackPacker()({"key": "value"}))
+        >>> print(data)
+        {'key': 'value'}
+
+    .. _MessagePack: https://msgpack.org
+
+    """
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._unpackb: Callable[..., Any] = msgpack.unpackb
+        self._error: type[Exception] = msgpack.UnpackException
+
+    def __call__(self, payload: Payload) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Unpack the payload."""
+        try:
+            return self._unpackb(payload, raw=False), {}
+        except (self._error, ValueError, TypeError) as e:
+            raise UnpackerError(payload) from e
+
+
+class CborUnpacker(Unpacker[dict[str, Any]]):
+    """Deserializes `CBOR`_ bytes into dictionaries.
+
+    Raises:
+        ImportError: If cbor2 is not installed.
+
+    Example:
+        >>> unpacker = CborUnpacker()
+        >>> data, metadata = unpacker(CborPacker()({"key": "value"}))
+        >>> print(data)
+        {'key': 'value'}
+
+    .. _CBOR: https://cbor.io
+
+    """
+
+    def __init__(self) -> None:
+        import cbor2
+
+        self._loads: Callable[..., Any] = cbor2.loads
+        self._error: type[Exception] = cbor2.CBORDecodeError
+
+    def __call__(self, payload: Payload) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Unpack the payload."""
+        try:
+            return self._loads(payload), {}
+        except (self._error, TypeError) as e:
+            raise UnpackerError(payload) from e
+
+
+class StructUnpacker(Unpacker[Any]):
+    """Deserializes fixed-length binary records into dictionaries or dataclasses.
+
+    The record layout is given as a sequence of (name, format) pairs, with format characters of
+    the `struct`_ module. Records use standard sizes without padding, in the given byte order.
+
+    Arguments:
+        fields: Names and struct format characters of the record fields, e.g. [("epoch", "d"), ("x", "f")].
+        byte_order: One of "<" (little-endian, default), ">" or "!" (big-endian) and "=" (native).
+        cls: If set, create instances of this class from the record fields instead of dictionaries.
+
+    Raises:
+        ValueError: If the byte order is not supported or a field does not hold exactly one value.
+        struct.error: If a format character is invalid.
+
+    Example:
+        >>> unpacker = StructUnpacker([("epoch", "d"), ("counter", "I"), ("x", "f")])
+        >>> data, metadata = unpacker(struct.pack("<dIf", 1.5, 7, 0.25))
+        >>> print(data)
+        {'epoch': 1.5, 'counter': 7, 'x': 0.25}
+
+    .. _struct: https://docs.python.org/3/library/struct.html#format-characters
+
+    """
+
+    def __init__(
+        self, fields: "Sequence[tuple[str, str]]", byte_order: str = "<", cls: "Callable[..., Any] | None" = None
+    ) -> None:
+        self.fields = list(fields)
+        self.names = tuple(name for name, _ in self.fields)
+        self.cls = cls
+        self._struct = record_struct(self.fields, byte_order)
+        self.record_size = self._struct.size
+
+    def __call__(self, payload: Payload) -> tuple[Any, dict[str, Any]]:
+        """Unpack a single record."""
+        try:
+            values = self._struct.unpack(payload)  # type: ignore[arg-type]
+        except (struct.error, TypeError) as e:
+            raise UnpackerError(payload) from e
+        data = dict(zip(self.names, values, strict=True))
+        if self.cls is None:
+            return data, {}
+        try:
+            return self.cls(**data), {}
+        except TypeError as e:  # the fields do not match the parameters of cls
+            raise UnpackerError(payload) from e
+
+
+class StructBatchUnpacker(Unpacker[Any]):
+    """Deserializes a buffer of concatenated fixed-length records in a single vectorized call.
+
+    The buffer is interpreted as a `NumPy structured array`_ without copying it, so decoding N records
+    does not cost any Python-level work per record. The record layout is given as for the StructUnpacker.
+
+    Arguments:
+        fields: Names and struct format characters of the record fields, e.g. [("epoch", "d"), ("x", "f")].
+        byte_order: One of "<" (little-endian, default), ">" or "!" (big-endian) and "=" (native).
+        columns: Return a dictionary of column arrays, one per field, instead of the structured array.
+
+    Returns:
+        tuple[Any, dict[str, Any]]: The structured array (or the dictionary of columns) and
+            metadata with the number of decoded records under "records".
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If the byte order is not supported or a field does not hold exactly one value.
+
+    Example:
+        >>> unpacker = StructBatchUnpacker([("epoch", "d"), ("x", "f")], columns=True)
+        >>> data, metadata = unpacker(struct.pack("<dfdf", 1.0, 0.5, 2.0, 0.25))
+        >>> print(data["x"], metadata)
+        [0.5  0.25] {'records': 2}
+
+    .. _NumPy structured array: https://numpy.org/doc/stable/user/basics.rec.html
+
+    """
+
+    batched = True
+
+    def __init__(self, fields: "Sequence[tuple[str, str]]", byte_order: str = "<", columns: bool = False) -> None:
+        import numpy as np
+
+        self.fields = list(fields)
+        self.names = tuple(name for name, _ in self.fields)
+        self.columns = columns
+        self.record_size = record_struct(self.fields, byte_order).size
+        numpy_order = ">" if byte_order == "!" else byte_order
+        self.dtype = np.dtype(
+            [(name, f"S{code[:-1] or 1}" if code.endswith("s") else numpy_order + code) for name, code in self.fields]
+        )
+        if self.dtype.itemsize != self.record_size:
+            raise ValueError(f"Fields {self.fields} can not be represented as numpy dtype.")
+        self._frombuffer: Callable[..., Any] = np.frombuffer
+
+    def __call__(self, payload: Payload) -> tuple[Any, dict[str, Any]]:
+        """Unpack all records of the payload."""
+        try:
+            records = self._frombuffer(payload, dtype=self.dtype)
+        except (ValueError, TypeError) as e:
+            raise UnpackerError(payload) from e
+        if self.columns:
+            return {name: records[name] for name in self.names}, {"records": len(records)}
+        return records, {"records": len(records)}
@@ -1,44 +1,66 @@
 import asyncio
-from collections.abc import Callable, Coroutine
-from functools import wraps
-from typing import Any, ParamSpec, TypeVar
+from collections import deque
+from collections.abc import Callable
+from typing import Any, TypeVar
 
-P = ParamSpec("P")
 T = TypeVar("T")
+R = TypeVar("R")
 
 
-def retry(
-    every: int = 5,
-    strategy: str = "always",
-    catch: type[Exception] | tuple[type[Exception], ...] = Exception,
-    logger_fn: Callable[[str, dict[str, Any]], None] | None = None,
-) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]]:
-    """Retry a coroutine."""
-
-    def decorator(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Coroutine[Any, Any, T]]:
-        @wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            retries = 0
-            while True:
-                try:
-                    result = await func(*args, **kwargs)
-                    break
-                except catch as e:
-                    if logger_fn:
-                        logger_fn(
-                            "Error occurred: %(err)s. Retrying in %(seconds)s seconds",
-                            {"err": e, "seconds": every},
-                        )
-                    retries += 1
-                    await asyncio.sleep(every)
-                except asyncio.CancelledError:
-                    raise
-
-                if strategy != "always":
-                    raise NotImplementedError
-
-            return result
-
-        return wrapper
-
-    return decorator
+async def drain_queue(queue: asyncio.Queue[T], max_items: int, timeout: float = 0.0) -> list[T]:
+    """Wait for the first item of a queue and take all further available items in one pass.
+
+    Arguments:
+        queue: The queue to drain.
+        max_items: The maximum number of items to take from the queue.
+        timeout: Seconds to keep waiting for more items after the first one, if the queue runs empty
+            before `max_items` items were taken.
+
+    Returns:
+        A non-empty list of items in queue order.
+
+    """
+    items = [await queue.get()]
+    items.extend(queue.get_nowait() for _ in range(min(queue.qsize(), max_items - 1)))
+    if timeout <= 0:
+        return items
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while len(items) < max_items:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            items.append(await asyncio.wait_for(queue.get(), remaining))
+        except TimeoutError:
+            break
+        items.extend(queue.get_nowait() for _ in range(min(queue.qsize(), max_items - len(items))))
+    return items
+
+
+def unpack_each(items: deque[Any], unpack: Callable[[Any], R], max_items: int) -> list[R]:
+    """Unpack and remove up to `max_items` items from the left of a deque, one at a time.
+
+    If an item fails after others were unpacked, those are returned and the error takes the place of the item,
+    to be raised by the next call. So no message that was taken off a queue or socket is lost.
+
+    Raises:
+        Exception: The error of the first item, if it could not be unpacked.
+
+    """
+    results: list[R] = []
+    while items and len(results) < max_items:
+        if isinstance(items[0], Exception):
+            if results:
+                break
+            raise items.popleft()
+        item = items.popleft()
+        try:
+            results.append(unpack(item))
+        except Exception as e:
+            if not results:
+                raise
+            items.appendleft(e)
+            break
+    return results
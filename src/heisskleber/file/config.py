@@ -1,11 +1,11 @@
 import json
 from collections.abc import Callable
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 from datetime import timezone, tzinfo
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from heisskleber.core import BaseConf
+from heisskleber.core import BaseConf, OverflowPolicy
 from heisskleber.core.packer import PackerError
 
 
@@ -63,10 +63,13 @@ class FileConf(BaseConf):
     rollover: int = 3600
     name_fmt: str = "%Y%m%d_%h%M%s.txt"
     batch_interval: int = 5
+    max_queue_size: int = 10_000  # lines buffered between two writes, 0 is unbounded
+    overflow: OverflowPolicy = "block"
     directory: str = "./"
     watchfile: str = ""
     format: str = "json"
     tz: tzinfo = timezone.utc
+    slotted_metadata: bool = False  # the reader returns Metadata instead of a dict, see heisskleber.core.Metadata
 
     def __post_init__(self) -> None:
         """Add csv helper class."""
@@ -94,7 +97,7 @@ class FileConf(BaseConf):
     @classmethod
     def from_dict(cls: type["FileConf"], config_dict: dict[str, Any]) -> "FileConf":
         """Create FileConf from dictionary."""
-        valid_fields = {f.name for f in fields(cls)}
+        valid_fields = cls._compiled().field_names
         filtered_dict = {k: v for k, v in config_dict.items() if k in valid_fields}
         filtered_dict["tz"] = ZoneInfo(filtered_dict.get("tz", "UTC"))
         return cls(**filtered_dict)
@@ -8,7 +8,8 @@ from typing import Any, TypeVar
 
 from watchfiles import Change, awatch
 
-from heisskleber.core import Receiver, Unpacker
+from heisskleber.core import Metadata, Receiver, Unpacker
+from heisskleber.core.unpacker import is_batched, record_size
 from heisskleber.file.config import FileConf
 
 T = TypeVar("T")
@@ -18,7 +19,9 @@ logger = logging.getLogger("heisskleber.mqtt")
 class FileReader(Receiver[T]):
     """Asynchronous File Reader.
 
-    Currently only reads bytes.
+    Currently only reads bytes. If the unpacker expects fixed-length records (see StructUnpacker),
+    only complete records are read, and unpackers of single records are called once per record.
+    With config.slotted_metadata, the metadata is a Metadata object with filepath, timestamp, sequence and transport.
     """
 
     def __init__(
@@ -40,6 +43,8 @@ class FileReader(Receiver[T]):
         Main mode of operation is to watch for added content in a file.
         """
         filesizes: dict[str, int] = {}  # currently only supports watching a single file
+        size = record_size(self.unpacker)
+        sequence = 0
         filesizes[self.config.watchfile] = Path(self.config.watchfile).stat().st_size  # get status quo of file
 
         async for changes in awatch(self.config.watchfile, stop_event=self._stop_event):
@@ -50,19 +55,43 @@ class FileReader(Receiver[T]):
                 current_size = path.stat().st_size
                 previous_size = filesizes.get(filepath, 0)
 
-                if current_size > previous_size:
-                    content = await self._async_read(path, previous_size)
-                    data, extra = self.unpacker(content)
-                    extra.update({"filepath": filepath, "timestamp": asyncio.get_running_loop().time()})
-                    yield (data, extra)
-
-                filesizes[filepath] = current_size
+                if current_size <= previous_size:
+                    filesizes[filepath] = current_size
+                    continue
 
-    async def _async_read(self, path: Path, start: int = 0) -> bytes:
+                length = current_size - previous_size
+                if size is not None:
+                    # only consume complete records, the remainder is read with the next change
+                    length -= length % size
+                    if not length:
+                        continue
+                content = await self._async_read(path, previous_size, length)
+                # unpackers of single records get every record of the chunk separately
+                chunks = (
+                    [content]
+                    if size is None or is_batched(self.unpacker)
+                    else [memoryview(content)[offset : offset + size] for offset in range(0, length, size)]
+                )
+                for chunk in chunks:
+                    data, extra = self.unpacker(chunk)
+                    timestamp = asyncio.get_running_loop().time()
+                    if self.config.slotted_metadata:
+                        sequence += 1
+                        meta = Metadata(
+                            extra, filepath=filepath, timestamp=timestamp, sequence=sequence, transport="file"
+                        )
+                        yield (data, meta)  # type: ignore[misc]
+                    else:
+                        extra.update({"filepath": filepath, "timestamp": timestamp})
+                        yield (data, extra)
+
+                filesizes[filepath] = previous_size + length
+
+    async def _async_read(self, path: Path, start: int = 0, length: int = -1) -> bytes:
         if self._current_file is None:
             self._current_file = await self._open_file(path)
         await self._loop.run_in_executor(self._executor, self._current_file.seek, start)
-        return await self._loop.run_in_executor(self._executor, self._current_file.read)
+        return await self._loop.run_in_executor(self._executor, self._current_file.read, length)
 
     async def _open_file(self, filename: Path) -> BufferedReader:
         """Open file asynchronously."""
@@ -2,14 +2,14 @@ import asyncio
 import contextlib
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import TextIOWrapper
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import IO, Any, TypeVar
 
-from heisskleber.core import Packer, PackerError, Sender
+from heisskleber.core import MessageBuffer, Metrics, Packer, PackerError, Sender
+from heisskleber.core.packer import packs_bytes
 from heisskleber.file.config import FileConf
 
 T = TypeVar("T")
@@ -35,6 +35,11 @@ class FileWriter(Sender[T]):
 
     Writes data to files with automatic rollover based on time intervals.
     Files are named according to the configured datetime format.
+    If the packer declares that it emits bytes, files are written in binary mode
+    and payloads are written without decoding them to str first.
+
+    Lines are buffered between writes in a queue of config.max_queue_size, and config.overflow
+    decides what happens if it is full. By default, send() waits for the next write once 10000 lines are queued.
     """
 
     def __init__(
@@ -53,25 +58,27 @@ class FileWriter(Sender[T]):
         self.base_path = Path(config.directory)
         self.config = config
         self.packer = packer or config.packer  # type: ignore [assignment]
-        self.header_func = header_func or config.header
+        self.header_func: Callable[[T], list[str]] | None = header_func or config.header  # type: ignore [assignment]
         self.newline = "\r\n" if config.format == "csv" else "\n"
         self.filename: Path = Path()
 
-        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._binary = packs_bytes(self.packer)
+        self._queue: MessageBuffer[str | bytes] = MessageBuffer(config.max_queue_size, config.overflow)
 
         self._executor = ThreadPoolExecutor(max_workers=1)
         self._loop = asyncio.get_running_loop()
         self._header: list[str] | None = None
         self._running = True
-        self._current_file: TextIOWrapper | None = None
+        self._current_file: IO[Any] | None = None
         self._background_task: asyncio.Task[None] | None = None
         self._last_rollover = 0.0
         self._file_lock = asyncio.Lock()
         self._batch_interval = self.config.batch_interval
 
-    async def _open_file(self, filename: Path) -> TextIOWrapper:
+    async def _open_file(self, filename: Path) -> IO[Any]:
         """Open file asynchronously."""
-        return await self._loop.run_in_executor(self._executor, lambda: filename.open(mode="a"))
+        mode = "ab" if self._binary else "a"
+        return await self._loop.run_in_executor(self._executor, lambda: filename.open(mode=mode))
 
     async def _close_file(self) -> None:
         if self._current_file is not None:
@@ -79,11 +86,12 @@ class FileWriter(Sender[T]):
             self._current_file = None
             await self._loop.run_in_executor(self._executor, file_to_close.close)
 
-    def _write_header(self) -> None:
+    async def _write_header(self) -> None:
+        """Write the header directly, so that it is never subject to the overflow policy of the queue."""
         if not self._header or not self._current_file:
             return
-        for line in self._header:
-            self._queue.put_nowait(line + self.newline)
+        lines = [(line + self.newline).encode() if self._binary else line + self.newline for line in self._header]
+        await self._loop.run_in_executor(self._executor, self._current_file.writelines, lines)
 
     async def _rollover(self) -> None:
         """Close current file and open a new one."""
@@ -93,7 +101,7 @@ class FileWriter(Sender[T]):
         self.filename.parent.mkdir(parents=True, exist_ok=True)
         self._current_file = await self._open_file(self.filename)
         self._last_rollover = self._loop.time()
-        self._write_header()
+        await self._write_header()
         logger.info("Rolled over to new file: %s", self.filename)
 
     async def _write_batch(self) -> None:
@@ -131,12 +139,43 @@ class FileWriter(Sender[T]):
 
         if not self._header and self.header_func is not None:
             self._header = self.header_func(data)
-            self._write_header()
+            await self._write_header()
+
+        await self._queue.put(self._format(data))
+
+    async def send_many(self, items: Iterable[T], **kwargs: Any) -> None:
+        """Write a batch of data to the current file.
+
+        All items are packed first and then inserted into the write queue at once.
+
+        Args:
+            items: Data to write, in order
+            **kwargs: Additional arguments (unused)
+
+        """
+        if not self._background_task:
+            await self.start()
+        if not self._running:
+            return
+
+        items = list(items)
+        if items and not self._header and self.header_func is not None:
+            self._header = self.header_func(items[0])
+            await self._write_header()
+
+        lines = [self._format(data) for data in items]
+        await self._queue.put_many(lines)  # only waits with the block policy
+
+    def _register_metrics(self, metrics: Metrics) -> None:
+        metrics.watch_buffer(self._queue)
 
+    def _format(self, data: T) -> str | bytes:
         payload = self.packer(data)
-        if isinstance(payload, bytes | bytearray):
-            payload = payload.decode()
-        await self._queue.put(payload + self.newline)
+        if self._binary:
+            return b"".join((payload, self.newline.encode()))  # type: ignore[arg-type]
+        if isinstance(payload, bytes | bytearray | memoryview):
+            payload = bytes(payload).decode()
+        return payload + self.newline
 
     async def start(self) -> None:
         """Start the file writer and rollover background task."""
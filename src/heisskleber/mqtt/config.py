@@ -5,7 +5,7 @@ from typing import Any
 
 from aiomqtt import Will
 
-from heisskleber.core import BaseConf
+from heisskleber.core import BaseConf, OverflowPolicy
 
 
 @dataclass
@@ -37,9 +37,16 @@ class MqttConf(BaseConf):
     qos: int = 0
     retain: bool = False
     max_saved_messages: int = 1000
+    overflow: OverflowPolicy | None = None  # None: receiver blocks, sender drops the oldest message
+    conflate: bool = False  # receivers keep only the newest message per topic, overrides overflow
     timeout: int = 60
     keep_alive: int = 60
     will: Will | None = None
+    slotted_metadata: bool = False  # receivers return Metadata instead of a dict, with topic, sequence and transport
+    timestamps: bool = False  # receivers add the arrival times to the metadata, see heisskleber.core.LatencyHistogram
+
+    # serialization
+    packstyle: str = "json"
 
     @classmethod
     def from_dict(cls, config_dict: dict[str, Any]) -> "MqttConf":
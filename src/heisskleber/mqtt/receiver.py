@@ -1,26 +1,42 @@
 import asyncio
 import logging
 import ssl
-from asyncio import Queue, Task, create_task
+from asyncio import Task, create_task
+from collections import deque
 from typing import Any, TypeVar
 
 import aiomqtt
 from aiomqtt import Client, Message, MqttError
 
-from heisskleber.core import Receiver, Unpacker, json_unpacker
-from heisskleber.core.utils import retry
+from heisskleber.core import MessageBuffer, Metadata, Metrics, Receiver, Unpacker, get_unpacker
+from heisskleber.core.latency import Arrival, arrival, stamp
+from heisskleber.core.retry import RetryPolicy
+from heisskleber.core.utils import drain_queue, unpack_each
 from heisskleber.mqtt import MqttConf
 
 T = TypeVar("T")
 logger = logging.getLogger("heisskleber.mqtt")
 
 
+def _topic(item: Message | tuple[Message, Arrival]) -> str:
+    message = item[0] if isinstance(item, tuple) else item
+    return message.topic.value
+
+
 class MqttReceiver(Receiver[T]):
     """Asynchronous MQTT subscriber based on aiomqtt.
 
     This class implements an asynchronous MQTT subscriber that handles connection, subscription, and message reception from an MQTT broker. It uses aiomqtt as the underlying MQTT client implementation.
 
     The subscriber maintains a queue of received messages which can be accessed through the `receive` method.
+    If the queue is full, config.overflow decides what happens. By default, the listener waits for free space.
+    The spill policy is not supported, because the queued aiomqtt messages can not be pickled.
+    With config.conflate, the queue keeps only the newest message per topic, so a slow consumer always gets
+    fresh data and the queue holds at most one message per topic. Messages are unpacked in receive(),
+    so replaced messages are never unpacked.
+    With config.slotted_metadata, the metadata is a Metadata object with topic, sequence and transport.
+    With config.timestamps, the listener takes the arrival times of every message before it is queued
+    and adds them to the metadata, see LatencyHistogram.
 
     Attributes:
         config (MqttConf): Stored configuration for MQTT connection.
@@ -32,7 +48,8 @@ class MqttReceiver(Receiver[T]):
         self,
         config: MqttConf,
         topic: str | list[str],
-        unpacker: Unpacker[T] = json_unpacker,  # type: ignore[assignment]
+        unpacker: Unpacker[T] | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """Initialize the MQTT source.
 
@@ -44,15 +61,32 @@ class MqttReceiver(Receiver[T]):
                 - password (str): Password for authentication
                 - qos (int): Default Quality of Service level
                 - max_saved_messages (int): Maximum queue size
+                - overflow (str): Overflow policy of the queue, "coalesce" keeps the latest message per topic,
+                  "spill" is not supported
             topic: Single topic string or list of topics to subscribe to
-            unpacker: Function to deserialize received messages, defaults to json_unpacker
+            unpacker: Function to deserialize received messages, defaults to the unpacker named by config.packstyle
+            retry_policy: Decides when to reconnect after the connection to the broker failed.
+                Defaults to exponential backoff with jitter from 1 up to 60 seconds, retrying forever.
+
+        Raises:
+            ValueError: If config.overflow is "spill".
 
         """
+        if config.overflow == "spill" and not config.conflate:
+            msg = "MqttReceiver can not spill aiomqtt messages, choose another overflow policy."
+            raise ValueError(msg)
         self.config = config
         self.topics = topic if isinstance(topic, list) else [topic]
-        self.unpacker = unpacker
-        self._message_queue: Queue[Message] = Queue(self.config.max_saved_messages)
+        self.unpacker = unpacker if unpacker is not None else get_unpacker(config.packstyle)
+        self._message_queue: MessageBuffer[Message | tuple[Message, Arrival]] = (
+            MessageBuffer(0, "coalesce", key=_topic)
+            if config.conflate
+            else MessageBuffer(config.max_saved_messages, config.overflow or "block", key=_topic)
+        )
+        self._backlog: deque[Message | tuple[Message, Arrival] | Exception] = deque()
         self._listener_task: Task[None] | None = None
+        self._sequence = 0
+        self.retry_policy = retry_policy or RetryPolicy(initial_delay=1.0, catch=MqttError, name=repr(self))
 
     async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
         """Receive and process the next message from the queue.
@@ -70,15 +104,61 @@ class MqttReceiver(Receiver[T]):
         if not self._listener_task:
             await self.start()
 
+        if self._backlog:
+            return unpack_each(self._backlog, self._unpack, 1)[0]
         message = await self._message_queue.get()
+        return self._unpack(message)
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Receive and process a batch of messages from the queue.
+
+        Waits for the next message, then drains all further queued messages in one pass.
+        Messages before one that fails to unpack are returned, its error is raised by the next call.
+
+        Arguments:
+            max_items: The maximum number of messages to return.
+            timeout: Seconds to wait for further messages if the queue runs empty before `max_items` are collected.
+            **kwargs: Not implemented.
+
+        Returns:
+            list[tuple[T, dict[str, Any]]]: The unpacked messages with their metadata, in order of arrival.
+
+        Raises:
+            TypeError: If a message payload is not of type bytes.
+            UnpackerError: If a message could not be unpacked with the unpacker protocol.
+
+        """
+        if not self._listener_task:
+            await self.start()
+
+        if not self._backlog:
+            messages = await drain_queue(self._message_queue, max_items, timeout)
+            self._backlog.extend(messages)
+        return unpack_each(self._backlog, self._unpack, max_items)
+
+    def _unpack(self, item: Message | tuple[Message, Arrival]) -> tuple[T, dict[str, Any]]:
+        message, arrived = item if isinstance(item, tuple) else (item, None)
         if not isinstance(message.payload, bytes):
             error_msg = "Payload is not of type bytes."
             raise TypeError(error_msg)
 
         data, extra = self.unpacker(message.payload)
-        extra["topic"] = message.topic.value
+        if self.config.slotted_metadata:
+            self._sequence += 1
+            meta = Metadata(extra, topic=message.topic.value, sequence=self._sequence, transport="mqtt")
+            extra = meta  # type: ignore[assignment]
+        else:
+            extra["topic"] = message.topic.value
+        if arrived is not None:
+            stamp(extra, arrived)
         return (data, extra)
 
+    def _register_metrics(self, metrics: Metrics) -> None:
+        metrics.watch_buffer(self._message_queue)
+        metrics.gauges["reconnects"] = lambda: max(self.retry_policy.stats.successes - 1, 0)
+
     def __repr__(self) -> str:
         """Return string representation of Mqtt Source class."""
         return f"{self.__class__.__name__}(broker={self.config.host}, port={self.config.port})"
@@ -115,9 +195,11 @@ class MqttReceiver(Receiver[T]):
         self.topics.append(topic)
         await self._client.subscribe(topic, qos)
 
-    @retry(every=1, catch=MqttError, logger_fn=logger.exception)
     async def _run(self) -> None:
-        """Background task for MQTT connection."""
+        """Background task for MQTT connection, reconnects according to the retry policy."""
+        await self.retry_policy.run(self._listen)
+
+    async def _listen(self) -> None:
         tls_params = (
             aiomqtt.TLSParameters(
                 ca_certs=None,
@@ -144,6 +226,8 @@ class MqttReceiver(Receiver[T]):
             self._client = client
             logger.info("subscribing to %(topics)s", {"topics": self.topics})
             await client.subscribe([(topic, self.config.qos) for topic in self.topics])
+            self.retry_policy.success()
 
+            timestamps = self.config.timestamps
             async for message in client.messages:
-                await self._message_queue.put(message)
+                await self._message_queue.put((message, arrival()) if timestamps else message)
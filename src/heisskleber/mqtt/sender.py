@@ -4,12 +4,14 @@ import asyncio
 import logging
 import ssl
 from asyncio import CancelledError, create_task
+from collections.abc import Iterable
+from operator import itemgetter
 from typing import Any, TypeVar
 
 import aiomqtt
 
-from heisskleber.core import Packer, Payload, Sender, json_packer
-from heisskleber.core.utils import retry
+from heisskleber.core import MessageBuffer, Metrics, Packer, Payload, Sender, get_packer
+from heisskleber.core.retry import RetryPolicy
 
 from .config import MqttConf
 
@@ -21,25 +23,36 @@ logger = logging.getLogger("heisskleber.mqtt")
 MQTT_TLS_PORT = 8883
 
 
+def _publishable(payload: Payload) -> str | bytes | bytearray:
+    return payload.tobytes() if isinstance(payload, memoryview) else payload  # paho-mqtt only publishes str and bytes
+
+
 class MqttSender(Sender[T]):
     """MQTT publisher with queued message handling.
 
     This sink implementation provides asynchronous MQTT publishing capabilities with automatic connection management and message queueing.
     Network operations are handled in a separate task.
+    If the queue is full, config.overflow decides what happens. By default, the oldest message is dropped.
 
     Attributes:
         config: MQTT configuration in a dataclass.
         packer: Callable to pack data from type T to bytes for transport.
+            Defaults to the packer named by config.packstyle.
+        retry_policy: Decides when to reconnect after the connection to the broker failed.
+            Defaults to exponential backoff with jitter from 5 up to 60 seconds, retrying forever.
 
     """
 
-    def __init__(self, config: MqttConf, packer: Packer[T] = json_packer) -> None:  # type: ignore[assignment]
+    def __init__(
+        self, config: MqttConf, packer: Packer[T] | None = None, retry_policy: RetryPolicy | None = None
+    ) -> None:
         self.config = config
-        self.packer = packer
-        self._send_queue: asyncio.Queue[tuple[Payload, str, int, bool]] = asyncio.Queue(
-            maxsize=config.max_saved_messages
+        self.packer = packer if packer is not None else get_packer(config.packstyle)
+        self._send_queue: MessageBuffer[tuple[str | bytes | bytearray, str, int, bool]] = MessageBuffer(
+            config.max_saved_messages, config.overflow or "drop_oldest", key=itemgetter(1)
         )
         self._sender_task: asyncio.Task[None] | None = None
+        self.retry_policy = retry_policy or RetryPolicy(initial_delay=5.0, catch=aiomqtt.MqttError, name=repr(self))
 
     async def send(self, data: T, topic: str = "mqtt", qos: int = 0, retain: bool = False, **kwargs: Any) -> None:
         """Queue data for asynchronous publication to the mqtt broker.
@@ -59,13 +72,43 @@ class MqttSender(Sender[T]):
             await self.start()
 
         payload = self.packer(data)
-        # emulate deque behavior
-        if self._send_queue.full():
-            _ = self._send_queue.get_nowait()
-        self._send_queue.put_nowait((payload, topic, qos, retain))
+        await self._enqueue(payload, topic, qos, retain)
+
+    async def send_many(
+        self, items: Iterable[T], topic: str = "mqtt", qos: int = 0, retain: bool = False, **kwargs: Any
+    ) -> None:
+        """Queue a batch of data for asynchronous publication to the mqtt broker.
+
+        All items are packed first and then inserted into the send queue at once.
+
+        Arguments:
+            items: The data to be published, in order.
+            topic: The mqtt topic to publish to.
+            qos: MQTT QOS level (0, 1, or 2). Defaults to 0.
+            retain: Whether to set the MQTT retain flag. Defaults to False.
+            **kwargs: Not implemented.
+
+        Raises:
+            PackerError: The data could not be serialized with the provided Packer. Nothing is queued in that case.
+
+        """
+        if not self._sender_task:
+            await self.start()
+
+        messages = [(_publishable(self.packer(data)), topic, qos, retain) for data in items]
+        await self._send_queue.put_many(messages)  # only waits with the block policy
+
+    async def _enqueue(self, payload: Payload, topic: str, qos: int, retain: bool) -> None:
+        await self._send_queue.put((_publishable(payload), topic, qos, retain))  # only waits with the block policy
+
+    def _register_metrics(self, metrics: Metrics) -> None:
+        metrics.watch_buffer(self._send_queue)
+        metrics.gauges["reconnects"] = lambda: max(self.retry_policy.stats.successes - 1, 0)
 
-    @retry(every=5, catch=aiomqtt.MqttError, logger_fn=logger.exception)
     async def _send_work(self) -> None:
+        await self.retry_policy.run(self._publish)
+
+    async def _publish(self) -> None:
         tls_params = (
             aiomqtt.TLSParameters(
                 ca_certs=None,
@@ -89,6 +132,7 @@ class MqttSender(Sender[T]):
             will=self.config.will,
             tls_params=tls_params,
         ) as client:
+            self.retry_policy.success()
             try:
                 while True:
                     payload, topic, qos, retain = await self._send_queue.get()
@@ -106,7 +150,7 @@ class MqttSender(Sender[T]):
     async def start(self) -> None:
         """Start the send queue in a separate task.
 
-        The task will retry connections every 5 seconds on failure.
+        The task reconnects on failure according to the retry policy.
         """
         self._sender_task = create_task(self._send_work())
 
@@ -0,0 +1,8 @@
+"""Record the messages of any receiver and replay them later, e.g. to benchmark a pipeline with real traffic."""
+
+from .config import ReplayConf
+from .log import LogReader, Record
+from .receiver import ReplayReceiver
+from .recorder import Recorder
+
+__all__ = ["LogReader", "Record", "Recorder", "ReplayConf", "ReplayReceiver"]
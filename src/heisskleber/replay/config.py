@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from heisskleber.core import BaseConf
+
+
+@dataclass
+class ReplayConf(BaseConf):
+    """Configuration of the ReplayReceiver."""
+
+    path: str = ""
+    speed: float = 1.0  # 1 replays in real time, 10 ten times faster, 0 as fast as possible
+    packstyle: str = "json"
+    timestamps: bool = False  # add the arrival times of the replay to the metadata, see LatencyHistogram
@@ -0,0 +1,106 @@
+"""Binary log format of recorded messages.
+
+A log starts with an 8 byte file header, the magic bytes b"HKLG" and the format version as little-endian u32.
+Every record consists of a 22 byte header, the topic and the payload:
+
+    arrival     f64  time.monotonic() of the arrival, the gaps between records are replayed
+    time        f64  time.time() of the arrival
+    topic_size  u16  size of the utf-8 encoded topic, 0 if the message had no topic
+    size        u32  size of the payload
+
+All integers and floats are little-endian.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+MAGIC = b"HKLG"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sI")
+RECORD_HEADER = struct.Struct("<ddHI")
+
+
+class Record(NamedTuple):
+    """A recorded message."""
+
+    arrival: float
+    time: float
+    topic: str | None
+    payload: bytes
+
+
+def encode_record(arrival: float, time: float, topic: str | None, payload: bytes | bytearray | memoryview) -> bytes:
+    """Return the header and topic of a record, the payload follows it."""
+    topic_bytes = topic.encode() if topic else b""
+    return RECORD_HEADER.pack(arrival, time, len(topic_bytes), len(payload)) + topic_bytes
+
+
+def write_header(file: BinaryIO) -> None:
+    """Write the file header to a new log."""
+    file.write(FILE_HEADER.pack(MAGIC, VERSION))
+
+
+class LogReader:
+    """Reads the records of a log through a memory map, so multi-gigabyte logs are not loaded into memory.
+
+    Arguments:
+        path: Path of the log.
+
+    Raises:
+        ValueError: If the file is not a log of a supported version.
+
+    Example:
+        >>> with LogReader("capture.hklog") as log:
+        ...     for record in log:
+        ...         print(record.topic, len(record.payload))
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.truncated = False
+        with self.path.open("rb") as file:
+            size = self.path.stat().st_size
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        header = self._map[: FILE_HEADER.size] if self._map is not None else b""
+        if len(header) < FILE_HEADER.size or FILE_HEADER.unpack(header)[0] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a heisskleber log.")
+        version = FILE_HEADER.unpack(header)[1]
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} has log format version {version}, only version {VERSION} is supported.")
+
+    def __iter__(self) -> Iterator[Record]:
+        """Iterate over the records. A truncated last record, e.g. of an interrupted recording, is skipped."""
+        data = self._map
+        if data is None:
+            return
+        offset = FILE_HEADER.size
+        end = len(data)
+        while offset + RECORD_HEADER.size <= end:
+            arrival, time, topic_size, size = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            offset = start + topic_size + size
+            if offset > end:
+                break
+            topic = data[start : start + topic_size].decode() if topic_size else None
+            yield Record(arrival, time, topic, data[start + topic_size : offset])
+        self.truncated = offset != end
+
+    def close(self) -> None:
+        """Close the memory map."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> "LogReader":  # noqa: PYI034
+        """Return the reader."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the reader."""
+        self.close()
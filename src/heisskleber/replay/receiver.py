@@ -0,0 +1,147 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from heisskleber.core import Receiver, Unpacker, get_unpacker
+from heisskleber.core.latency import arrival, stamp
+
+from .config import ReplayConf
+from .log import LogReader, Record
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+T = TypeVar("T")
+
+logger = logging.getLogger("heisskleber.replay")
+
+
+class ReplayReceiver(Receiver[T]):
+    """Replays the messages of a log written by the Recorder, keeping the gaps between their arrivals.
+
+    config.speed scales the replay, e.g. 10 replays ten times faster than recorded and 0 as fast as possible.
+    The log is read through a memory map, so multi-gigabyte logs are not loaded into memory.
+    The recorded payloads are unpacked with the unpacker, so a replay costs the same unpacking as the original.
+    The metadata holds the recorded "topic", if any, and "recorded_time", the time.time() of the original arrival.
+
+    Arguments:
+        config: The replay configuration.
+        unpacker: The unpacker of the recorded payloads, defaults to the unpacker named by config.packstyle.
+
+    Example:
+        >>> async with ReplayReceiver(ReplayConf(path="capture.hklog", speed=0)) as receiver:
+        ...     async for data, meta in receiver:
+        ...         await process(data, meta)
+
+    """
+
+    def __init__(self, config: ReplayConf, unpacker: Unpacker[T] | None = None) -> None:
+        if config.speed < 0:
+            raise ValueError(f"Replay speed must not be negative, got {config.speed}.")
+        self.config = config
+        self.unpacker = unpacker if unpacker is not None else get_unpacker(config.packstyle)
+        self._log: LogReader | None = None
+        self._records: Iterator[Record] = iter(())
+        self._next: Record | None = None
+        self._origin: tuple[float, float] | None = None  # loop time and recorded arrival of the first record
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Wait until the next recorded message is due and return it.
+
+        Raises:
+            StopAsyncIteration: At the end of the log, which ends an async for loop over the receiver.
+            UnpackerError: If the payload could not be unpacked.
+
+        """
+        record = self._peek()
+        delay = self._due(record) - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._unpack(self._take())
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Wait for the next recorded message, then return it with all further messages that are already due.
+
+        Arguments:
+            max_items: The maximum number of messages to return.
+            timeout: Seconds to wait for further messages to become due.
+            **kwargs: Not implemented.
+
+        Raises:
+            StopAsyncIteration: At the end of the log.
+            UnpackerError: If a payload could not be unpacked.
+
+        """
+        batch = [await self.receive()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(batch) < max_items:
+            try:
+                record = self._peek()
+            except StopAsyncIteration:
+                break
+            due = self._due(record)
+            if due > loop.time():
+                if due > deadline:
+                    break
+                await asyncio.sleep(due - loop.time())
+            batch.append(self._unpack(self._take()))
+        return batch
+
+    def _peek(self) -> Record:
+        if self._log is None:
+            self._open()
+        if self._next is None:
+            try:
+                self._next = next(self._records)
+            except StopIteration:
+                if self._log.truncated:  # type: ignore[union-attr]
+                    logger.warning("%(self)s: skipped the truncated last record of the log", {"self": self})
+                raise StopAsyncIteration from None
+        return self._next
+
+    def _take(self) -> Record:
+        record, self._next = self._next, None
+        return record  # type: ignore[return-value]
+
+    def _due(self, record: Record) -> float:
+        """Return the loop time at which the record is replayed."""
+        if self._origin is None:
+            self._origin = (asyncio.get_running_loop().time(), record.arrival)
+        if not self.config.speed:
+            return self._origin[0]
+        return self._origin[0] + (record.arrival - self._origin[1]) / self.config.speed
+
+    def _unpack(self, record: Record) -> tuple[T, dict[str, Any]]:
+        data, extra = self.unpacker(record.payload)
+        if record.topic is not None:
+            extra["topic"] = record.topic
+        extra["recorded_time"] = record.time
+        if self.config.timestamps:
+            stamp(extra, arrival())
+        return data, extra
+
+    def _open(self) -> None:
+        self._log = LogReader(self.config.path)
+        self._records = iter(self._log)
+        self._next = None
+        self._origin = None
+
+    async def start(self) -> None:
+        """Open the log. The replay starts with the first receive."""
+        if self._log is None:
+            self._open()
+
+    async def stop(self) -> None:
+        """Close the log. A later receive replays it again from the start."""
+        if self._log is not None:
+            self._records = iter(())
+            self._next = None
+            self._log.close()
+            self._log = None
+
+    def __repr__(self) -> str:
+        """Return string representation of the replay receiver."""
+        return f"{self.__class__.__name__}(path={self.config.path}, speed={self.config.speed})"
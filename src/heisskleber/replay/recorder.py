@@ -0,0 +1,200 @@
+"""Record the payloads of any receiver into a binary log."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, TypeVar
+
+from heisskleber.core import Receiver, UnpackerError
+from heisskleber.core.packer import as_buffer
+from heisskleber.core.unpacker import Payload
+
+from .log import encode_record, write_header
+
+T = TypeVar("T")
+
+logger = logging.getLogger("heisskleber.replay")
+
+_CODEC_ATTRIBUTES = ("unpacker", "unpack")
+
+
+class _CapturingUnpacker:
+    """Wraps the unpacker of the recorded receiver and keeps the payloads until the recorder takes them.
+
+    Other attributes of the wrapped unpacker, such as record_size, are passed through.
+    """
+
+    def __init__(self, unpacker: Any) -> None:
+        self.unpacker = unpacker
+        self.payloads: deque[tuple[float, float, bytes | bytearray | memoryview]] = deque()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.unpacker, name)
+
+    def __call__(self, payload: Payload) -> Any:
+        self.payloads.append((time.monotonic(), time.time(), as_buffer(payload)))
+        return self.unpacker(payload)
+
+
+class Recorder(Receiver[T]):
+    """Wraps a receiver and writes the raw payload, topic and arrival time of every received message to a log.
+
+    The payloads are taken from the unpacker of the wrapped receiver, so any receiver can be recorded as it is
+    configured. Messages are passed on unchanged. Payloads that fail to unpack are recorded as well.
+    The arrival times are taken from the metadata of receivers with enabled `timestamps`,
+    otherwise when the payload is unpacked. Replay the log with the ReplayReceiver.
+
+    Records are collected in memory and written by a background thread whenever `buffer_size` bytes are
+    collected, and when the recorder is stopped. If a write fails, e.g. because the disk is full,
+    its error is raised by the next receive and by stop().
+
+    Arguments:
+        receiver: The receiver to record.
+        path: Path of the log. An existing file is overwritten.
+        buffer_size: Number of bytes collected before they are written.
+
+    Raises:
+        TypeError: If the receiver has no unpacker attribute.
+
+    Example:
+        >>> async with Recorder(MqttReceiver(MqttConf(timestamps=True), topic="#"), "capture.hklog") as recorder:
+        ...     async for data, meta in recorder:
+        ...         await process(data, meta)
+
+    """
+
+    def __init__(self, receiver: Receiver[T], path: str | Path, buffer_size: int = 1 << 20) -> None:
+        self.receiver = receiver
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self.recorded = 0
+        for attribute in _CODEC_ATTRIBUTES:
+            if callable(receiver.__dict__.get(attribute)):
+                self._attribute = attribute
+                break
+        else:
+            raise TypeError(f"{receiver!r} has no unpacker to record payloads from.")
+        self._capture = _CapturingUnpacker(receiver.__dict__[self._attribute])
+        self._buffer = bytearray()
+        self._executor = ThreadPoolExecutor(max_workers=1)  # a single thread keeps the writes in order
+        self._writes: deque[asyncio.Future[int]] = deque()
+        self._file: IO[bytes] | None = None
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Receive a message from the wrapped receiver and record it.
+
+        Raises:
+            OSError: If an earlier write to the log failed.
+
+        """
+        if self._file is None:
+            await self.start()
+        self._check_writes()
+        try:
+            data, meta = await self.receiver.receive(**kwargs)
+        except UnpackerError:
+            self._record_failed()
+            raise
+        self._record([meta])
+        return data, meta
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Receive a batch of messages from the wrapped receiver and record them.
+
+        Raises:
+            OSError: If an earlier write to the log failed.
+
+        """
+        if self._file is None:
+            await self.start()
+        self._check_writes()
+        try:
+            batch = await self.receiver.receive_many(max_items, timeout, **kwargs)
+        except UnpackerError:
+            self._record_failed()
+            raise
+        self._record([meta for _, meta in batch])
+        return batch
+
+    def _record(self, metas: list[dict[str, Any]]) -> None:
+        payloads = self._capture.payloads
+        if len(payloads) != len(metas):
+            # e.g. the wrapped receiver unpacked a message that it did not return
+            logger.warning(
+                "%(self)s: got %(payloads)d payloads for %(messages)d messages, recording the payloads without topics",
+                {"self": self, "payloads": len(payloads), "messages": len(metas)},
+            )
+            self._record_failed()
+            return
+        for meta in metas:
+            arrival, wall, payload = payloads.popleft()
+            self._write(meta.get("arrival", arrival), meta.get("arrival_time", wall), meta.get("topic"), payload)
+
+    def _record_failed(self) -> None:
+        """Record the captured payloads without topics, e.g. of a message that failed to unpack."""
+        payloads = self._capture.payloads
+        while payloads:
+            arrival, wall, payload = payloads.popleft()
+            self._write(arrival, wall, None, payload)
+
+    def _write(self, arrival: float, wall: float, topic: str | None, payload: bytes | bytearray | memoryview) -> None:
+        buffer = self._buffer
+        buffer += encode_record(arrival, wall, topic, payload)
+        buffer += payload
+        self.recorded += 1
+        if len(buffer) >= self.buffer_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer or self._file is None:
+            return
+        chunk, self._buffer = bytes(self._buffer), bytearray()
+        self._writes.append(asyncio.get_running_loop().run_in_executor(self._executor, self._file.write, chunk))
+
+    def _check_writes(self) -> None:
+        """Forget the completed writes and raise the error of the first failed one."""
+        writes = self._writes
+        while writes and writes[0].done():
+            writes.popleft().result()
+
+    async def start(self) -> None:
+        """Open the log and start the wrapped receiver."""
+        if self._file is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._file = await loop.run_in_executor(self._executor, self.path.open, "wb")
+        await loop.run_in_executor(self._executor, write_header, self._file)
+        setattr(self.receiver, self._attribute, self._capture)
+        await self.receiver.start()
+
+    async def stop(self) -> None:
+        """Stop the wrapped receiver, restore its unpacker and write the remaining records.
+
+        Raises:
+            OSError: If a write to the log failed.
+
+        """
+        await self.receiver.stop()
+        setattr(self.receiver, self._attribute, self._capture.unpacker)
+        if self._file is None:
+            return
+        self._flush()
+        file, self._file = self._file, None
+        writes, self._writes = self._writes, deque()
+        try:
+            results = await asyncio.gather(*writes, return_exceptions=True)
+        finally:
+            await asyncio.get_running_loop().run_in_executor(self._executor, file.close)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        logger.info("%(self)s recorded %(count)d messages", {"self": self, "count": self.recorded})
+
+    def __repr__(self) -> str:
+        """Return string representation of the recorder."""
+        return f"{self.__class__.__name__}({self.receiver!r}, path={self.path})"
@@ -15,6 +15,11 @@ class SerialConf(BaseConf):
       encoding: The string encoding of the messages. Defaults to ascii.
       parity: The parity checking value. One of "N" for none, "E" for even, "O" for odd. Defaults to None.
       stopbits: Stopbits. One of 1, 2 or 1.5. Defaults to 1.
+      termination_char: The end of a line. Defaults to a newline.
+      framing: Splits the stream into frames, one of heisskleber.core.FRAMINGS, "delimiter" ends frames with
+        termination_char. Defaults to None, i.e. lines are read with termination_char.
+      timestamps: Add the arrival times of every message to its metadata, see heisskleber.core.LatencyHistogram.
+        Defaults to False.
 
     Note:
       stopbits 1.5 is not yet implemented.
@@ -28,3 +33,5 @@ class SerialConf(BaseConf):
     parity: Literal["N", "O", "E"] = "N"  # definitions from serial.PARTITY_'N'ONE / 'O'DD / 'E'VEN
     stopbits: Literal[1, 2] = 1  # 1.5 not yet implemented
     termination_char: bytes = b"\n"
+    framing: str | None = None
+    timestamps: bool = False
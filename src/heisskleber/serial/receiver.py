@@ -1,11 +1,15 @@
 import asyncio
 import logging
+from collections import deque
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, TypeVar
 
 import serial  # type: ignore[import-untyped]
 
-from heisskleber.core import Receiver, Unpacker
+from heisskleber.core import Receiver, Unpacker, create_framer
+from heisskleber.core.latency import Arrival, arrival, stamp
+from heisskleber.core.unpacker import is_batched, record_size
 
 from .config import SerialConf
 
@@ -19,6 +23,11 @@ class SerialReceiver(Receiver[T]):
     This class implements the AsyncSource interface for reading data from a serial port.
     It uses a thread pool executor to perform blocking I/O operations asynchronously.
 
+    With config.framing, all bytes waiting in the input buffer are read at once and split into frames,
+    instead of reading lines byte by byte.
+    With config.timestamps, the arrival times are taken in the reading thread when the read returns,
+    and added to the metadata, see heisskleber.core.LatencyHistogram.
+
     Attributes:
         config: Configuration for the serial port.
         unpacker: Function to unpack received data.
@@ -33,6 +42,9 @@ class SerialReceiver(Receiver[T]):
         self._lock = asyncio.Lock()
         self._is_connected = False
         self._cancel_read_timeout = 1
+        self.framer = create_framer(config.framing, config.termination_char) if config.framing else None
+        self._frames: deque[bytes] = deque()
+        self._frames_arrival: Arrival | None = None  # all pending frames were completed by the same read
 
     async def receive(  # noqa: D417
         self, *, termination_char: bytes | None = None, read_bytes: int = -1, **kwargs: Any
@@ -42,6 +54,12 @@ class SerialReceiver(Receiver[T]):
         This method reads a line from the serial port, unpacks it, and returns the data.
         If the serial port is not connected, it will attempt to connect first.
 
+        If the unpacker expects fixed-length records (see StructUnpacker) and neither termination_char
+        nor read_bytes is passed, a single record is read instead of a line. Batched unpackers
+        (see StructBatchUnpacker) get all complete records that are waiting in the input buffer.
+        Otherwise, if config.framing is set and neither termination_char nor read_bytes is passed,
+        the next frame is returned.
+
         Arguments:
             termination_char: Line termination character that signals the message end.
             read_bytes: Number of bytes to read. Defaults to -1, i.e. infinite.
@@ -59,21 +77,48 @@ class SerialReceiver(Receiver[T]):
         # Use config termination char by default, overwrite with passed termination char
         expected_line_termintation = termination_char or self.config.termination_char
 
+        size = record_size(self.unpacker)
+        loop = asyncio.get_running_loop()
         try:
-            payload = await asyncio.get_running_loop().run_in_executor(
-                self._executor, self._ser.read_until, expected_line_termintation, read_bytes
-            )
+            if size is not None and termination_char is None and read_bytes < 0:
+                payload, arrived = await loop.run_in_executor(self._executor, self._read, self._read_records, size)
+            elif self.framer is not None and termination_char is None and read_bytes < 0:
+                while not self._frames:
+                    chunk, self._frames_arrival = await loop.run_in_executor(
+                        self._executor, self._read, self._read_waiting
+                    )
+                    self._frames.extend(self.framer.feed(chunk))
+                payload, arrived = self._frames.popleft(), self._frames_arrival
+            else:
+                payload, arrived = await loop.run_in_executor(
+                    self._executor, self._read, self._ser.read_until, expected_line_termintation, read_bytes
+                )
         except asyncio.CancelledError:
             await asyncio.shield(self._cancel_read())
             raise
 
         data, extra = self.unpacker(payload=payload)
+        if arrived is not None:
+            stamp(extra, arrived)
         logger.debug(
             "SerialSource(%(port)s): Unpacked: %(data)s, extra information: %(extra)s",
             {"port": self.config.port, "data": data, "extra": extra},
         )
         return (data, extra)
 
+    def _read(self, read: Callable[..., bytes], *args: Any) -> tuple[bytes, Arrival | None]:
+        """Call a read function of the serial port and take the arrival times when it returns, in the thread."""
+        payload = read(*args)
+        return payload, arrival() if self.config.timestamps else None
+
+    def _read_waiting(self) -> bytes:
+        """Read all waiting bytes, waiting for at least one."""
+        return self._ser.read(max(self._ser.in_waiting, 1))  # type: ignore[no-any-return]
+
+    def _read_records(self, size: int) -> bytes:
+        count = max(self._ser.in_waiting // size, 1) if is_batched(self.unpacker) else 1
+        return self._ser.read(count * size)  # type: ignore[no-any-return]
+
     async def _cancel_read(self) -> None:
         if not hasattr(self, "_ser"):
             return
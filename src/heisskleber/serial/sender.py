@@ -1,12 +1,14 @@
 """Asynchronous sink implementation for sending data via serial port."""
 
 import asyncio
+from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, TypeVar
 
 import serial  # type: ignore[import-untyped]
 
-from heisskleber.core import Packer, Sender
+from heisskleber.core import Packer, Payload, Sender, create_framer
+from heisskleber.core.packer import as_buffer
 
 from .config import SerialConf
 
@@ -18,6 +20,7 @@ class SerialSender(Sender[T]):
 
     This class implements the AsyncSink interface for writing data to a serial port.
     It uses a thread pool executor to perform blocking I/O operations asynchronously.
+    With config.framing, the packed payloads are framed, e.g. COBS encoded.
 
     Attributes:
         config: Configuration for the serial port.
@@ -33,6 +36,7 @@ class SerialSender(Sender[T]):
         self._lock = asyncio.Lock()
         self._is_connected = False
         self._cancel_write_timeout = 1
+        self.framer = create_framer(config.framing, config.termination_char) if config.framing else None
 
     async def send(self, data: T, **kwargs: dict[str, Any]) -> None:
         """Send data to the serial port.
@@ -53,8 +57,7 @@ class SerialSender(Sender[T]):
         if not self._is_connected:
             await self.start()
 
-        payload = self.packer(data)
-        payload = payload.encode() if isinstance(payload, str) else payload
+        payload = self._frame(self.packer(data))
         try:
             await asyncio.get_running_loop().run_in_executor(self._executor, self._ser.write, payload)
             await asyncio.get_running_loop().run_in_executor(self._executor, self._ser.flush)
@@ -62,6 +65,35 @@ class SerialSender(Sender[T]):
             await asyncio.shield(self._cancel_write())
             raise
 
+    async def send_many(self, items: Iterable[T], **kwargs: dict[str, Any]) -> None:
+        """Send a batch of data to the serial port.
+
+        All items are packed and concatenated, then written with a single write call and flushed once.
+
+        Arguments:
+            items: The data to be sent, in order.
+            **kwargs: Not implemented.
+
+        Raises:
+            PackerError: If data could not be packed to bytes with the provided packer.
+
+        """
+        if not self._is_connected:
+            await self.start()
+
+        payloads = [self.packer(data) for data in items]
+        buffer = b"".join(self._frame(payload) for payload in payloads)
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._ser.write, buffer)
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._ser.flush)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._cancel_write())
+            raise
+
+    def _frame(self, payload: Payload) -> bytes | bytearray | memoryview:
+        buffer = as_buffer(payload)
+        return self.framer.encode(buffer) if self.framer is not None else buffer
+
     async def _cancel_write(self) -> None:
         if not hasattr(self, "_ser"):
             return
@@ -0,0 +1,699 @@
+"""Composable operators over receivers.
+
+Every operator wraps a receiver and is a receiver itself, so operators chain into each other, into
+`async for` loops and into the pipeline:
+
+    >>> readings = Throttle(Filter(MqttReceiver(config, topic="sensors/#"), lambda data, meta: "temp" in data), 1.0)
+    >>> async with Batch(readings, size=100, timeout=0.5) as batches:
+    ...     async for data, meta in batches:
+    ...         await sender.send(data, **topic_kwargs(meta))
+
+Starting or stopping an operator starts or stops the wrapped receiver. The operators run in the task that
+receives from them and create no task per message. They process the batches of receive_many() of the wrapped
+receiver where they can, so buffered receivers drain their queue in one pass. Waits with a deadline, of Window,
+Debounce and Aggregate, leave a receive_many() call that is still running at the deadline to the next call
+instead of cancelling it, so receivers without a queue lose no data.
+"""
+
+import asyncio
+import inspect
+import math
+import operator
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+from heisskleber.core import Receiver
+from heisskleber.core.pipeline import Item, Transform, topic_kwargs
+
+T = TypeVar("T")
+
+Predicate = Callable[[Any, dict[str, Any]], bool | Awaitable[bool]]
+Key = Callable[[Any, dict[str, Any]], Any]
+
+
+def _collect(messages: list[Item]) -> Item:
+    """Combine messages into one: the list of their data and metadata with "count", "messages" and a shared "topic"."""
+    meta: dict[str, Any] = {"count": len(messages), "messages": [meta for _, meta in messages]}
+    topics = {meta.get("topic") for _, meta in messages}
+    if len(topics) == 1:
+        meta.update(topic_kwargs(messages[0][1]))
+    return [data for data, _ in messages], meta
+
+
+class Operator(Receiver[T]):
+    """Base class of the stream operators, a receiver that wraps another receiver.
+
+    Subclasses implement receive(), and receive_many() if they can process a batch of the wrapped receiver.
+    Operators that wait for a batch only until a deadline use _receive_batch_within(), which does not cancel
+    a receive_many() call of the wrapped receiver that is still running at the deadline, as it may already have
+    read data, but returns its batch from the next call.
+
+    Arguments:
+        source: The wrapped receiver.
+
+    """
+
+    def __init__(self, source: Receiver[Any]) -> None:
+        self.source = source
+        self._pending_batch: asyncio.Task[list[Item]] | None = None
+
+    async def _receive_batch(self, max_items: int, **kwargs: Any) -> list[Item]:
+        """Return the batch left running by _receive_batch_within(), or receive the next batch."""
+        receiving = self._pending_batch
+        if receiving is None:
+            return await self.source.receive_many(max_items, **kwargs)
+        await asyncio.wait({receiving})
+        self._pending_batch = None
+        return receiving.result()
+
+    async def _receive_batch_within(self, max_items: int, timeout: float, **kwargs: Any) -> list[Item] | None:
+        """Return the next batch, or None if none arrives within timeout seconds."""
+        receiving = self._pending_batch
+        if receiving is None:
+            receiving = asyncio.ensure_future(self.source.receive_many(max_items, **kwargs))
+            self._pending_batch = receiving
+        await asyncio.wait({receiving}, timeout=timeout)
+        if not receiving.done():
+            return None
+        self._pending_batch = None
+        return receiving.result()
+
+    async def start(self) -> None:
+        """Start the wrapped receiver."""
+        await self.source.start()
+
+    async def stop(self) -> None:
+        """Stop the wrapped receiver."""
+        if self._pending_batch is not None:
+            self._pending_batch.cancel()
+            self._pending_batch = None
+        await self.source.stop()
+
+    def _arguments(self) -> str:
+        return ""
+
+    def __repr__(self) -> str:
+        """Return string representation of the operator and the wrapped receiver."""
+        arguments = self._arguments()
+        return f"{self.__class__.__name__}({self.source!r}{', ' if arguments else ''}{arguments})"
+
+
+class Map(Operator[Any]):
+    """Transforms every message, like a pipeline Stage.
+
+    Arguments:
+        source: The wrapped receiver.
+        func: Called with (data, metadata) of every message, sync or async.
+            Returns the transformed (data, metadata) tuple, or None to drop the message.
+
+    """
+
+    def __init__(self, source: Receiver[Any], func: Transform) -> None:
+        super().__init__(source)
+        self.func = func
+
+    async def _apply(self, data: Any, meta: dict[str, Any]) -> Item | None:
+        result = self.func(data, meta)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def receive(self, **kwargs: Any) -> Item:
+        """Receive the next message that is not dropped by func and return its transformed tuple."""
+        while True:
+            result = await self._apply(*await self.source.receive(**kwargs))
+            if result is not None:
+                return result
+
+    async def receive_many(self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any) -> list[Item]:
+        """Transform a batch of the wrapped receiver, until at least one message is not dropped."""
+        while True:
+            batch = [
+                await self._apply(data, meta)
+                for data, meta in await self.source.receive_many(max_items, timeout, **kwargs)
+            ]
+            results = [result for result in batch if result is not None]
+            if results:
+                return results
+
+    def _arguments(self) -> str:
+        return getattr(self.func, "__name__", repr(self.func))
+
+
+class Filter(Operator[T]):
+    """Passes only the messages for which the predicate is true.
+
+    Arguments:
+        source: The wrapped receiver.
+        predicate: Called with (data, metadata) of every message, sync or async.
+
+    """
+
+    def __init__(self, source: Receiver[T], predicate: Predicate) -> None:
+        super().__init__(source)
+        self.predicate = predicate
+
+    async def _test(self, data: Any, meta: dict[str, Any]) -> bool:
+        result = self.predicate(data, meta)
+        if inspect.isawaitable(result):
+            result = await result
+        return bool(result)
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Receive the next message that passes the predicate."""
+        while True:
+            data, meta = await self.source.receive(**kwargs)
+            if await self._test(data, meta):
+                return data, meta
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Filter a batch of the wrapped receiver, until at least one message passes."""
+        while True:
+            batch = await self.source.receive_many(max_items, timeout, **kwargs)
+            passed = [(data, meta) for data, meta in batch if await self._test(data, meta)]
+            if passed:
+                return passed
+
+    def _arguments(self) -> str:
+        return getattr(self.predicate, "__name__", repr(self.predicate))
+
+
+class Take(Operator[T]):
+    """Passes the first `count` messages, then ends the stream.
+
+    Arguments:
+        source: The wrapped receiver.
+        count: Number of messages to pass.
+
+    Raises:
+        ValueError: If count is negative.
+
+    """
+
+    def __init__(self, source: Receiver[T], count: int) -> None:
+        if count < 0:
+            raise ValueError(f"Count must not be negative, got {count}.")
+        super().__init__(source)
+        self.count = count
+        self.taken = 0
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Receive the next message.
+
+        Raises:
+            StopAsyncIteration: After `count` messages, which ends an async for loop over the operator.
+
+        """
+        if self.taken >= self.count:
+            raise StopAsyncIteration
+        item = await self.source.receive(**kwargs)
+        self.taken += 1
+        return item
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Receive a batch of at most the remaining number of messages.
+
+        Raises:
+            StopAsyncIteration: After `count` messages.
+
+        """
+        remaining = self.count - self.taken
+        if remaining <= 0:
+            raise StopAsyncIteration
+        batch = await self.source.receive_many(min(max_items, remaining), timeout, **kwargs)
+        self.taken += len(batch)
+        return batch
+
+    def _arguments(self) -> str:
+        return f"count={self.count}"
+
+
+class Batch(Operator[list[Any]]):
+    """Collects messages into batches of up to `size` messages.
+
+    A batch is returned when it is full or `timeout` seconds after its first message arrived. The data of a batch
+    is the list of the data of its messages. The metadata holds the number of messages as "count", their
+    metadata as "messages" and their "topic", if all messages share one.
+
+    Arguments:
+        source: The wrapped receiver.
+        size: The maximum number of messages per batch.
+        timeout: Seconds to wait for further messages after the first message of a batch.
+
+    """
+
+    def __init__(self, source: Receiver[Any], size: int, timeout: float = 0.0) -> None:
+        if size < 1:
+            raise ValueError(f"Batch size must be positive, got {size}.")
+        super().__init__(source)
+        self.size = size
+        self.timeout = timeout
+
+    async def receive(self, **kwargs: Any) -> tuple[list[Any], dict[str, Any]]:
+        """Receive the next batch."""
+        return _collect(await self.source.receive_many(self.size, self.timeout, **kwargs))
+
+    def _arguments(self) -> str:
+        return f"size={self.size}, timeout={self.timeout}"
+
+
+class Window(Operator[list[Any]]):
+    """Collects the messages of tumbling time windows.
+
+    Windows are aligned to the wall clock, e.g. windows of 10 seconds start at full 10 seconds of time.time().
+    A window is returned when it ends, if any message arrived in it. Data and metadata are those of a Batch,
+    with the additional metadata "window_start" and "window_end", the time.time() bounds of the window.
+
+    Arguments:
+        source: The wrapped receiver.
+        seconds: The length of a window.
+        max_items: The maximum number of messages per window, further messages are returned in another batch
+            with the same window bounds.
+
+    """
+
+    def __init__(self, source: Receiver[Any], seconds: float, max_items: int = 100_000) -> None:
+        if seconds <= 0:
+            raise ValueError(f"Window length must be positive, got {seconds}.")
+        super().__init__(source)
+        self.seconds = seconds
+        self.max_items = max_items
+
+    async def receive(self, **kwargs: Any) -> tuple[list[Any], dict[str, Any]]:
+        """Receive the messages of the next window.
+
+        Raises:
+            StopAsyncIteration: At the end of the stream, after the current window was returned.
+
+        """
+        messages = await self._receive_batch(self.max_items, **kwargs)
+        start = math.floor(time.time() / self.seconds) * self.seconds
+        end = start + self.seconds
+        while len(messages) < self.max_items and (remaining := end - time.time()) > 0:
+            try:
+                batch = await self._receive_batch_within(self.max_items - len(messages), remaining, **kwargs)
+            except StopAsyncIteration:
+                break
+            if batch is None:
+                break
+            messages += batch
+        data, meta = _collect(messages)
+        meta["window_start"], meta["window_end"] = start, end
+        return data, meta
+
+    def _arguments(self) -> str:
+        return f"seconds={self.seconds}"
+
+
+class Throttle(Operator[T]):
+    """Passes at most one message per `interval` seconds and drops the messages in between.
+
+    Arguments:
+        source: The wrapped receiver.
+        interval: Minimum seconds between two passed messages.
+
+    Attributes:
+        dropped: Number of dropped messages.
+
+    """
+
+    def __init__(self, source: Receiver[T], interval: float) -> None:
+        super().__init__(source)
+        self.interval = interval
+        self.dropped = 0
+        self._next = -math.inf
+
+    def _passes(self) -> bool:
+        now = time.monotonic()
+        if now < self._next:
+            self.dropped += 1
+            return False
+        self._next = now + self.interval
+        return True
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Receive the next message that arrives at least `interval` seconds after the last passed one."""
+        while True:
+            item = await self.source.receive(**kwargs)
+            if self._passes():
+                return item
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Throttle a batch of the wrapped receiver, until at least one message passes.
+
+        The messages of a batch are taken at once, so at most one message of a batch passes.
+        """
+        while True:
+            passed = [item for item in await self.source.receive_many(max_items, timeout, **kwargs) if self._passes()]
+            if passed:
+                return passed
+
+    def _arguments(self) -> str:
+        return f"interval={self.interval}"
+
+
+class Debounce(Operator[T]):
+    """Passes a message once no newer message arrived for `quiet` seconds, and drops the messages it replaces.
+
+    A burst of messages passes as its last message, `quiet` seconds after the burst. At the end of the stream,
+    the last message is passed right away.
+
+    Arguments:
+        source: The wrapped receiver.
+        quiet: Seconds without a newer message before a message passes.
+
+    Attributes:
+        dropped: Number of dropped messages.
+
+    """
+
+    def __init__(self, source: Receiver[T], quiet: float) -> None:
+        super().__init__(source)
+        self.quiet = quiet
+        self.dropped = 0
+        self._pending: tuple[T, dict[str, Any]] | None = None
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Receive the last message of the next burst."""
+        if self._pending is None:
+            batch = await self._receive_batch(100, **kwargs)
+            self.dropped += len(batch) - 1
+            self._pending = batch[-1]
+        while True:
+            try:
+                burst = await self._receive_batch_within(100, self.quiet, **kwargs)
+            except StopAsyncIteration:
+                break
+            if burst is None:
+                break
+            self.dropped += len(burst)
+            self._pending = burst[-1]
+        item, self._pending = self._pending, None
+        return item
+
+    def _arguments(self) -> str:
+        return f"quiet={self.quiet}"
+
+
+class Distinct(Operator[T]):
+    """Drops messages whose key equals the key of one of the last `maxsize` passed messages.
+
+    With the default maxsize of 1, only repetitions of the previous message are dropped, e.g. of a sensor
+    that reports an unchanged state. Keys are compared by equality, so dicts can be keys.
+
+    Arguments:
+        source: The wrapped receiver.
+        key: Called with (data, metadata) of every message, defaults to the data.
+        maxsize: Number of passed keys that are remembered.
+
+    Attributes:
+        dropped: Number of dropped messages.
+
+    """
+
+    def __init__(self, source: Receiver[T], key: Key | None = None, maxsize: int = 1) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}.")
+        super().__init__(source)
+        self.key = key
+        self.dropped = 0
+        self._seen: deque[Any] = deque(maxlen=maxsize)
+
+    def _passes(self, data: Any, meta: dict[str, Any]) -> bool:
+        key = data if self.key is None else self.key(data, meta)
+        if key in self._seen:
+            self.dropped += 1
+            return False
+        self._seen.append(key)
+        return True
+
+    async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+        """Receive the next message with a new key."""
+        while True:
+            data, meta = await self.source.receive(**kwargs)
+            if self._passes(data, meta):
+                return data, meta
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Drop the repeated messages of a batch of the wrapped receiver, until at least one message passes."""
+        while True:
+            batch = await self.source.receive_many(max_items, timeout, **kwargs)
+            passed = [(data, meta) for data, meta in batch if self._passes(data, meta)]
+            if passed:
+                return passed
+
+    def _arguments(self) -> str:
+        return f"maxsize={self._seen.maxlen}"
+
+
+STATISTICS = ("count", "sum", "mean", "min", "max", "rms")
+
+
+class _Pane:
+    """Running statistics per field of the messages of one step of an aggregation window."""
+
+    __slots__ = ("fields", "messages", "topics")
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.fields: dict[str, list[float]] = {}  # count, sum, sum of squares, min, max
+        self.topics: set[Any] = set()
+
+    def merge(self, field: str, values: Sequence[float]) -> None:
+        """Merge count, sum, sum of squares, min and max of a field."""
+        stats = self.fields.get(field)
+        if stats is None:
+            self.fields[field] = list(values)
+            return
+        count, total, squares, low, high = values
+        stats[0] += count
+        stats[1] += total
+        stats[2] += squares
+        stats[3] = min(stats[3], low)
+        stats[4] = max(stats[4], high)
+
+
+class Aggregate(Operator[dict[str, Any]]):
+    """Downsamples a stream of dictionaries to statistics of their numeric fields per window.
+
+    Windows span either `seconds`, aligned to the wall clock, or `count` messages. A new window is returned
+    every `step`, which defaults to the window length, i.e. tumbling windows. A shorter step gives sliding
+    windows, e.g. seconds=10, step=1 returns the statistics of the last 10 seconds every second. The window
+    length must be a multiple of the step. Statistics are kept per step and merged for the returned window,
+    so a sample is added once, no matter how many windows it is part of.
+
+    The data of a window holds "<field>_<statistic>" for every numeric field, e.g. {"x_mean": 0.1, "x_max": 0.4}.
+    The metadata holds the number of messages as "count", their "topic", if all messages share one, and, for
+    time windows, "window_start" and "window_end" as time.time(). Time windows without messages are not returned.
+    At the end of the stream, the current window is returned right away.
+
+    Arguments:
+        source: The wrapped receiver of dictionaries.
+        seconds: The length of a time window.
+        count: The number of messages of a count window.
+        step: Seconds or messages between two returned windows, defaults to the window length.
+        fields: The fields to aggregate, defaults to all numeric fields.
+        stats: The statistics of every field, any of "count" (of the values), "sum", "mean", "min", "max" and "rms".
+        numpy: Aggregate each batch of the wrapped receiver with vectorized NumPy operations. Fields may then also
+            be arrays, such as the columns of the StructBatchUnpacker, and the data may be a structured array.
+        max_items: The maximum number of messages taken from the wrapped receiver at once.
+
+    Raises:
+        ValueError: If not exactly one of seconds and count is given, the window length is not a multiple of
+            the step or a statistic is unknown.
+        ImportError: If numpy is requested but not installed.
+
+    Example:
+        >>> imu = SerialReceiver(SerialConf(port="/dev/ttyUSB0", baudrate=921600))
+        >>> async with Aggregate(imu, seconds=1.0, fields=["ax", "ay", "az"]) as aggregate:
+        ...     async for data, meta in aggregate:
+        ...         await mqtt.send(data, topic="imu/1hz")
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        source: Receiver[Any],
+        seconds: float | None = None,
+        *,
+        count: int | None = None,
+        step: float | None = None,
+        fields: Sequence[str] | None = None,
+        stats: Sequence[str] = ("mean", "min", "max", "rms"),
+        numpy: bool = False,
+        max_items: int = 1000,
+    ) -> None:
+        if (seconds is None) == (count is None):
+            raise ValueError("Give either the seconds or the count of a window.")
+        length = seconds if seconds is not None else count
+        if length is None or length <= 0 or (step is not None and step <= 0):
+            raise ValueError(f"Window length and step must be positive, got {length} and {step}.")
+        step = length if step is None else step
+        panes = round(length / step)
+        if panes < 1 or not math.isclose(panes * step, length) or (count is not None and step != int(step)):
+            raise ValueError(f"The window length {length} must be a multiple of the step {step}.")
+        unknown = set(stats) - set(STATISTICS)
+        if unknown:
+            raise ValueError(f"Unknown statistics {sorted(unknown)}, choose from {', '.join(STATISTICS)}.")
+        if numpy:
+            import numpy as np
+
+            self._np = np
+        super().__init__(source)
+        self.seconds = seconds
+        self.count = count
+        self.step = step
+        self.fields = frozenset(fields) if fields is not None else None
+        self.stats = tuple(stats)
+        self.numpy = numpy
+        self.max_items = max_items
+        self._length = length
+        self._panes: deque[_Pane] = deque(maxlen=panes)
+        self._current = _Pane()
+        self._end: float | None = None  # time.time() at which the current step of a time window ends
+
+    async def receive(self, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Receive messages until the next window is complete and return its statistics.
+
+        Raises:
+            StopAsyncIteration: At the end of the stream, after the current window was returned.
+
+        """
+        try:
+            if self.count is not None:
+                return await self._receive_count(**kwargs)
+            return await self._receive_time(**kwargs)
+        except StopAsyncIteration:
+            if not self._current.messages:
+                raise
+            end, self._end = self._end, None
+            data, meta = self._close()
+            if end is not None:
+                meta["window_start"], meta["window_end"] = end - self._length, end
+            self._panes.clear()
+            return data, meta
+
+    async def _receive_count(self, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        step = int(self.step)
+        while self._current.messages < step:
+            batch = await self._receive_batch(min(step - self._current.messages, self.max_items), **kwargs)
+            self._add(batch)
+        return self._close()
+
+    async def _receive_time(self, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        while True:
+            if self._end is None:  # idle, wait for the first message
+                batch = await self._receive_batch(self.max_items, **kwargs)
+                self._end = (math.floor(time.time() / self.step) + 1) * self.step
+                self._add(batch)
+                continue
+            remaining = self._end - time.time()
+            if remaining > 0:
+                received = await self._receive_batch_within(self.max_items, remaining, **kwargs)
+                if received is not None:
+                    self._add(received)
+                    continue
+            end = self._end
+            self._end += self.step
+            data, meta = self._close()
+            if not any(pane.messages for pane in self._panes):
+                self._panes.clear()
+                self._end = None
+                continue
+            meta["window_start"], meta["window_end"] = end - self._length, end
+            return data, meta
+
+    def _add(self, batch: list[Item]) -> None:
+        """Add the statistics of a batch to the current step, with one pass over the values of each field."""
+        pane = self._current
+        pane.messages += len(batch)
+        pane.topics.update(meta.get("topic") for _, meta in batch)
+        columns: dict[str, list[Any]] = {}
+        fields = self.fields
+        for data, _ in batch:
+            names = getattr(getattr(data, "dtype", None), "names", None) if self.numpy else None
+            for field, value in ((name, data[name]) for name in names) if names else data.items():
+                if fields is not None and field not in fields:
+                    continue
+                column = columns.get(field)
+                if column is None:
+                    columns[field] = [value]
+                else:
+                    column.append(value)
+        if self.numpy:
+            self._add_arrays(pane, columns)
+            return
+        for field, column in columns.items():
+            values = [value for value in column if isinstance(value, int | float) and not isinstance(value, bool)]
+            if values:
+                pane.merge(
+                    field, (len(values), sum(values), sum(map(operator.mul, values, values)), min(values), max(values))
+                )
+
+    def _add_arrays(self, pane: _Pane, columns: dict[str, list[Any]]) -> None:
+        np = self._np
+        for field, column in columns.items():
+            try:
+                array = np.asarray(column)
+            except ValueError:  # scalars mixed with arrays or arrays of different lengths
+                array = np.concatenate([np.atleast_1d(value) for value in column])
+            if not np.issubdtype(array.dtype, np.number) or not array.size:
+                continue
+            array = array.astype(np.float64, copy=False).ravel()
+            pane.merge(field, (array.size, array.sum(), np.dot(array, array), array.min(), array.max()))
+
+    def _close(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Finish the current step and return the statistics of the window that ends with it."""
+        self._panes.append(self._current)
+        self._current = _Pane()
+        totals = _Pane()
+        for pane in self._panes:
+            totals.messages += pane.messages
+            totals.topics |= pane.topics
+            for field, values in pane.fields.items():
+                totals.merge(field, values)
+        data: dict[str, Any] = {}
+        for field, (count, total, squares, low, high) in totals.fields.items():
+            statistics = {
+                "count": int(count),
+                "sum": float(total),
+                "mean": float(total / count),
+                "min": float(low),
+                "max": float(high),
+                "rms": math.sqrt(squares / count),
+            }
+            for stat in self.stats:
+                data[f"{field}_{stat}"] = statistics[stat]
+        meta: dict[str, Any] = {"count": totals.messages}
+        if len(totals.topics) == 1 and None not in totals.topics:
+            meta["topic"] = next(iter(totals.topics))
+        return data, meta
+
+    def _arguments(self) -> str:
+        window = f"seconds={self.seconds}" if self.seconds is not None else f"count={self.count}"
+        return f"{window}, step={self.step}"
+
+
+__all__ = [
+    "STATISTICS",
+    "Aggregate",
+    "Batch",
+    "Debounce",
+    "Distinct",
+    "Filter",
+    "Map",
+    "Operator",
+    "Take",
+    "Throttle",
+    "Window",
+]
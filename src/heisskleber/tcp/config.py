@@ -20,3 +20,7 @@ class TcpConf(BaseConf):
     timeout: int = 60
     retry_delay: float = 0.5
     restart_behavior: RestartBehavior = RestartBehavior.ALWAYS
+    packstyle: str = "json"
+    framing: str = "delimiter"  # one of heisskleber.core.FRAMINGS
+    delimiter: str = "\n"
+    max_frame_size: int | None = None  # bytes, None is unlimited
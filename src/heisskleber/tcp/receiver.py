@@ -2,27 +2,71 @@
 
 import asyncio
 import logging
+from collections import deque
 from typing import Any, TypeVar
 
-from heisskleber.core import Receiver, Unpacker, json_unpacker
+from heisskleber.core import Framer, FramingError, Metrics, Receiver, Unpacker, create_framer, get_unpacker
+from heisskleber.core.retry import RetryPolicy
+from heisskleber.core.utils import unpack_each
 from heisskleber.tcp.config import TcpConf
 
 T = TypeVar("T")
 
 logger = logging.getLogger("heisskleber.tcp")
 
+READ_CHUNK_SIZE = 2**16
 
-class TcpReceiver(Receiver[T]):
-    """Async TCP connection, connects to host:port and reads byte encoded strings."""
+_max_attempts = {TcpConf.RestartBehavior.NEVER: 1, TcpConf.RestartBehavior.ONCE: 2}
+
+
+def default_framer(config: TcpConf) -> Framer:
+    """Create the framer of config.framing."""
+    return create_framer(config.framing, config.delimiter.encode(), config.max_frame_size)
+
+
+def default_retry_policy(config: TcpConf, name: str) -> RetryPolicy:
+    """Create the retry policy that config.retry_delay, config.timeout and config.restart_behavior describe."""
+    return RetryPolicy(
+        initial_delay=config.retry_delay,
+        max_delay=config.timeout,
+        max_attempts=_max_attempts.get(config.restart_behavior),
+        catch=ConnectionRefusedError,
+        name=name,
+    )
 
-    def __init__(self, config: TcpConf, unpacker: Unpacker[T] = json_unpacker) -> None:  # type: ignore [assignment]
+
+class TcpReceiver(Receiver[T]):
+    """Async TCP connection, connects to host:port and reads framed messages.
+
+    The connection is read in large chunks, which are split into frames by the framer.
+    By default, messages are lines, see config.framing for length prefixes, COBS and SLIP.
+
+    Arguments:
+        config: The TCP configuration.
+        unpacker: Function to deserialize received frames, defaults to the unpacker named by config.packstyle.
+        retry_policy: Decides when to retry a refused connection. Defaults to exponential backoff with jitter
+            from config.retry_delay up to config.timeout seconds, with as many attempts as config.restart_behavior allows.
+        framer: Splits the stream into frames. Defaults to the framer named by config.framing.
+
+    """
+
+    def __init__(
+        self,
+        config: TcpConf,
+        unpacker: Unpacker[T] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        framer: Framer | None = None,
+    ) -> None:
         self.config = config
-        self.unpack = unpacker
+        self.unpack = unpacker if unpacker is not None else get_unpacker(config.packstyle)
+        self.framer = framer or default_framer(config)
         self.is_connected = False
         self.timeout = config.timeout
+        self.retry_policy = retry_policy or default_retry_policy(config, repr(self))
         self._start_task: asyncio.Task[None] | None = None
         self.reader: asyncio.StreamReader | None = None
         self.writer: asyncio.StreamWriter | None = None
+        self._frames: deque[bytes | Exception] = deque()
 
     async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
         """Receive data from a connection.
@@ -35,26 +79,100 @@ class TcpReceiver(Receiver[T]):
                 - A dictionary with metadata including the message topic
 
         Raises:
-            TypeError: If the message payload is not of type bytes.
             UnpackerError: If the message could not be unpacked with the unpacker protocol.
+            FramingError: If the stream could not be split into frames. The connection is closed and reopened
+                by the next call.
 
         """
-        data = b""
-        retry_delay = self.config.retry_delay
-        while not data:
+        frames = deque(await self._read_frames(1))
+        return unpack_each(frames, self.unpack, 1)[0]
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Receive a batch of messages from the connection.
+
+        Reads the connection in large chunks and returns all complete frames of a chunk at once.
+        Messages before one that fails to unpack are returned, its error is raised by the next call.
+
+        Arguments:
+            max_items: The maximum number of messages to return.
+            timeout: Seconds to keep reading if fewer than `max_items` complete frames are buffered.
+            **kwargs: Not implemented.
+
+        Returns:
+            list[tuple[T, dict[str, Any]]]: The unpacked messages with their metadata, in order of arrival.
+
+        Raises:
+            UnpackerError: If a message could not be unpacked with the unpacker protocol.
+            FramingError: If the stream could not be split into frames, see receive().
+
+        """
+        frames = await self._read_frames(max_items)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(frames) < max_items:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(self.reader.read(READ_CHUNK_SIZE), remaining)  # type: ignore [union-attr]
+            except TimeoutError:
+                break
+            if not chunk:
+                self._connection_lost()
+                break
+            self._feed(chunk)
+            frames.extend(self._take(max_items - len(frames)))
+
+        pending = deque(frames)
+        try:
+            return unpack_each(pending, self.unpack, max_items)
+        finally:
+            self._frames.extendleft(reversed(pending))
+
+    async def _read_frames(self, max_items: int) -> list[bytes | Exception]:
+        """Return up to max_items frames, reading from the connection until at least one frame is complete."""
+        connections_lost = 0
+        while not (frames := self._take(max_items)):
             await self._ensure_connected()
-            data = await self.reader.readline()  # type: ignore [union-attr]
-            if not data:
-                self.is_connected = False
+            chunk = await self.reader.read(READ_CHUNK_SIZE)  # type: ignore [union-attr]
+            if not chunk:
+                self._connection_lost()
+                connections_lost += 1
+                delay = self.retry_policy.backoff(connections_lost)
                 logger.warning(
-                    "%(self)s nothing received, retrying connect in %(seconds)s",
-                    {"self": self, "seconds": retry_delay},
+                    "%(self)s nothing received, retrying connect in %(seconds).2f",
+                    {"self": self, "seconds": delay},
                 )
-                await asyncio.sleep(retry_delay)
-                retry_delay = min(self.config.timeout, retry_delay * 2)
+                await asyncio.sleep(delay)
+                continue
+            self._feed(chunk)
+        return frames
 
-        payload, extra = self.unpack(data)
-        return payload, extra
+    def _feed(self, chunk: bytes) -> None:
+        try:
+            self._frames.extend(self.framer.feed(chunk))
+        except FramingError:
+            logger.exception("%(self)s can not split the stream into frames, reconnecting", {"self": self})
+            if self.writer is not None:
+                self.writer.close()
+            self._connection_lost()
+            raise
+
+    def _take(self, max_items: int) -> list[bytes | Exception]:
+        """Remove up to max_items complete frames, or the deferred error of a frame, from the buffer."""
+        frames = self._frames
+        return [frames.popleft() for _ in range(min(max_items, len(frames)))]
+
+    def _register_metrics(self, metrics: Metrics) -> None:
+        metrics.gauges["reconnects"] = lambda: max(self.retry_policy.stats.successes - 1, 0)
+        metrics.gauges["drops"] = lambda: self.framer.dropped
+
+    def _connection_lost(self) -> None:
+        """Drop the connection state and any incomplete frame of the lost connection."""
+        self.is_connected = False
+        self.framer.reset()
 
     async def start(self) -> None:
         """Start TcpSource."""
@@ -68,7 +186,6 @@ class TcpReceiver(Receiver[T]):
             await self.writer.wait_closed()
             self.is_connected = False
 
-
     async def _ensure_connected(self) -> None:
         if self.is_connected:
             return
@@ -85,27 +202,20 @@ class TcpReceiver(Receiver[T]):
 
     async def _connect(self) -> None:
         logger.info("%(self)s waiting for connection.", {"self": self})
-
-        num_attempts = 0
-        while True:
-            try:
-                self.reader, self.writer = await asyncio.wait_for(
-                    asyncio.open_connection(self.config.host, self.config.port),
-                    timeout=self.timeout,
-                )
-                logger.info("%(self)s connected successfully!", {"self": self})
-                break
-            except ConnectionRefusedError as e:
-                logger.exception("%(self)s: %(error_type)s", {"self": self, "error_type": type(e).__name__})
-                if self.config.restart_behavior == TcpConf.RestartBehavior.NEVER:
-                    raise
-                num_attempts += 1
-                if self.config.restart_behavior == TcpConf.RestartBehavior.ONCE and num_attempts > 1:
-                    raise
-                # otherwise retry indefinitely
-
+        self.reader, self.writer = await self.retry_policy.run(self._open_connection)
+        logger.info("%(self)s connected successfully!", {"self": self})
         self.is_connected = True
 
+    async def _open_connection(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_connection(self.config.host, self.config.port),
+                timeout=self.timeout,
+            )
+        except ConnectionRefusedError as e:
+            logger.exception("%(self)s: %(error_type)s", {"self": self, "error_type": type(e).__name__})
+            raise
+
     def __repr__(self) -> str:
         """Return string representation of TcpSource."""
         return f"{self.__class__.__name__}(host={self.config.host}, port={self.config.port})"
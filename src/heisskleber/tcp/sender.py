@@ -1,41 +1,132 @@
+"""Async TCP Sink - send data to a TCP server."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable
 from typing import Any, TypeVar
 
-from heisskleber.core import Sender
-from heisskleber.core.packer import Packer
+from heisskleber.core import Framer, Metrics, Packer, Sender, get_packer
+from heisskleber.core.packer import as_buffer
+from heisskleber.core.retry import RetryPolicy
 
 from .config import TcpConf
+from .receiver import default_framer, default_retry_policy
 
 T = TypeVar("T")
 
+logger = logging.getLogger("heisskleber.tcp")
+
 
 class TcpSender(Sender[T]):
-    """Async TCP Sink.
+    """Async TCP connection, connects to host:port and writes framed messages.
 
-    Attributes:
-        config: The TcpConf configuration object.
-        packer: The packer protocol to serialize data before sending.
+    The connection is opened by start() or the first send, and reopened by the next send if it was lost.
+
+    Arguments:
+        config: The TCP configuration.
+        packer: Function to serialize data, defaults to the packer named by config.packstyle.
+        retry_policy: Decides when to retry a refused connection, see TcpReceiver.
+        framer: Frames the packed payloads. Defaults to the framer named by config.framing, i.e. lines.
 
     """
 
-    def __init__(self, config: TcpConf, packer: Packer[T]) -> None:
+    def __init__(
+        self,
+        config: TcpConf,
+        packer: Packer[T] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        framer: Framer | None = None,
+    ) -> None:
         self.config = config
-        self.packer = packer
+        self.packer = packer if packer is not None else get_packer(config.packstyle)
+        self.framer = framer or default_framer(config)
+        self.retry_policy = retry_policy or default_retry_policy(config, repr(self))
+        self.writer: asyncio.StreamWriter | None = None
+        self._connect_lock = asyncio.Lock()
 
-    async def send(self, data: T, **kwargs: dict[str, Any]) -> None:
+    async def send(self, data: T, **kwargs: Any) -> None:
         """Send data via tcp connection.
 
         Arguments:
             data: The data to be sent.
             kwargs: Not implemented.
 
+        Raises:
+            PackerError: If the data could not be packed.
+            FramingError: If the payload could not be framed.
+            ConnectionError: If the connection was lost while sending. The next call reconnects.
+
         """
+        await self._write([self.framer.encode(as_buffer(self.packer(data)))])
+
+    async def send_many(self, items: Iterable[T], **kwargs: Any) -> None:
+        """Send a batch of data with a single write and drain.
+
+        Arguments:
+            items: The data to be sent, in order.
+            kwargs: Not implemented.
+
+        Raises:
+            PackerError: If data could not be packed. Nothing is sent in that case.
+            FramingError: If a payload could not be framed. Nothing is sent in that case.
+            ConnectionError: If the connection was lost while sending, see send().
+
+        """
+        await self._write([self.framer.encode(as_buffer(self.packer(data))) for data in items])
+
+    async def _write(self, frames: list[bytes]) -> None:
+        writer = await self._ensure_connected()
+        try:
+            writer.writelines(frames)
+            await writer.drain()
+        except ConnectionError:
+            logger.warning("%(self)s connection lost", {"self": self})
+            writer.close()
+            self.writer = None
+            raise
+
+    async def _ensure_connected(self) -> asyncio.StreamWriter:
+        writer = self.writer
+        if writer is not None and not writer.is_closing():
+            return writer
+        async with self._connect_lock:  # concurrent sends share a single connection attempt
+            writer = self.writer
+            if writer is not None and not writer.is_closing():
+                return writer
+            logger.info("%(self)s waiting for connection.", {"self": self})
+            connected = await self.retry_policy.run(self._open_connection)
+            self.writer = connected
+            logger.info("%(self)s connected successfully!", {"self": self})
+            return connected
+
+    async def _open_connection(self) -> asyncio.StreamWriter:
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.config.host, self.config.port),
+                timeout=self.config.timeout,
+            )
+        except ConnectionRefusedError as e:
+            logger.exception("%(self)s: %(error_type)s", {"self": self, "error_type": type(e).__name__})
+            raise
+        return writer
+
+    def _register_metrics(self, metrics: Metrics) -> None:
+        metrics.gauges["reconnects"] = lambda: max(self.retry_policy.stats.successes - 1, 0)
 
     def __repr__(self) -> str:
-        """Return string representation of TcpSink."""
-        return f"TcpSink({self.config.host}:{self.config.port})"
+        """Return string representation of TcpSender."""
+        return f"{self.__class__.__name__}(host={self.config.host}, port={self.config.port})"
 
     async def start(self) -> None:
-        """Start TcpSink."""
+        """Connect to the server."""
+        await self._ensure_connected()
 
     async def stop(self) -> None:
-        """Stop TcpSink."""
+        """Close the connection."""
+        if self.writer is not None:
+            logger.info("%(self)s stopping", {"self": self})
+            self.writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self.writer.wait_closed()
+            self.writer = None
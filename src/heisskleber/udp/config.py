@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from heisskleber.core import BaseConf
+from heisskleber.core import BaseConf, OverflowPolicy
 
 
 @dataclass
@@ -10,5 +10,10 @@ class UdpConf(BaseConf):
     port: int = 1234
     host: str = "127.0.0.1"
     max_queue_size: int = 1000
+    overflow: OverflowPolicy = "drop_newest"
+    conflate: bool = False  # receivers keep only the newest datagram per sender address, overrides overflow
     encoding: str = "utf-8"
     delimiter: str = "\r\n"
+    framing: str | None = None  # None sends one message per datagram, else one of heisskleber.core.FRAMINGS
+    timestamps: bool = False  # receivers add the arrival times to the metadata, see heisskleber.core.LatencyHistogram
+    packstyle: str = "json"
@@ -1,8 +1,12 @@
 import asyncio
 import logging
+from collections import deque
+from operator import itemgetter
 from typing import Any, TypeVar
 
-from heisskleber.core import Receiver, Unpacker, json_unpacker
+from heisskleber.core import MessageBuffer, Metrics, Receiver, Unpacker, create_framer, get_unpacker
+from heisskleber.core.latency import Arrival, arrival, stamp
+from heisskleber.core.utils import drain_queue, unpack_each
 from heisskleber.udp.config import UdpConf
 
 logger = logging.getLogger("heisskleber.udp")
@@ -13,17 +17,21 @@ class UdpProtocol(asyncio.DatagramProtocol):
     """Protocol for udp connection.
 
     Arguments:
-        queue: The asyncioQueue to put messages into.
+        queue: The buffer to put (datagram, sender address, arrival) tuples into.
+            Its overflow policy must not be "block".
+        timestamps: Take the arrival times of every datagram, see heisskleber.core.LatencyHistogram.
+            Otherwise, the arrival is None.
 
     """
 
-    def __init__(self, queue: asyncio.Queue[bytes]) -> None:
+    def __init__(self, queue: asyncio.Queue[tuple[bytes, Any, Arrival | None]], timestamps: bool = False) -> None:
         super().__init__()
         self.queue = queue
+        self.timestamps = timestamps
 
     def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
         """Handle received udp message."""
-        self.queue.put_nowait(data)
+        self.queue.put_nowait((data, addr, arrival() if self.timestamps else None))
 
     def connection_made(self, transport: asyncio.DatagramTransport) -> None:  # type: ignore[override]
         """Log successful connection."""
@@ -31,13 +39,31 @@ class UdpProtocol(asyncio.DatagramProtocol):
 
 
 class UdpReceiver(Receiver[T]):
-    """An asynchronous UDP subscriber based on asyncio.protocols.DatagramProtocol."""
+    """An asynchronous UDP subscriber based on asyncio.protocols.DatagramProtocol.
 
-    def __init__(self, config: UdpConf, unpacker: Unpacker[T] = json_unpacker) -> None:  # type: ignore[assignment]
+    Datagrams are buffered in a queue of config.max_queue_size. If the queue is full, config.overflow
+    decides which datagram is dropped. The "block" policy is not supported, as datagrams can not wait.
+    With config.conflate, the queue keeps only the newest datagram per sender address instead.
+
+    By default, every datagram is one message. With config.framing, datagrams are split into frames,
+    e.g. lines ending with config.delimiter, and may hold several messages.
+    With config.timestamps, the arrival times of the datagram are added to the metadata of its messages.
+    """
+
+    def __init__(self, config: UdpConf, unpacker: Unpacker[T] | None = None) -> None:
+        if config.overflow == "block" and not config.conflate:
+            msg = "UdpReceiver can not block on overflow, choose a policy that drops datagrams."
+            raise ValueError(msg)
         self.config = config
         self.EOF = self.config.delimiter.encode(self.config.encoding)
-        self.unpacker = unpacker
-        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self.config.max_queue_size)
+        self.unpacker = unpacker if unpacker is not None else get_unpacker(config.packstyle)
+        self.framer = create_framer(config.framing, self.EOF) if config.framing else None
+        self._frames: deque[tuple[bytes, Arrival | None] | Exception] = deque()
+        self._queue: MessageBuffer[tuple[bytes, Any, Arrival | None]] = (
+            MessageBuffer(0, "coalesce", key=itemgetter(1))
+            if config.conflate
+            else MessageBuffer(config.max_queue_size, config.overflow)
+        )
         self._task: asyncio.Task[None] | None = None
         self._is_connected = False
         self._transport: asyncio.DatagramTransport | None = None
@@ -47,12 +73,15 @@ class UdpReceiver(Receiver[T]):
         """Start udp connection."""
         loop = asyncio.get_event_loop()
         self._transport, self._protocol = await loop.create_datagram_endpoint(
-            lambda: UdpProtocol(self._queue),
+            lambda: UdpProtocol(self._queue, self.config.timestamps),
             local_addr=(self.config.host, self.config.port),
         )
         self._is_connected = True
         logger.info("Udp connection established.")
 
+    def _register_metrics(self, metrics: Metrics) -> None:
+        metrics.watch_buffer(self._queue)
+
     async def stop(self) -> None:
         """Stop the udp connection."""
         if self._transport is not None:
@@ -70,16 +99,69 @@ class UdpReceiver(Receiver[T]):
 
         Raises:
             UnpackerError: If the received message could not be unpacked.
+            FramingError: If a datagram could not be split into frames with config.framing.
+
+        """
+        if not self._is_connected:
+            await self.start()
+
+        if self.framer is None and not self._frames:
+            data, _, received = await self._queue.get()
+            return self._unpack((data, received))
+
+        while not self._frames:
+            data, _, received = await self._queue.get()
+            self._split(data, received)
+        return unpack_each(self._frames, self._unpack, 1)[0]
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Get a batch of messages from the udp connection.
+
+        Waits for the next datagram, then drains all further queued datagrams in one pass.
+        Messages before one that fails to unpack are returned, its error is raised by the next call.
+
+        Arguments:
+            max_items: The maximum number of messages to return.
+            timeout: Seconds to wait for further datagrams if the queue runs empty before `max_items` are collected.
+            **kwargs: Not implemented.
+
+        Returns:
+            list[tuple[T, dict[str, Any]]]: The unpacked messages with their extra information, in order of arrival.
+
+        Raises:
+            UnpackerError: If a received message could not be unpacked.
+            FramingError: If a datagram could not be split into frames with config.framing.
 
         """
         if not self._is_connected:
             await self.start()
 
-        while True:
-            data = None
-            data = await self._queue.get()
-            payload, extra = self.unpacker(data)
-            return (payload, extra)
+        frames = self._frames
+        if self.framer is None:
+            if not frames:
+                datagrams = await drain_queue(self._queue, max_items, timeout)
+                frames.extend((data, received) for data, _, received in datagrams)
+            return unpack_each(frames, self._unpack, max_items)
+
+        while not frames:
+            for data, _, received in await drain_queue(self._queue, max_items, timeout):
+                self._split(data, received)
+        while len(frames) < max_items and not self._queue.empty():
+            data, _, received = self._queue.get_nowait()
+            self._split(data, received)
+        return unpack_each(frames, self._unpack, max_items)
+
+    def _split(self, datagram: bytes, received: Arrival | None) -> None:
+        self._frames.extend((frame, received) for frame in self.framer.split(datagram))  # type: ignore[union-attr]
+
+    def _unpack(self, frame: tuple[bytes, Arrival | None]) -> tuple[T, dict[str, Any]]:
+        payload, received = frame
+        data, extra = self.unpacker(payload)
+        if received is not None:
+            stamp(extra, received)
+        return data, extra
 
     def __repr__(self) -> str:
         """Return string representation of UdpSource."""
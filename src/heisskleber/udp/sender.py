@@ -1,8 +1,10 @@
 import asyncio
 import logging
+from collections.abc import Iterable
 from typing import Any, TypeVar
 
-from heisskleber.core import Packer, Sender, json_packer
+from heisskleber.core import Packer, Payload, Sender, create_framer, get_packer
+from heisskleber.core.packer import as_buffer
 from heisskleber.udp.config import UdpConf
 
 logger = logging.getLogger("heisskleber.udp")
@@ -31,15 +33,21 @@ class UdpProtocol(asyncio.DatagramProtocol):
 class UdpSender(Sender[T]):
     """UDP sink for sending data via UDP protocol.
 
+    Every message is sent as one datagram. With config.framing, the payloads are framed,
+    e.g. terminated by config.delimiter.
+
     Arguments:
         config: UDP configuration parameters
-        packer: Function to serialize data, defaults to JSON packing
+        packer: Function to serialize data, defaults to the packer named by config.packstyle
 
     """
 
-    def __init__(self, config: UdpConf, packer: Packer[T] = json_packer) -> None:  # type: ignore[assignment]
+    def __init__(self, config: UdpConf, packer: Packer[T] | None = None) -> None:
         self.config = config
-        self.pack = packer
+        self.pack = packer if packer is not None else get_packer(config.packstyle)
+        self.framer = (
+            create_framer(config.framing, config.delimiter.encode(config.encoding)) if config.framing else None
+        )
         self.is_connected = False
         self._transport: asyncio.DatagramTransport | None = None
         self._protocol: UdpProtocol | None = None
@@ -80,9 +88,24 @@ class UdpSender(Sender[T]):
 
         """
         await self._ensure_connection()  # we know that self._transport is intialized
-        payload = self.pack(data)
-        payload = payload.encode() if isinstance(payload, str) else payload
-        self._transport.sendto(payload)  # type: ignore [union-attr]
+        self._transport.sendto(self._datagram(self.pack(data)))  # type: ignore [union-attr]
+
+    async def send_many(self, items: Iterable[T], **kwargs: dict[str, Any]) -> None:
+        """Send a batch of data over UDP connection, one datagram per item.
+
+        Arguments:
+            items: Data to send
+            **kwargs: Additional arguments (unused)
+
+        """
+        await self._ensure_connection()  # we know that self._transport is intialized
+        datagrams = [self._datagram(self.pack(data)) for data in items]
+        for datagram in datagrams:
+            self._transport.sendto(datagram)  # type: ignore [union-attr]
+
+    def _datagram(self, payload: Payload) -> bytes | bytearray | memoryview:
+        buffer = as_buffer(payload, self.config.encoding)
+        return self.framer.encode(buffer) if self.framer is not None else buffer
 
     def __repr__(self) -> str:
         """Return string representation of UdpSink."""
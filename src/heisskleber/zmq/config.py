@@ -12,6 +12,10 @@ class ZmqConf(BaseConf):
     publisher_port: int = 5555
     subscriber_port: int = 5556
     packstyle: str = "json"
+    zero_copy: bool = False  # pass zmq frame buffers to the unpacker as memoryview, send without copying
+    conflate: bool = False  # receivers keep only the newest message per topic
+    slotted_metadata: bool = False  # receivers return Metadata instead of a dict, with topic, sequence and transport
+    timestamps: bool = False  # receivers add the arrival times to the metadata, see heisskleber.core.LatencyHistogram
 
     @property
     def publisher_address(self) -> str:
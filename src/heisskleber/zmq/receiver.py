@@ -1,10 +1,14 @@
+import asyncio
 import logging
+from collections import deque
 from typing import Any, TypeVar
 
 import zmq
 import zmq.asyncio
 
-from heisskleber.core import Receiver, Unpacker, json_unpacker
+from heisskleber.core import MessageBuffer, Metadata, Receiver, Unpacker, get_unpacker
+from heisskleber.core.latency import Arrival, arrival, stamp
+from heisskleber.core.utils import unpack_each
 from heisskleber.zmq.config import ZmqConf
 
 logger = logging.getLogger("heisskleber.zmq")
@@ -12,6 +16,16 @@ logger = logging.getLogger("heisskleber.zmq")
 
 T = TypeVar("T")
 
+CONFLATE_DRAIN_LIMIT = 1000  # messages read from the socket per receive() call in conflation mode
+
+
+Frames = list[bytes] | list[zmq.Frame]
+
+
+def _topic(item: Frames | tuple[Frames, Arrival]) -> bytes:
+    topic = item[0][0] if isinstance(item, tuple) else item[0]
+    return topic.bytes if isinstance(topic, zmq.Frame) else topic
+
 
 class ZmqReceiver(Receiver[T]):
     """Async source that subscribes to one or many topics from a zmq broker and receives messages via the receive() function.
@@ -19,17 +33,28 @@ class ZmqReceiver(Receiver[T]):
     Attributes:
         config: The ZmqConf configuration object for the connection.
         unpacker : The unpacker function to use for deserializing the data.
+            Defaults to the unpacker named by config.packstyle.
 
+    With config.conflate, every receive reads all pending messages from the socket and keeps only the newest
+    message per topic, so a slow consumer skips stale backlog. Only the returned messages are unpacked.
+    With config.slotted_metadata, the metadata is a Metadata object with topic, sequence and transport.
+    With config.timestamps, the arrival times of every message are taken when it is read from the socket
+    and added to the metadata, see LatencyHistogram.
 
     """
 
-    def __init__(self, config: ZmqConf, topic: str | list[str], unpacker: Unpacker[T] = json_unpacker) -> None:  # type: ignore [assignment]
+    def __init__(self, config: ZmqConf, topic: str | list[str], unpacker: Unpacker[T] | None = None) -> None:
         self.config = config
         self.topic = topic
         self.context = zmq.asyncio.Context.instance()
         self.socket: zmq.asyncio.Socket = self.context.socket(zmq.SUB)
-        self.unpack = unpacker
+        self.unpack = unpacker if unpacker is not None else get_unpacker(config.packstyle)
         self.is_connected = False
+        self._sequence = 0
+        self._backlog: deque[Frames | tuple[Frames, Arrival] | Exception] = deque()
+        self._latest: MessageBuffer[Frames | tuple[Frames, Arrival]] | None = (
+            MessageBuffer(0, "coalesce", key=_topic) if config.conflate else None
+        )
 
     async def receive(self, **kwargs: Any) -> tuple[T, dict[str, Any]]:
         """Read a message from the zmq bus and return it.
@@ -43,9 +68,90 @@ class ZmqReceiver(Receiver[T]):
         """
         if not self.is_connected:
             await self.start()
-        (topic, payload) = await self.socket.recv_multipart()
+        if self._backlog:
+            return unpack_each(self._backlog, self._unpack, 1)[0]
+        if self._latest is not None:
+            await self._conflate()
+            return self._unpack(self._latest.get_nowait())
+        return self._unpack(await self._recv())
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[T, dict[str, Any]]]:
+        """Read a batch of messages from the zmq bus.
+
+        Waits for the next message, then reads all further messages that are pending on the socket
+        with non-blocking receive calls. In conflation mode, returns the newest message of each topic without waiting.
+        Messages before one that fails to unpack are returned, its error is raised by the next call.
+
+        Arguments:
+            max_items: The maximum number of messages to return.
+            timeout: Seconds to wait for further messages if the socket runs empty before `max_items` are collected.
+            **kwargs: Not implemented.
+
+        Returns:
+            list[tuple[T, dict[str, Any]]]: The unpacked messages with their metadata, in order of arrival.
+
+        Raises:
+            UnpackerError: If a payload could not be unpacked with provided unpacker.
+
+        """
+        if not self.is_connected:
+            await self.start()
+        if self._backlog:
+            return unpack_each(self._backlog, self._unpack, max_items)
+        if self._latest is not None:
+            await self._conflate()
+            latest = self._latest
+            self._backlog.extend(latest.get_nowait() for _ in range(min(latest.qsize(), max_items)))
+            return unpack_each(self._backlog, self._unpack, max_items)
+
+        frames = self._backlog
+        frames.append(await self._recv())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(frames) < max_items:
+            try:
+                frames.append(await self._recv(flags=zmq.NOBLOCK))
+            except zmq.Again:  # noqa: PERF203
+                remaining = deadline - loop.time()
+                if remaining <= 0 or not await self.socket.poll(int(remaining * 1000)):
+                    break
+
+        return unpack_each(frames, self._unpack, max_items)
+
+    async def _conflate(self) -> None:
+        """Move pending messages into the conflation buffer, waiting for a message if the buffer is empty."""
+        latest: MessageBuffer[Frames | tuple[Frames, Arrival]] = self._latest  # type: ignore[assignment]
+        if latest.empty():
+            latest.put_nowait(await self._recv())
+        for _ in range(CONFLATE_DRAIN_LIMIT):
+            try:
+                latest.put_nowait(await self._recv(flags=zmq.NOBLOCK))
+            except zmq.Again:  # noqa: PERF203
+                return
+
+    async def _recv(self, **kwargs: Any) -> Frames | tuple[Frames, Arrival]:
+        frames = await self.socket.recv_multipart(copy=not self.config.zero_copy, **kwargs)
+        return (frames, arrival()) if self.config.timestamps else frames
+
+    def _unpack(self, item: Frames | tuple[Frames, Arrival]) -> tuple[T, dict[str, Any]]:
+        frames, arrived = item if isinstance(item, tuple) else (item, None)
+        topic_frame, payload_frame = frames
+        if isinstance(topic_frame, zmq.Frame) and isinstance(payload_frame, zmq.Frame):
+            # zero copy: hand the frame's buffer to the unpacker
+            topic, payload = topic_frame.bytes, payload_frame.buffer
+        else:
+            topic, payload = frames  # type: ignore[assignment]
         data, extra = self.unpack(payload)
-        extra["topic"] = topic.decode()
+        if self.config.slotted_metadata:
+            self._sequence += 1
+            meta = Metadata(extra, topic=topic.decode(), sequence=self._sequence, transport="zmq")
+            extra = meta  # type: ignore[assignment]
+        else:
+            extra["topic"] = topic.decode()
+        if arrived is not None:
+            stamp(extra, arrived)
         return data, extra
 
     async def start(self) -> None:
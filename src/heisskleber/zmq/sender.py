@@ -1,10 +1,13 @@
+import asyncio
 import logging
+from collections.abc import Iterable
 from typing import Any, TypeVar
 
 import zmq
 import zmq.asyncio
 
-from heisskleber.core import Packer, Sender, json_packer
+from heisskleber.core import Packer, Sender, get_packer
+from heisskleber.core.packer import as_buffer
 
 from .config import ZmqConf
 
@@ -19,25 +22,42 @@ class ZmqSender(Sender[T]):
     Attributes:
         config: The ZmqConf configuration object for the connection.
         packer : The packer strategy to use for serializing the data.
-            Defaults to json packer with utf-8 encoding.
+            Defaults to the packer named by config.packstyle, i.e. json packer with utf-8 encoding.
 
     """
 
-    def __init__(self, config: ZmqConf, packer: Packer[T] = json_packer) -> None:  # type: ignore[assignment]
+    def __init__(self, config: ZmqConf, packer: Packer[T] | None = None) -> None:
         self.config = config
         self.context = zmq.asyncio.Context.instance()
         self.socket: zmq.asyncio.Socket = self.context.socket(zmq.PUB)
-        self.packer = packer
+        self.packer = packer if packer is not None else get_packer(config.packstyle)
         self.is_connected = False
+        self._send_options: dict[str, Any] = {"copy": False} if config.zero_copy else {}
 
     async def send(self, data: T, topic: str = "zmq", **kwargs: Any) -> None:
         """Take the data as a dict, serialize it with the given packer and send it to the zmq socket."""
         if not self.is_connected:
             await self.start()
-        payload = self.packer(data)
-        payload = payload.encode() if isinstance(payload, str) else payload
+        payload = as_buffer(self.packer(data))
         logger.debug("sending payload %(payload)r to topic %(topic)s", {"payload": payload, "topic": topic})
-        await self.socket.send_multipart([topic.encode(), payload])
+        await self.socket.send_multipart([topic.encode(), payload], **self._send_options)
+
+    async def send_many(self, items: Iterable[T], topic: str = "zmq", **kwargs: Any) -> None:
+        """Serialize a batch of data with the given packer and send it to the zmq socket.
+
+        The messages are handed to the socket without awaiting each one, the batch is awaited once at the end.
+        """
+        if not self.is_connected:
+            await self.start()
+        topic_frame = topic.encode()
+        payloads = [self.packer(data) for data in items]
+        logger.debug("sending %(count)d payloads to topic %(topic)s", {"count": len(payloads), "topic": topic})
+        await asyncio.gather(
+            *(
+                self.socket.send_multipart([topic_frame, as_buffer(payload)], **self._send_options)
+                for payload in payloads
+            )
+        )
 
     async def start(self) -> None:
         """Connect to the zmq socket."""
@@ -1,3 +1,109 @@
 # This is the pytest configuration file.
 # It is loaded automatically by pytest and any fixtures placed here are available
 # for all tests
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+from heisskleber.core import Receiver, Sender, Unpacker
+from heisskleber.core.utils import drain_queue
+
+
+class QueueReceiver(Receiver[Any]):
+    """Fake receiver that returns queued values with their topic as metadata.
+
+    Values that are exceptions are raised by the receive() call that would have returned them.
+    receive_many() drains the queue in one pass, like the buffered backends. Receivers that unpack
+    or end use the receive_many() of the base class, which calls receive() for each message.
+
+    Args:
+        values: The values to queue, for the given topic.
+        topic: The topic of the queued values.
+        unpacker: Unpacks the values into data and metadata, e.g. for payloads of a raw receiver.
+        finite: Raise StopAsyncIteration once the queue is empty instead of waiting for more values.
+        name: The name in the repr.
+    """
+
+    def __init__(
+        self,
+        values: Iterable[Any] = (),
+        topic: str = "test",
+        *,
+        unpacker: Unpacker[Any] | None = None,
+        finite: bool = False,
+        name: str = "QueueReceiver",
+    ) -> None:
+        self.queue: asyncio.Queue[tuple[Any, str]] = asyncio.Queue()
+        for value in values:
+            self.put(value, topic)
+        self.unpacker = unpacker
+        self.finite = finite
+        self.name = name
+        self.started = False
+        self.stopped = False
+
+    def put(self, value: Any, topic: str = "test") -> None:
+        self.queue.put_nowait((value, topic))
+
+    def _message(self, value: Any, topic: str) -> tuple[Any, dict[str, Any]]:
+        if isinstance(value, BaseException):
+            raise value
+        if self.unpacker is None:
+            return value, {"topic": topic}
+        data, extra = self.unpacker(value)
+        extra["topic"] = topic
+        return data, extra
+
+    async def receive(self, **kwargs: Any) -> tuple[Any, dict[str, Any]]:
+        if self.finite and self.queue.empty():
+            raise StopAsyncIteration
+        return self._message(*await self.queue.get())
+
+    async def receive_many(
+        self, max_items: int = 100, timeout: float = 0.0, **kwargs: Any
+    ) -> list[tuple[Any, dict[str, Any]]]:
+        if self.unpacker is not None or self.finite:
+            return await super().receive_many(max_items, timeout, **kwargs)
+        return [self._message(*item) for item in await drain_queue(self.queue, max_items, timeout)]
+
+    async def start(self) -> None:
+        self.started = True
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class ListSender(Sender[Any]):
+    """Fake sender that keeps the sent data with its keyword arguments.
+
+    Args:
+        name: The name in the repr.
+        delay: Seconds that each send_many() call takes.
+    """
+
+    def __init__(self, name: str = "sink", delay: float = 0.0) -> None:
+        self.name = name
+        self.delay = delay
+        self.sent: list[tuple[Any, dict[str, Any]]] = []
+        self.batches = 0
+
+    async def send(self, data: Any, **kwargs: Any) -> None:
+        self.sent.append((data, kwargs))
+
+    async def send_many(self, items: Iterable[Any], **kwargs: Any) -> None:
+        self.batches += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.extend((data, kwargs) for data in items)
+
+    async def start(self) -> None:
+        return
+
+    async def stop(self) -> None:
+        return
+
+    def __repr__(self) -> str:
+        return f"ListSender({self.name})"
@@ -0,0 +1,44 @@
+from importlib.util import find_spec
+from typing import Any
+
+import pytest
+
+from heisskleber.core import PackerError, UnpackerError, get_packer, get_unpacker
+
+BACKENDS = [
+    pytest.param("msgpack", marks=pytest.mark.skipif(not find_spec("msgpack"), reason="msgpack not installed")),
+    pytest.param("cbor", marks=pytest.mark.skipif(not find_spec("cbor2"), reason="cbor2 not installed")),
+]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_roundtrip(name: str) -> None:
+    data: dict[str, Any] = {"string": "value", "number": 42, "float": 3.14, "nested": {"bool": True, "list": [1, 2]}}
+
+    payload = get_packer(name)(data)
+    result, extra = get_unpacker(name)(memoryview(payload))
+
+    assert isinstance(payload, bytes)
+    assert result == data
+    assert extra == {}
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_binary_is_smaller_than_json(name: str) -> None:
+    data = {"temperature": 21.123456789, "pressure": 1013.25, "humidity": 0.4567891234}
+
+    assert len(get_packer(name)(data)) < len(get_packer("json")(data))
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_pack_error(name: str) -> None:
+    with pytest.raises(PackerError):
+        get_packer(name)({"key": object()})
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_unpack_truncated_payload(name: str) -> None:
+    payload = get_packer(name)({"key": "value"})
+
+    with pytest.raises(UnpackerError):
+        get_unpacker(name)(payload[:-1])
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from heisskleber.core import MessageBuffer
+
+
+def drain(buffer: MessageBuffer) -> list:
+    return [buffer.get_nowait() for _ in range(buffer.qsize())]
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_free_space() -> None:
+    buffer: MessageBuffer[int] = MessageBuffer(1, "block")
+    await buffer.put(1)
+
+    with pytest.raises(asyncio.QueueFull):
+        buffer.put_nowait(2)
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(buffer.put(2), 0.01)
+    assert buffer.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_put_many_waits_only_for_the_items_that_do_not_fit() -> None:
+    buffer: MessageBuffer[int] = MessageBuffer(2, "block")
+    putting = asyncio.create_task(buffer.put_many(range(4)))
+    await asyncio.sleep(0)
+
+    assert drain(buffer) == [0, 1]
+    await putting
+    assert drain(buffer) == [2, 3]
+
+    dropping: MessageBuffer[int] = MessageBuffer(2, "drop_oldest")
+    await dropping.put_many(range(5))
+    assert drain(dropping) == [3, 4]
+    assert dropping.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_the_latest_items() -> None:
+    buffer: MessageBuffer[int] = MessageBuffer(2, "drop_oldest")
+    for i in range(5):
+        await buffer.put(i)
+
+    assert drain(buffer) == [3, 4]
+    assert buffer.dropped == 3
+    assert buffer.high_water_mark == 2
+
+
+def test_drop_newest_keeps_the_first_items() -> None:
+    buffer: MessageBuffer[int] = MessageBuffer(2, "drop_newest")
+    for i in range(5):
+        buffer.put_nowait(i)
+
+    assert drain(buffer) == [0, 1]
+    assert buffer.dropped == 3
+
+
+def test_coalesce_keeps_latest_item_per_key_in_place() -> None:
+    buffer: MessageBuffer[tuple[str, int]] = MessageBuffer(2, "coalesce", key=lambda item: item[0])
+    for item in [("a", 1), ("b", 1), ("a", 2), ("c", 1)]:
+        buffer.put_nowait(item)
+
+    assert drain(buffer) == [("b", 1), ("c", 1)]  # ("a", 2) replaced ("a", 1), then made room for "c"
+    assert buffer.dropped == 2
+
+
+def test_coalesce_without_key_keeps_only_the_latest_item() -> None:
+    buffer: MessageBuffer[int] = MessageBuffer(0, "coalesce")
+    for i in range(3):
+        buffer.put_nowait(i)
+
+    assert drain(buffer) == [2]
+
+
+@pytest.mark.asyncio
+async def test_spill_preserves_order_and_bounds_memory(tmp_path) -> None:
+    buffer: MessageBuffer[dict] = MessageBuffer(2, "spill", spill_directory=str(tmp_path))
+    for i in range(5):
+        await buffer.put({"i": i})
+
+    assert buffer.qsize() == 5
+    assert len(buffer._queue) == 2
+    assert [await buffer.get() for _ in range(3)] == [{"i": 0}, {"i": 1}, {"i": 2}]
+    buffer.put_nowait({"i": 5})
+    assert drain(buffer) == [{"i": 3}, {"i": 4}, {"i": 5}]
+    assert buffer.dropped == 0
+    assert buffer.high_water_mark == 5
+    buffer.close()
+
+
+def test_spill_drops_beyond_max_spill_bytes() -> None:
+    buffer: MessageBuffer[bytes] = MessageBuffer(1, "spill", max_spill_bytes=40)
+    for i in range(5):
+        buffer.put_nowait(bytes(10) + bytes([i]))
+
+    assert [item[-1] for item in drain(buffer)] == [0, 1]
+    assert buffer.dropped == 3
+    buffer.close()
+
+
+def test_unknown_policy_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown overflow policy"):
+        MessageBuffer(1, "drop_random")  # type: ignore[arg-type]
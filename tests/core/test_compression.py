@@ -0,0 +1,112 @@
+import pickle
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from heisskleber.core import (
+    CompressedPacker,
+    CompressedUnpacker,
+    JSONPacker,
+    JSONUnpacker,
+    UnpackerError,
+    get_packer,
+    get_unpacker,
+    train_zstd_dictionary,
+)
+from heisskleber.file import FileConf, FileWriter
+
+ALGORITHMS = [
+    "zlib",
+    "lzma",
+    pytest.param("zstd", marks=pytest.mark.skipif(not find_spec("zstandard"), reason="zstandard not installed")),
+    pytest.param("lz4", marks=pytest.mark.skipif(not find_spec("lz4"), reason="lz4 not installed")),
+]
+
+DATA: dict[str, Any] = {"sensor": "imu-01", "samples": [{"x": 0.1, "y": 0.2, "z": 9.81}] * 20}
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_roundtrip(algorithm: Any) -> None:
+    payload = CompressedPacker(JSONPacker(), algorithm)(DATA)
+    data, extra = CompressedUnpacker(JSONUnpacker())(memoryview(payload))
+
+    assert len(payload) < len(JSONPacker()(DATA))
+    assert data == DATA
+    assert extra == {}
+
+
+def test_small_payloads_are_left_raw() -> None:
+    payload = CompressedPacker(threshold=64)({"a": 1})
+
+    assert payload == b'\x00{"a": 1}'
+    assert CompressedUnpacker()(payload) == ({"a": 1}, {})
+
+
+def test_incompressible_payloads_are_left_raw() -> None:
+    packer = CompressedPacker(lambda data: data, threshold=0)  # type: ignore[arg-type,return-value]
+    noise = bytes(range(256))
+
+    assert packer(noise) == b"\x00" + noise
+
+
+def test_base64_payloads_are_line_safe() -> None:
+    payload = CompressedPacker(base64=True)(DATA)
+
+    assert b"\n" not in payload
+    assert CompressedUnpacker()(payload)[0] == DATA
+    assert CompressedUnpacker()(payload.decode())[0] == DATA
+
+
+@pytest.mark.parametrize("payload", [b"", b"\x01not zlib", b"\x1fheader", b"#no base64#"])
+def test_corrupt_payloads(payload: bytes) -> None:
+    with pytest.raises(UnpackerError):
+        CompressedUnpacker()(payload)
+
+
+def test_unknown_algorithm() -> None:
+    with pytest.raises(ValueError, match="Unknown compression algorithm"):
+        CompressedPacker(algorithm="brotli")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Unknown compression algorithm"):
+        get_unpacker("json+brotli")
+
+
+def test_registry_names() -> None:
+    packer = get_packer("json+lzma")
+
+    assert isinstance(packer, CompressedPacker)
+    assert packer.algorithm == "lzma"
+    assert get_unpacker("json+lzma")(packer(DATA))[0] == DATA
+
+
+def test_packer_is_picklable() -> None:
+    packer = pickle.loads(pickle.dumps(CompressedPacker(JSONPacker(), "lzma", level=1)))  # noqa: S301
+
+    assert CompressedUnpacker()(packer(DATA))[0] == DATA
+
+
+@pytest.mark.skipif(not find_spec("zstandard"), reason="zstandard not installed")
+def test_zstd_dictionary() -> None:
+    samples = [JSONPacker()({"sensor": f"imu-{i:02}", "x": i / 7, "status": "ok"}) for i in range(1000)]
+    dictionary = train_zstd_dictionary(samples, size=4096)
+    message = {"sensor": "imu-42", "x": 0.5, "status": "ok"}
+
+    plain = CompressedPacker(algorithm="zstd", threshold=0)(message)
+    trained = CompressedPacker(algorithm="zstd", threshold=0, dictionary=dictionary)(message)
+
+    assert len(trained) < len(plain)
+    assert CompressedUnpacker(dictionary=dictionary)(trained)[0] == message
+
+
+@pytest.mark.asyncio
+async def test_file_writer(tmp_path: Path) -> None:
+    writer = FileWriter(FileConf(directory=str(tmp_path), name_fmt="log.txt"), packer=CompressedPacker(base64=True))
+
+    await writer.start()
+    await writer.send_many([DATA, {"a": 1}])
+    await writer.stop()
+
+    unpacker = CompressedUnpacker()
+    lines = (tmp_path / "log.txt").read_bytes().splitlines()
+    assert [unpacker(line)[0] for line in lines] == [DATA, {"a": 1}]
@@ -1,11 +1,10 @@
-import logging
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Literal
 
 import pytest
 
 from heisskleber.core import BaseConf
-from heisskleber.core.config import _check_type
 
 
 @dataclass
@@ -72,13 +71,57 @@ def test_parses_literal() -> None:
     assert config == expected
 
 
-def test_logs_literal_error(caplog: pytest.LogCaptureFixture) -> None:
-    caplog.set_level(logging.ERROR)
+def test_constructor_rejects_literal_mismatch() -> None:
+    with pytest.raises(TypeError, match=r"expected one of \('U', 'D'\), got 4"):
+        ConfigWithLiteral(direction=4)  # type: ignore[arg-type]
 
-    expected = Literal[1, 2, 3]
 
-    with pytest.raises(TypeError):
-        _check_type(4, expected)
+def test_literal_mismatch_names_the_values(caplog: pytest.LogCaptureFixture) -> None:
+    with pytest.raises(TypeError, match=r"ConfigWithLiteral.direction: expected one of \('U', 'D'\), got 'X'"):
+        ConfigWithLiteral.from_dict({"direction": "X"})
+
+    assert not caplog.records
+
+
+@dataclass
+class LiteralOrIntConfig(BaseConf):
+    value: Literal["auto"] | int = "auto"
+
+
+def test_literal_in_union_does_not_log(caplog: pytest.LogCaptureFixture) -> None:
+    assert LiteralOrIntConfig.from_dict({"value": 5}).value == 5
+    assert not caplog.records
+
+
+@dataclass
+class CoercingConfig(BaseConf):
+    directory: Path = Path()
+    rate: float = 1.0
+    limit: float | None = None
+    tags: list[str] | None = None
+
+
+def test_coerces_int_to_float_and_str_to_path() -> None:
+    config = CoercingConfig.from_dict({"directory": "/var/data", "rate": 10, "limit": 3})
+
+    assert config.directory == Path("/var/data")
+    assert isinstance(config.rate, float)
+    assert isinstance(config.limit, float)
+
+
+def test_does_not_coerce_bool_to_float() -> None:
+    with pytest.raises(TypeError, match=r"CoercingConfig\.rate: expected float, got bool"):
+        CoercingConfig(rate=True)
+
+
+def test_checks_generic_container_type() -> None:
+    assert CoercingConfig(tags=["a"]).tags == ["a"]
+    with pytest.raises(TypeError, match="tags"):
+        CoercingConfig(tags="a")  # type: ignore[arg-type]
+
+
+def test_validators_are_compiled_once() -> None:
+    CoercingConfig()
 
-    assert len(caplog.records) == 1
-    assert "4 is not part of (1, 2, 3)" in caplog.text
+    assert CoercingConfig._compiled() is CoercingConfig._compiled()
+    assert CoercingConfig._compiled().field_names == {"directory", "rate", "limit", "tags"}
@@ -0,0 +1,110 @@
+from dataclasses import dataclass, field
+from typing import Any, Literal, NotRequired, TypedDict
+
+import pytest
+
+from heisskleber.core import DataclassPacker, DataclassUnpacker, UnpackerError
+from heisskleber.core.schema import compile_schema
+
+
+@dataclass
+class Position:
+    x: float
+    y: float
+
+
+@dataclass
+class Reading:
+    sensor: str
+    value: float
+    count: int = 0
+    unit: Literal["C", "K"] = "C"
+    position: Position | None = None
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Node:
+    name: str
+    children: list["Node"] = field(default_factory=list)
+    parent: "Node | None" = None
+
+
+class Sample(TypedDict):
+    name: str
+    value: float
+    extra: NotRequired[dict[str, Any]]
+
+
+def test_unpack_dataclass_coerces_int_to_float() -> None:
+    unpacker = DataclassUnpacker(Reading)
+
+    data, extra = unpacker(b'{"sensor": "t1", "value": 21, "position": {"x": 1, "y": 2.5}, "tags": ["a"]}')
+
+    assert data == Reading("t1", 21.0, position=Position(1.0, 2.5), tags=["a"])
+    assert isinstance(data.value, float)
+    assert extra == {}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'{"value": 1.0}',
+        b'{"sensor": "t1", "value": "1.0"}',
+        b'{"sensor": "t1", "value": 1.0, "count": 1.5}',
+        b'{"sensor": "t1", "value": 1.0, "unit": "F"}',
+        b'{"sensor": "t1", "value": 1.0, "tags": [1]}',
+        b'{"sensor": "t1", "value": 1.0, "position": {"x": 1}}',
+    ],
+)
+def test_unpack_dataclass_rejects_invalid_fields(payload: bytes) -> None:
+    unpacker = DataclassUnpacker(Reading)
+
+    with pytest.raises(UnpackerError):
+        unpacker(payload)
+
+
+def test_unpack_typeddict() -> None:
+    unpacker = DataclassUnpacker(Sample)
+
+    data, _ = unpacker(b'{"name": "a", "value": 3}')
+
+    assert data == {"name": "a", "value": 3.0}
+    with pytest.raises(UnpackerError):
+        unpacker(b'{"name": "a", "value": 3, "extra": []}')
+
+
+def test_pack_dataclass_roundtrip() -> None:
+    packer = DataclassPacker(Reading)
+    unpacker = DataclassUnpacker(Reading)
+    reading = Reading("t1", 1.5, count=2, position=Position(0.0, 1.0))
+
+    payload = packer(reading)
+
+    assert packer.emits_bytes
+    assert unpacker(payload)[0] == reading
+
+
+def test_schema_is_compiled_once() -> None:
+    assert compile_schema(Reading) is compile_schema(Reading)
+
+
+def test_schema_rejects_other_types() -> None:
+    with pytest.raises(TypeError):
+        compile_schema(dict)
+
+
+def test_schema_of_recursive_dataclass() -> None:
+    schema = compile_schema(Node)
+    tree = {"name": "root", "children": [{"name": "a", "children": [{"name": "b"}]}], "parent": None}
+
+    node = schema.decode(tree)
+
+    assert node == Node("root", [Node("a", [Node("b")])])
+    assert schema.encode(node) == {
+        "name": "root",
+        "children": [{"name": "a", "children": [{"name": "b", "children": [], "parent": None}], "parent": None}],
+        "parent": None,
+    }
+    with pytest.raises(TypeError):
+        schema.decode({"name": "root", "children": [{"name": 1, "children": "x"}]})
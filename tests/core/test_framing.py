@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from heisskleber.core import (
+    CobsFramer,
+    DelimiterFramer,
+    Framer,
+    FramingError,
+    LengthPrefixFramer,
+    SlipFramer,
+    create_framer,
+)
+
+PAYLOADS = [
+    b"a",
+    bytes(range(256)) * 3,
+    b"\x00" * 300,
+    b"\x01" * 254,
+    b"\x01" * 508 + b"\x00",
+    b"\xc0\xdb\xdc\xdd",
+    b"x" * 100_000,  # larger than a StreamReader line
+]
+
+
+def _feed_in_chunks(framer: Framer, stream: bytes, seed: int) -> list[bytes]:
+    rng = random.Random(seed)  # noqa: S311
+    frames: list[bytes] = []
+    position = 0
+    while position < len(stream):
+        size = rng.randint(1, 4096)
+        frames.extend(framer.feed(memoryview(stream)[position : position + size]))
+        position += size
+    return frames
+
+
+@pytest.mark.parametrize(
+    "framer",
+    [CobsFramer(), SlipFramer(), LengthPrefixFramer(4, "big"), LengthPrefixFramer(4, "little")],
+    ids=repr,
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_binary_roundtrip_over_arbitrary_chunks(framer: Framer, seed: int) -> None:
+    stream = b"".join(framer.encode(payload) for payload in PAYLOADS)
+
+    assert _feed_in_chunks(framer, stream, seed) == PAYLOADS
+
+
+def test_delimiter_split_between_chunks() -> None:
+    framer = DelimiterFramer(b"\r\n")
+
+    assert framer.feed(b"first\r") == []
+    assert framer.feed(b"\nsecond\r\n\r\nthird") == [b"first", b"second"]
+    assert framer.flush() == [b"third"]
+    assert framer.feed(b"fourth\r\n") == [b"fourth"]
+
+
+def test_delimiter_drops_oversized_frame_until_next_delimiter() -> None:
+    framer = DelimiterFramer(b"\n", max_size=4)
+
+    assert framer.feed(b"ok\n0123456") == [b"ok"]
+    assert framer.feed(b"789\nnext\n") == [b"next"]
+    assert framer.dropped == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_delimiter_limit_does_not_depend_on_chunking(chunk_size: int) -> None:
+    framer = DelimiterFramer(b"\n", max_size=4)
+    stream = b"ok\n0123456\nfour\nfive5\n"
+
+    frames = [frame for i in range(0, len(stream), chunk_size) for frame in framer.feed(stream[i : i + chunk_size])]
+
+    assert frames == [b"ok", b"four"]
+    assert framer.dropped == 2
+
+
+def test_cobs_drops_corrupt_frame() -> None:
+    framer = CobsFramer()
+
+    assert framer.feed(b"\x05ab\x00" + framer.encode(b"valid")) == [b"valid"]
+    assert framer.dropped == 1
+
+
+def test_cobs_encoding() -> None:
+    framer = CobsFramer()
+
+    assert framer.encode(b"") == b"\x01\x00"
+    assert framer.encode(b"\x00") == b"\x01\x01\x00"
+    assert framer.encode(b"\x11\x22\x00\x33") == b"\x03\x11\x22\x02\x33\x00"
+
+
+def test_slip_skips_empty_frames() -> None:
+    framer = SlipFramer()
+
+    assert framer.feed(b"\xc0\xc0" + framer.encode(b"\xc0") + b"\xc0") == [b"\xc0"]
+
+
+def test_length_prefix() -> None:
+    framer = LengthPrefixFramer(2, "little")
+
+    assert framer.encode(b"abc") == b"\x03\x00abc"
+    assert framer.feed(b"\x00\x00\x01\x00") == [b""]
+    assert framer.feed(b"z") == [b"z"]
+    with pytest.raises(FramingError, match="too long"):
+        framer.encode(b"x" * 65536)
+
+
+def test_length_prefix_rejects_oversized_frame() -> None:
+    framer = LengthPrefixFramer(4, max_size=10)
+
+    assert framer.feed(b"\x00\x00\x00\x01a\x00\x00\x01\x00") == [b"a"]
+    with pytest.raises(FramingError, match="exceeds"):
+        framer.feed(b"")
+    assert framer.feed(b"\x00\x00\x00\x01b") == [b"b"]
+
+
+def test_split_datagram() -> None:
+    assert create_framer("delimiter", b"\r\n").split(b"a\r\nb") == [b"a", b"b"]
+    with pytest.raises(FramingError, match="Incomplete"):
+        create_framer("u16be").split(b"\x00\x05abc")
+
+
+@pytest.mark.parametrize("name", ["delimiter", "u16be", "u16le", "u32be", "u32le", "cobs", "slip"])
+def test_create_framer(name: str) -> None:
+    framer = create_framer(name)
+
+    assert framer.feed(framer.encode(b"payload")) == [b"payload"]
+
+
+def test_create_framer_unknown() -> None:
+    with pytest.raises(ValueError, match="Unknown framing"):
+        create_framer("netstring")
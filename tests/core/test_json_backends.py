@@ -0,0 +1,60 @@
+import sys
+from importlib.util import find_spec
+from typing import Any
+
+import pytest
+
+from heisskleber.core import PackerError, UnpackerError, get_packer, get_unpacker, json_packer, json_unpacker
+from heisskleber.core.packer import JSONPacker
+from heisskleber.core.unpacker import JSONUnpacker
+
+BACKENDS = [
+    pytest.param("json", id="stdlib"),
+    pytest.param("fastjson", id="fastjson"),
+    pytest.param("orjson", marks=pytest.mark.skipif(not find_spec("orjson"), reason="orjson not installed")),
+    pytest.param("msgspec", marks=pytest.mark.skipif(not find_spec("msgspec"), reason="msgspec not installed")),
+]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_roundtrip(name: str) -> None:
+    data: dict[str, Any] = {"string": "value", "number": 42, "float": 3.14, "nested": {"bool": True, "list": [1, 2]}}
+
+    payload = get_packer(name)(data)
+    result, extra = get_unpacker(name)(payload)
+
+    assert isinstance(payload, bytes)
+    assert result == data
+    assert extra == {}
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_pack_error(name: str) -> None:
+    with pytest.raises(PackerError):
+        get_packer(name)({"key": object()})
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_unpack_error(name: str) -> None:
+    with pytest.raises(UnpackerError):
+        get_unpacker(name)(b'{"key": ')
+
+
+def test_json_is_stdlib_singleton() -> None:
+    assert get_packer("json") is json_packer
+    assert get_unpacker("json") is json_unpacker
+
+
+def test_fastjson_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+
+    assert isinstance(get_packer("fastjson"), JSONPacker)
+    assert isinstance(get_unpacker("fastjson"), JSONUnpacker)
+
+
+def test_unknown_name_raises() -> None:
+    with pytest.raises(ValueError, match="Unknown packer"):
+        get_packer("nope")
+    with pytest.raises(ValueError, match="Unknown unpacker"):
+        get_unpacker("nope")
@@ -0,0 +1,61 @@
+import pytest
+
+from heisskleber.core import LatencyHistogram, Metadata
+from heisskleber.core.latency import arrival, stamp
+
+
+def test_quantiles_are_bucket_bounds() -> None:
+    histogram = LatencyHistogram(bounds=[0.001, 0.01, 0.1])
+    for latency in [0.0005] * 90 + [0.005] * 9 + [0.05]:
+        histogram.observe(latency)
+
+    assert histogram.counts == [90, 9, 1, 0]
+    assert histogram.quantile(0.5) == 0.001
+    assert histogram.quantile(0.95) == 0.01
+    assert histogram.quantile(1.0) == 0.05  # capped by the maximum
+    assert histogram.summary()["count"] == 100
+    assert histogram.summary()["mean"] == pytest.approx(0.0014)
+
+
+def test_overflow_bucket() -> None:
+    histogram = LatencyHistogram(bounds=[1.0])
+    histogram.observe(3.0)
+
+    assert histogram.counts == [0, 1]
+    assert histogram.quantile(0.5) == 3.0
+
+
+def test_empty_and_reset() -> None:
+    histogram = LatencyHistogram()
+
+    assert histogram.quantile(0.99) == 0.0
+    histogram.observe(0.1)
+    histogram.reset()
+    assert histogram.summary() == {"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="ascending"):
+        LatencyHistogram(bounds=[1.0, 0.1])
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        LatencyHistogram().quantile(1.5)
+
+
+def test_observe_from_metadata() -> None:
+    meta: dict[str, float] = {}
+    stamp(meta, (100.0, 1_700_000_000.0))
+    histogram = LatencyHistogram(bounds=[0.01, 0.1, 1.0])
+
+    histogram.observe_since_arrival(meta, now=100.05)
+    histogram.observe_transit(meta, sent=1_699_999_999.5)
+    histogram.observe_end_to_end(1_699_999_999.5, now=1_700_000_000.02)
+
+    assert histogram.counts == [0, 1, 2, 0]
+
+
+def test_stamp_metadata_slots() -> None:
+    meta = Metadata(topic="a")
+    stamp(meta, arrival())
+
+    assert meta._extra is None
+    assert set(meta) == {"topic", "arrival", "arrival_time"}
@@ -0,0 +1,71 @@
+import pickle
+
+import pytest
+
+from heisskleber.core import Metadata
+
+
+def test_mapping_interface() -> None:
+    meta = Metadata(topic="sensors/imu", sequence=3)
+    meta["records"] = 2
+
+    assert meta == {"topic": "sensors/imu", "sequence": 3, "records": 2}
+    assert list(meta) == ["topic", "sequence", "records"]
+    assert len(meta) == 3
+    assert "topic" in meta
+    assert "timestamp" not in meta
+    assert meta.get("timestamp") is None
+    with pytest.raises(KeyError):
+        meta["timestamp"]
+
+
+def test_fields_can_be_unset() -> None:
+    meta = Metadata(topic="a", transport="mqtt")
+
+    del meta["topic"]
+    meta.pop("transport")
+
+    assert meta == {}
+    with pytest.raises(KeyError):
+        del meta["topic"]
+    with pytest.raises(KeyError):
+        del meta["other"]
+
+
+def test_unpacker_metadata_is_kept() -> None:
+    extra = {"records": 4}
+    meta = Metadata(extra, topic="a")
+
+    assert meta._extra is extra  # not copied
+    assert meta == {"topic": "a", "records": 4}
+
+
+def test_unpacker_fields_move_to_slots() -> None:
+    meta = Metadata({"topic": "from unpacker", "records": 4}, sequence=1)
+
+    assert meta.topic == "from unpacker"
+    assert meta._extra == {"records": 4}
+
+
+def test_none_can_be_set_as_item() -> None:
+    meta = Metadata()
+    meta["source"] = None
+
+    assert meta == {"source": None}
+
+
+def test_update_copy_and_pickle() -> None:
+    meta = Metadata(topic="a")
+    meta.update({"timestamp": 1.5, "filepath": "log.txt", "extra": True})
+
+    copied = meta.copy()
+    restored = pickle.loads(pickle.dumps(meta))  # noqa: S301
+
+    assert copied == {"topic": "a", "filepath": "log.txt", "timestamp": 1.5, "extra": True}
+    assert type(copied) is dict
+    assert isinstance(restored, Metadata)
+    assert restored == meta
+
+
+def test_has_no_instance_dict() -> None:
+    assert not hasattr(Metadata(topic="a"), "__dict__")
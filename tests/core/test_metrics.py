@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+
+from heisskleber.core import LoggingExporter, Metrics, UnpackerError, collect_metrics, export_metrics, json_unpacker
+from heisskleber.file import FileConf, FileWriter
+from heisskleber.udp import UdpConf, UdpReceiver
+from heisskleber.udp.receiver import UdpProtocol
+
+
+def test_receiver_metrics_are_disabled_by_default() -> None:
+    receiver = UdpReceiver(UdpConf())
+
+    assert receiver.metrics is None
+    assert receiver.unpacker is json_unpacker
+
+
+def test_enable_metrics_counts_unpacked_messages() -> None:
+    receiver = UdpReceiver(UdpConf())
+    metrics = receiver.enable_metrics()
+
+    receiver.unpacker(b'{"a": 1}')
+    receiver.unpacker(b'{"b": 2}')
+    with pytest.raises(UnpackerError):
+        receiver.unpacker(b"not json")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["kind"] == "receiver"
+    assert snapshot["name"] == repr(receiver)
+    assert snapshot["messages"] == 2
+    assert snapshot["bytes"] == 16
+    assert snapshot["errors"] == 1
+    assert snapshot["codec_seconds"] > 0
+    assert snapshot["last_message_age"] >= 0
+    assert snapshot["queue_depth"] == 0
+
+
+def test_enable_metrics_is_idempotent_and_can_be_disabled() -> None:
+    receiver = UdpReceiver(UdpConf())
+
+    metrics = receiver.enable_metrics()
+    assert receiver.enable_metrics() is metrics
+
+    receiver.disable_metrics()
+    assert receiver.metrics is None
+    assert receiver.unpacker is json_unpacker
+
+
+def test_collect_metrics_only_reports_live_instances() -> None:
+    receiver = UdpReceiver(UdpConf(port=40001))
+    receiver.enable_metrics()
+    names = [snapshot["name"] for snapshot in collect_metrics()]
+    assert repr(receiver) in names
+
+    receiver.disable_metrics()
+    names = [snapshot["name"] for snapshot in collect_metrics()]
+    assert repr(receiver) not in names
+
+
+@pytest.mark.asyncio
+async def test_udp_receiver_counts_drops_and_high_water_mark() -> None:
+    receiver = UdpReceiver(UdpConf(max_queue_size=2))
+    metrics = receiver.enable_metrics()
+    receiver._is_connected = True
+    protocol = UdpProtocol(receiver._queue)
+
+    for _ in range(3):
+        protocol.datagram_received(b'{"a": 1}', ("127.0.0.1", 1234))
+    await receiver.receive()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["drops"] == 1
+    assert snapshot["high_water_mark"] == 2
+    assert snapshot["queue_depth"] == 1
+
+
+@pytest.mark.asyncio
+async def test_file_writer_counts_packed_bytes(tmp_path) -> None:
+    writer: FileWriter[dict[str, Any]] = FileWriter(FileConf(directory=str(tmp_path), batch_interval=60))
+    metrics = writer.enable_metrics()
+
+    await writer.send({"a": 1})
+    await writer.send({"b": 2})
+    assert metrics.snapshot()["queue_depth"] == 2
+    await writer.stop()
+
+    assert metrics.kind == "sender"
+    assert metrics.messages == 2
+    assert metrics.bytes == 16
+    assert metrics.snapshot()["high_water_mark"] == 2
+
+
+@pytest.mark.asyncio
+async def test_export_metrics_passes_snapshots_to_exporter(caplog: pytest.LogCaptureFixture) -> None:
+    receiver = UdpReceiver(UdpConf(port=40002))
+    receiver.enable_metrics()
+
+    task = asyncio.create_task(export_metrics(LoggingExporter(), interval=0.01))
+    with caplog.at_level(logging.INFO, logger="heisskleber.metrics"):
+        await asyncio.sleep(0.05)
+    task.cancel()
+
+    assert any(repr(receiver) in record.getMessage() for record in caplog.records)
+
+
+def test_gauges_are_evaluated_on_snapshot() -> None:
+    depth = [0]
+    metrics = Metrics(name="test", kind="receiver", gauges={"queue_depth": lambda: depth[0]})
+
+    depth[0] = 5
+    metrics.observe_queue(5)
+    metrics.observe_queue(3)
+
+    assert metrics.snapshot()["queue_depth"] == 5
+    assert metrics.high_water_mark == 5
+    assert metrics.snapshot()["last_message_age"] is None
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import pickle
+from typing import Any
+
+import pytest
+
+from heisskleber.core import (
+    JSONPacker,
+    JSONUnpacker,
+    OffloadReceiver,
+    OffloadSender,
+    PackerError,
+    UnpackerError,
+    get_unpacker,
+)
+from tests.conftest import ListSender, QueueReceiver
+
+
+def raw_receiver(payloads: list[Any]) -> QueueReceiver:
+    return QueueReceiver(payloads, "raw", unpacker=get_unpacker("raw"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_offload_receiver_preserves_order(executor: str) -> None:
+    payloads = [json.dumps({"i": i}).encode() for i in range(50)]
+    unpacker = JSONUnpacker()
+    receiver = OffloadReceiver(raw_receiver(payloads), unpacker, executor, workers=2, batch_size=4)  # type: ignore[arg-type]
+
+    async with receiver:
+        received = [await receiver.receive() for _ in range(10)]
+        while len(received) < len(payloads):
+            received.extend(await receiver.receive_many(max_items=7))
+
+    assert [data["i"] for data, _ in received] == list(range(50))
+    assert all(meta == {"topic": "raw"} for _, meta in received)
+
+
+@pytest.mark.asyncio
+async def test_offload_receiver_raises_unpacker_errors_in_order() -> None:
+    receiver = OffloadReceiver(raw_receiver([b'{"i": 0}', b"invalid", b'{"i": 2}']), JSONUnpacker(), "thread")
+
+    async with receiver:
+        assert [data for data, _ in await receiver.receive_many()] == [{"i": 0}]
+        with pytest.raises(UnpackerError):
+            await receiver.receive()
+        assert (await receiver.receive())[0] == {"i": 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_offload_metrics_count_the_work_of_the_pool(executor: str) -> None:
+    payloads = [b'{"i": 0}', b"invalid", b'{"i": 2}']
+    receiver = OffloadReceiver(raw_receiver(payloads), JSONUnpacker(), executor, workers=1)  # type: ignore[arg-type]
+    sender = OffloadSender(ListSender(), JSONPacker(), executor=executor, workers=1)  # type: ignore[arg-type]
+    receiver_metrics = receiver.enable_metrics()
+    sender_metrics = sender.enable_metrics()
+
+    async with receiver, sender:
+        await receiver.receive_many()
+        with pytest.raises(UnpackerError):
+            await receiver.receive()
+        await receiver.receive()
+        await sender.send_many([{"i": 0}, {"i": 1}])
+        with pytest.raises(PackerError):
+            await sender.send(object())
+
+    assert (receiver_metrics.messages, receiver_metrics.errors, receiver_metrics.bytes) == (2, 1, 16)
+    assert (sender_metrics.messages, sender_metrics.errors, sender_metrics.bytes) == (2, 1, 16)
+    assert receiver_metrics.codec_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_offload_receiver_continues_after_an_error_of_the_wrapped_receiver() -> None:
+    inner = raw_receiver([b'{"i": 0}', ConnectionError(), b'{"i": 2}', StopAsyncIteration()])
+    receiver = OffloadReceiver(inner, JSONUnpacker(), "thread", batch_size=1)  # type: ignore[arg-type]
+
+    async with receiver:
+        assert (await receiver.receive())[0] == {"i": 0}
+        with pytest.raises(ConnectionError):
+            await receiver.receive()
+        assert (await asyncio.wait_for(receiver.receive(), timeout=1))[0] == {"i": 2}
+        for _ in range(2):
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(receiver.receive(), timeout=1)
+
+
+@pytest.mark.parametrize("error", [UnpackerError(b"invalid"), PackerError({"i": 0})])
+def test_codec_errors_survive_a_pickle_round_trip(error: Exception) -> None:
+    restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+    assert type(restored) is type(error)
+    assert str(restored) == str(error)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_offload_sender_packs_batches_in_order(executor: str) -> None:
+    inner = ListSender()
+    sender = OffloadSender(inner, JSONPacker(), executor=executor, workers=2, batch_size=3)  # type: ignore[arg-type]
+
+    async with sender:
+        await sender.send({"i": -1})
+        await sender.send_many([{"i": i} for i in range(10)])
+
+    assert [json.loads(payload)["i"] for payload, _ in inner.sent] == list(range(-1, 10))
+
+
+def test_offload_rejects_unknown_executor() -> None:
+    with pytest.raises(ValueError, match="Unknown executor"):
+        OffloadSender(ListSender(), JSONPacker(), executor="cluster")  # type: ignore[arg-type]
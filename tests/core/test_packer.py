@@ -5,7 +5,7 @@ from typing import Any
 import pytest
 
 from heisskleber.core import Packer, json_packer
-from heisskleber.core.packer import PackerError
+from heisskleber.core.packer import PackerError, as_buffer, packs_bytes
 
 
 @pytest.fixture
@@ -63,3 +63,17 @@ def test_large_dict(packer: Packer[dict[str, Any]]) -> None:
     result = packer(test_data)
     # Verify it can be decoded back
     assert json.loads(result.decode()) == test_data
+
+
+def test_json_packer_declares_bytes(packer: Packer[dict[str, Any]]) -> None:
+    assert packs_bytes(packer)
+    assert not packs_bytes(json.dumps)
+
+
+def test_as_buffer_does_not_copy_bytes_like() -> None:
+    data = bytearray(b"payload")
+    view = memoryview(data)
+
+    assert as_buffer("payload") == b"payload"
+    assert as_buffer(data) is data
+    assert as_buffer(view) is view
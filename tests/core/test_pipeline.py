@@ -0,0 +1,106 @@
+from collections.abc import Iterable
+from typing import Any
+
+import pytest
+
+from heisskleber.core import Pipeline, Stage, UnpackerError
+from tests.conftest import ListSender, QueueReceiver
+
+
+def list_receiver(values: list[Any], topic: str = "test") -> QueueReceiver:
+    return QueueReceiver(values, topic, finite=True, name=f"ListReceiver({topic})")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_forwards_with_topic() -> None:
+    receiver = list_receiver([1, 2, 3])
+    sender = ListSender()
+
+    await Pipeline(receiver, sender).run()
+
+    assert sender.sent == [(1, {"topic": "test"}), (2, {"topic": "test"}), (3, {"topic": "test"})]
+    assert receiver.started
+    assert receiver.stopped
+
+
+@pytest.mark.asyncio
+async def test_pipeline_applies_stages_in_order() -> None:
+    async def double(data: int, meta: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        return data * 2, meta
+
+    def only_large(data: int, meta: dict[str, Any]) -> tuple[int, dict[str, Any]] | None:
+        return (data, meta) if data > 2 else None
+
+    sender = ListSender()
+    pipeline = Pipeline(list_receiver([1, 2, 3]), sender, stages=[double, Stage(only_large, name="filter")])
+    await pipeline.run()
+
+    assert [data for data, _ in sender.sent] == [4, 6]
+    stats = {s.name: s for s in pipeline.stats()}
+    assert stats["stage[0]:double"].processed == 3
+    assert stats["stage[1]:filter"].dropped == 1
+    assert stats["sink[0]:ListSender(sink)"].processed == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_fans_out_and_drops_for_slow_sink() -> None:
+    fast = ListSender("fast")
+    slow = ListSender("slow", delay=0.05)
+    pipeline = Pipeline(list_receiver(list(range(50))), [fast, slow], queue_size=5, batch_size=5)
+
+    await pipeline.run()
+
+    assert [data for data, _ in fast.sent] == list(range(50))
+    stats = {s.name: s for s in pipeline.stats()}
+    assert stats["sink[1]:ListSender(slow)"].dropped > 0
+    assert len(slow.sent) + stats["sink[1]:ListSender(slow)"].dropped == 50
+
+
+@pytest.mark.asyncio
+async def test_pipeline_counts_unpack_errors() -> None:
+    sender = ListSender()
+    pipeline = Pipeline(
+        [list_receiver([1, UnpackerError(b"negative"), 2], topic="a"), list_receiver([3], topic="b")], sender
+    )
+
+    await pipeline.run()
+
+    assert sorted(data for data, _ in sender.sent) == [1, 2, 3]
+    stats = {s.name: s for s in pipeline.stats()}
+    assert stats["source[0]:ListReceiver(a)"].errors == 1
+
+
+class FailingSender(ListSender):
+    async def send_many(self, items: Iterable[int], **kwargs: Any) -> None:
+        if kwargs["topic"] == "fail":
+            raise ConnectionError
+        await super().send_many(items, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_counts_only_the_failed_group_of_a_batch() -> None:
+    def route(data: int, meta: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        return data, {"topic": "fail" if data == 5 else "ok"}
+
+    sender = FailingSender(delay=0.01)  # the first batch is sent while the others queue up
+    pipeline = Pipeline(list_receiver(list(range(10))), sender, stages=[route])
+
+    await pipeline.run()
+
+    assert [data for data, _ in sender.sent] == [0, 1, 2, 3, 4, 6, 7, 8, 9]
+    stats = {s.name: s for s in pipeline.stats()}
+    assert stats["sink[0]:ListSender(sink)"].errors == 1
+    assert stats["sink[0]:ListSender(sink)"].processed == 9
+
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_separate_stats_for_equal_reprs() -> None:
+    senders = [ListSender(), ListSender()]
+    pipeline = Pipeline([list_receiver([1, 2]), list_receiver([3])], senders)
+
+    await pipeline.run()
+
+    stats = {s.name: s.processed for s in pipeline.stats()}
+    assert stats["source[0]:ListReceiver(test)"] == 2
+    assert stats["source[1]:ListReceiver(test)"] == 1
+    assert stats["sink[0]:ListSender(sink)"] == stats["sink[1]:ListSender(sink)"] == 3
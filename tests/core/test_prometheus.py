@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from heisskleber.core import PrometheusExporter, render_prometheus
+from heisskleber.udp import UdpConf, UdpReceiver
+
+
+async def _get(port: int, path: str, method: str = "GET") -> tuple[str, str]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    response = (await reader.read()).decode()
+    writer.close()
+    head, body = response.split("\r\n\r\n", 1)
+    return head.split("\r\n")[0], body
+
+
+def test_render_prometheus_text_format() -> None:
+    snapshot = {
+        "name": 'Udp"Receiver',
+        "kind": "receiver",
+        "messages": 3,
+        "bytes": 42,
+        "drops": 1,
+        "last_message_age": None,
+        "queue_depth": 2,
+    }
+
+    text = render_prometheus([snapshot])
+
+    assert "# TYPE heisskleber_messages_total counter\n" in text
+    assert 'heisskleber_messages_total{name="Udp\\"Receiver",kind="receiver"} 3\n' in text
+    assert 'heisskleber_drops_total{name="Udp\\"Receiver",kind="receiver"} 1\n' in text
+    assert "# TYPE heisskleber_queue_depth gauge\n" in text
+    assert "heisskleber_last_message_age_seconds" not in text
+
+
+@pytest.mark.asyncio
+async def test_prometheus_exporter_serves_live_metrics() -> None:
+    receiver = UdpReceiver(UdpConf(port=40003))
+    receiver.enable_metrics()
+    receiver.unpacker(b'{"a": 1}')
+
+    async with PrometheusExporter(port=0) as exporter:
+        status, body = await _get(exporter.port, "/metrics")
+        not_found, _ = await _get(exporter.port, "/other")
+        not_allowed, _ = await _get(exporter.port, "/metrics", method="POST")
+
+    assert status == "HTTP/1.1 200 OK"
+    assert f'heisskleber_messages_total{{name="{receiver!r}",kind="receiver",id="{receiver.metrics.id}"}} 1\n' in body
+    assert not_found == "HTTP/1.1 404 Not Found"
+    assert not_allowed == "HTTP/1.1 405 Method Not Allowed"
+
+
+def test_render_prometheus_keeps_components_with_the_same_name_apart() -> None:
+    first, second = UdpReceiver(UdpConf(port=40004)), UdpReceiver(UdpConf(port=40004))
+    snapshots = [first.enable_metrics().snapshot(), second.enable_metrics().snapshot()]
+
+    lines = [
+        line for line in render_prometheus(snapshots).splitlines() if line.startswith("heisskleber_messages_total")
+    ]
+
+    assert len(lines) == 2
+    assert len({line.split("}")[0] for line in lines}) == 2
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 import pytest
@@ -48,3 +49,54 @@ async def test_mock_receiver_call_anext() -> None:
     data, meta = await anext(receiver)
 
     assert meta["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_receive_many_default_returns_single_message() -> None:
+    receiver = MockReceiver()
+
+    batch = await receiver.receive_many(max_items=10)
+
+    assert len(batch) == 1
+    assert batch[0][1]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_receive_many_default_collects_until_max_items() -> None:
+    receiver = MockReceiver()
+
+    batch = await receiver.receive_many(max_items=5, timeout=1.0)
+
+    assert [meta["count"] for _, meta in batch] == [1, 2, 3, 4, 5]
+
+
+class SlowReceiver(MockReceiver):
+    """Takes 50 ms per message after the first, like a blocking read that must not be interrupted."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.completed = 0
+
+    async def receive(self) -> tuple[bool, dict[str, Any]]:
+        self.n_called += 1
+        if self.n_called > 1:
+            await asyncio.sleep(0.05)
+        self.completed += 1
+        return True, {"count": self.completed}
+
+
+@pytest.mark.asyncio
+async def test_receive_many_default_keeps_a_running_receive_for_the_next_call() -> None:
+    receiver = SlowReceiver()
+
+    batch = await receiver.receive_many(max_items=5, timeout=0.01)
+    assert [meta["count"] for _, meta in batch] == [1]
+
+    batch = await receiver.receive_many(max_items=5)
+    assert [meta["count"] for _, meta in batch] == [2]
+    assert receiver.n_called == 2
+
+    await receiver.receive_many(max_items=5, timeout=0.01)
+    _, meta = await anext(receiver)
+    assert meta["count"] == 4
+    assert receiver.n_called == 4
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from heisskleber.core import create_config, create_receiver, create_sender, register
+from heisskleber.udp import UdpConf, UdpReceiver, UdpSender
+
+
+def test_import_does_not_load_backends() -> None:
+    code = (
+        "import sys, heisskleber\n"
+        "from heisskleber import UdpSender\n"
+        "print(','.join(m for m in ('aiomqtt', 'zmq', 'serial', 'watchfiles', 'yaml') if m in sys.modules))"
+    )
+
+    loaded = subprocess.check_output([sys.executable, "-c", code], text=True).strip()  # noqa: S603
+
+    assert loaded == ""
+
+
+def test_import_does_not_load_optional_core_features() -> None:
+    modules = ("offload", "prometheus", "compression", "runner", "pipeline", "router")
+    code = (
+        "import sys, heisskleber\n"
+        "from heisskleber import UdpSender\n"
+        f"print(','.join(m for m in {modules!r} if 'heisskleber.core.' + m in sys.modules))"
+    )
+
+    loaded = subprocess.check_output([sys.executable, "-c", code], text=True).strip()  # noqa: S603
+
+    assert loaded == ""
+
+
+def test_lazy_core_attribute() -> None:
+    import heisskleber.core
+    from heisskleber.core.offload import OffloadReceiver
+
+    assert heisskleber.core.OffloadReceiver is OffloadReceiver
+    assert "render_prometheus" in dir(heisskleber.core)
+    with pytest.raises(AttributeError):
+        heisskleber.core.NotAFeature  # noqa: B018
+
+
+def test_lazy_attribute() -> None:
+    import heisskleber
+
+    assert heisskleber.UdpConf is UdpConf
+    assert "ZmqSender" in dir(heisskleber)
+    with pytest.raises(AttributeError):
+        heisskleber.NotABackend  # noqa: B018
+
+
+def test_create_sender_from_dict() -> None:
+    sender = create_sender("udp", {"host": "10.0.0.1", "port": 5000})
+
+    assert isinstance(sender, UdpSender)
+    assert sender.config == UdpConf(host="10.0.0.1", port=5000)
+
+
+@pytest.mark.asyncio
+async def test_create_receiver_with_config_and_kwargs() -> None:
+    def unpacker(payload: Any) -> tuple[Any, dict[str, Any]]:
+        return payload, {}
+
+    config = UdpConf(port=5001)
+    receiver = create_receiver("udp", config, unpacker=unpacker)
+
+    assert isinstance(receiver, UdpReceiver)
+    assert receiver.config is config
+    assert receiver.unpacker is unpacker
+
+
+def test_create_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Unknown backend"):
+        create_sender("carrier-pigeon")
+
+
+def test_register_import_string() -> None:
+    register("udp-alias", "heisskleber.udp:UdpSender", "heisskleber.udp:UdpReceiver", "heisskleber.udp:UdpConf")
+
+    assert isinstance(create_config("udp-alias"), UdpConf)
+    assert isinstance(create_sender("udp-alias"), UdpSender)
@@ -0,0 +1,106 @@
+from typing import Any
+
+import pytest
+
+from heisskleber.core import CircuitState, RetryPolicy
+
+
+class Flaky:
+    def __init__(self, failures: int, error: type[Exception] = ConnectionError) -> None:
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+def test_exponential_backoff_is_capped() -> None:
+    policy = RetryPolicy(initial_delay=0.5, max_delay=3.0, jitter=False)
+
+    assert [policy.backoff(n) for n in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_full_jitter_stays_below_backoff() -> None:
+    policy = RetryPolicy(initial_delay=1.0, max_delay=8.0)
+
+    delays = [policy.backoff(4) for _ in range(200)]
+
+    assert all(0 <= delay <= 8.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_run_retries_until_success() -> None:
+    retries: list[tuple[int, float]] = []
+    policy = RetryPolicy(initial_delay=0.001, on_retry=lambda attempt, delay, _: retries.append((attempt, delay)))
+    func = Flaky(failures=2)
+
+    assert await policy.run(func) == "ok"
+    assert func.calls == 3
+    assert [attempt for attempt, _ in retries] == [1, 2]
+    assert policy.stats.attempts == 3
+    assert policy.stats.failures == 2
+    assert policy.stats.successes == 1
+    assert policy.stats.consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_run_gives_up_after_max_attempts() -> None:
+    giveups: list[tuple[int, BaseException]] = []
+    policy = RetryPolicy(initial_delay=0.001, max_attempts=3, on_giveup=lambda n, e: giveups.append((n, e)))
+    func = Flaky(failures=10)
+
+    with pytest.raises(ConnectionError):
+        await policy.run(func)
+
+    assert func.calls == 3
+    assert policy.stats.giveups == 1
+    assert giveups[0][0] == 3
+
+
+@pytest.mark.asyncio
+async def test_run_gives_up_at_deadline() -> None:
+    policy = RetryPolicy(initial_delay=0.05, jitter=False, deadline=0.1)
+    func = Flaky(failures=10)
+
+    with pytest.raises(ConnectionError):
+        await policy.run(func)
+
+    assert func.calls == 2  # 0.05 s until the second attempt, the third would be at 0.15 s
+
+
+@pytest.mark.asyncio
+async def test_run_raises_uncaught_errors_immediately() -> None:
+    policy = RetryPolicy(initial_delay=0.001, catch=ConnectionError)
+    func = Flaky(failures=1, error=ValueError)
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await policy.run(func)
+    assert func.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_closes() -> None:
+    transitions: list[tuple[Any, Any]] = []
+    policy = RetryPolicy(
+        initial_delay=0.001,
+        failure_threshold=2,
+        reset_timeout=0.01,
+        on_state_change=lambda old, new: transitions.append((old, new)),
+    )
+
+    assert await policy.run(Flaky(failures=3)) == "ok"
+
+    assert transitions == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+    assert policy.stats.circuit_opened == 2
+    assert policy.state is CircuitState.CLOSED
@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+
+from heisskleber.core import TopicRouter
+
+
+def names(handlers: tuple) -> list[str]:
+    return [handler.__name__ for handler in handlers]
+
+
+def make_router(*patterns: str, style: str = "mqtt") -> TopicRouter:
+    router: TopicRouter[Any] = TopicRouter(style=style)  # type: ignore[arg-type]
+    for pattern in patterns:
+
+        async def handler(data: Any, meta: dict[str, Any]) -> None:
+            pass
+
+        handler.__name__ = pattern
+        router.add(pattern, handler)
+    return router
+
+
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("sensors/a/temp", ["#", "sensors/#", "sensors/+/temp", "sensors/a/temp", "sensors/+/+"]),
+        ("sensors/a/humidity", ["#", "sensors/#", "sensors/+/+"]),
+        ("sensors", ["#", "sensors/#"]),
+        ("sensors/a", ["#", "sensors/#"]),
+        ("other", ["#"]),
+        ("$SYS/broker", ["$SYS/#"]),
+    ],
+)
+def test_mqtt_wildcards(topic: str, expected: list[str]) -> None:
+    router = make_router("#", "sensors/#", "sensors/+/temp", "sensors/a/temp", "sensors/+/+", "$SYS/#")
+
+    assert names(router.match(topic)) == expected
+
+
+def test_prefix_style_matches_zmq_subscriptions() -> None:
+    router = make_router("", "sens", "sensors.a", "other", style="prefix")
+
+    assert names(router.match("sensors.a.temp")) == ["", "sens", "sensors.a"]
+    assert names(router.match("senso")) == ["", "sens"]
+    assert names(router.match("x")) == [""]
+
+
+def test_matches_are_cached_and_invalidated() -> None:
+    router = make_router("a/+")
+    first = router.match("a/b")
+
+    assert router.match("a/b") is first
+    router.add("a/b", first[0])
+    assert len(router.match("a/b")) == 2
+    router.remove("a/b", first[0])
+    router.remove("a/+", first[0])
+    assert router.match("a/b") == ()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_to_handlers_and_streams() -> None:
+    router: TopicRouter[int] = TopicRouter()
+    received = []
+
+    @router.route("a/+")
+    async def on_a(data: int, meta: dict[str, Any]) -> None:
+        received.append((meta["topic"], data))
+
+    stream = router.stream("#")
+
+    assert await router.dispatch(1, {"topic": "a/x"}) == 2
+    assert await router.dispatch(2, {"topic": "b"}) == 1
+    await stream.stop()
+    assert await router.dispatch(3, {"topic": "c"}) == 0
+
+    assert received == [("a/x", 1)]
+    assert await stream.receive() == (1, {"topic": "a/x"})
+    assert await stream.receive() == (2, {"topic": "b"})
+    assert router.unmatched == 1
@@ -0,0 +1,45 @@
+import asyncio
+import sys
+
+import pytest
+
+import heisskleber
+from heisskleber.core import get_loop_factory
+
+
+def test_run_returns_result_of_coroutine_function() -> None:
+    async def main() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    assert heisskleber.run(main, loop="asyncio") == 42
+    assert heisskleber.run(main(), loop="auto") == 42
+
+
+def test_auto_falls_back_to_asyncio_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # makes the import fail
+
+    assert get_loop_factory("auto") is asyncio.new_event_loop
+    with pytest.raises(ImportError):
+        get_loop_factory("uvloop")
+
+
+def test_unknown_loop_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown event loop"):
+        get_loop_factory("trio")  # type: ignore[arg-type]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="eager tasks need Python 3.12")
+def test_run_with_eager_tasks() -> None:
+    started = []
+
+    async def child() -> None:
+        started.append("child")
+
+    async def main() -> list[str]:
+        task = asyncio.create_task(child())
+        started.append("main")
+        await task
+        return started
+
+    assert heisskleber.run(main, loop="asyncio", eager_tasks=True) == ["child", "main"]
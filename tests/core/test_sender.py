@@ -0,0 +1,31 @@
+from typing import Any
+
+import pytest
+
+from heisskleber import Sender
+
+
+class MockSender(Sender[int]):
+    def __init__(self) -> None:
+        self.sent: list[tuple[int, dict[str, Any]]] = []
+
+    async def send(self, data: int, **kwargs: Any) -> None:
+        self.sent.append((data, kwargs))
+
+    async def start(self) -> None:
+        return
+
+    async def stop(self) -> None:
+        return
+
+    def __repr__(self) -> str:
+        return "MockSender"
+
+
+@pytest.mark.asyncio
+async def test_send_many_default_sends_in_order() -> None:
+    sender = MockSender()
+
+    await sender.send_many(range(3), topic="test")
+
+    assert sender.sent == [(0, {"topic": "test"}), (1, {"topic": "test"}), (2, {"topic": "test"})]
@@ -0,0 +1,105 @@
+import struct
+from dataclasses import dataclass
+
+import pytest
+
+from heisskleber.core import PackerError, StructBatchUnpacker, StructPacker, StructUnpacker, UnpackerError
+
+FIELDS = [("epoch", "d"), ("counter", "I"), ("x", "f"), ("y", "f"), ("z", "f")]
+
+
+@dataclass
+class Sample:
+    epoch: float
+    counter: int
+    x: float
+    y: float
+    z: float
+
+
+def test_unpack_single_record() -> None:
+    unpacker = StructUnpacker(FIELDS)
+
+    data, extra = unpacker(struct.pack("<dIfff", 1.5, 7, 0.5, 0.25, -1.0))
+
+    assert unpacker.record_size == struct.calcsize("<dIfff")
+    assert data == {"epoch": 1.5, "counter": 7, "x": 0.5, "y": 0.25, "z": -1.0}
+    assert extra == {}
+
+
+def test_unpack_into_dataclass_and_roundtrip() -> None:
+    packer = StructPacker(FIELDS, byte_order=">")
+    unpacker = StructUnpacker(FIELDS, byte_order=">", cls=Sample)
+    sample = Sample(1.5, 7, 0.5, 0.25, -1.0)
+
+    data, _ = unpacker(memoryview(packer(sample)))
+
+    assert data == sample
+    assert packer.emits_bytes
+
+
+def test_unpack_wrong_length_raises() -> None:
+    with pytest.raises(UnpackerError):
+        StructUnpacker(FIELDS)(b"\x00" * 3)
+
+
+def test_pack_missing_field_raises() -> None:
+    with pytest.raises(PackerError):
+        StructPacker(FIELDS)({"epoch": 1.0})
+
+
+def test_unpack_into_mismatched_dataclass_raises() -> None:
+    unpacker = StructUnpacker([*FIELDS[:4], ("w", "f")], cls=Sample)
+
+    with pytest.raises(UnpackerError):
+        unpacker(struct.pack("<dIfff", 1.5, 7, 0.5, 0.25, -1.0))
+
+
+@pytest.mark.parametrize("codec", [StructUnpacker, StructPacker])
+def test_invalid_byte_order(codec: type) -> None:
+    with pytest.raises(ValueError, match="Byte order"):
+        codec(FIELDS, byte_order="@")
+
+
+@pytest.mark.parametrize("codec", [StructUnpacker, StructPacker])
+@pytest.mark.parametrize("code", ["3f", "2x", "ff"])
+def test_fields_must_hold_one_value(codec: type, code: str) -> None:
+    with pytest.raises(ValueError, match="exactly one value"):
+        codec([("a", code)])
+
+
+def test_string_fields_with_length_roundtrip() -> None:
+    fields = [("name", "4s"), ("x", "f")]
+
+    data, _ = StructUnpacker(fields)(StructPacker(fields)({"name": b"abcd", "x": 0.5}))
+
+    assert data == {"name": b"abcd", "x": 0.5}
+
+
+def test_batch_unpack_structured_array() -> None:
+    pytest.importorskip("numpy")
+    unpacker = StructBatchUnpacker(FIELDS)
+    payload = b"".join(struct.pack("<dIfff", i * 0.1, i, i, 2 * i, 3 * i) for i in range(1000))
+
+    records, extra = unpacker(payload)
+
+    assert extra == {"records": 1000}
+    assert records["counter"][999] == 999
+    assert records["z"].sum() == 3 * sum(range(1000))
+
+
+def test_batch_unpack_columns() -> None:
+    pytest.importorskip("numpy")
+    unpacker = StructBatchUnpacker([("name", "4s"), ("value", "h")], byte_order="!", columns=True)
+
+    columns, _ = unpacker(struct.pack("!4sh4sh", b"abcd", -1, b"efgh", 2))
+
+    assert list(columns) == ["name", "value"]
+    assert columns["name"].tolist() == [b"abcd", b"efgh"]
+    assert columns["value"].tolist() == [-1, 2]
+
+
+def test_batch_unpack_partial_record_raises() -> None:
+    pytest.importorskip("numpy")
+    with pytest.raises(UnpackerError):
+        StructBatchUnpacker(FIELDS)(b"\x00" * 25)
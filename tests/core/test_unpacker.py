@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Any
 
-from heisskleber.core import Unpacker, json_unpacker
+import pytest
+
+from heisskleber.core import Unpacker, UnpackerError, json_unpacker
 
 
 @dataclass
@@ -53,3 +55,16 @@ def test_nested_dict() -> None:
 
     assert data == {"string": "value", "number": 42, "nested": {"bool": True, "list": [1, 2, 3]}}
     assert extra == {}
+
+
+def test_memoryview_payload() -> None:
+    data, extra = json_unpacker(memoryview(bytearray(b'{"key": "value"}')))
+    assert data == {"key": "value"}
+    assert extra == {}
+
+
+def test_error_with_memoryview_payload() -> None:
+    with pytest.raises(UnpackerError) as excinfo:
+        json_unpacker(memoryview(b'{"key": ' + b"x" * 200))
+
+    assert "..." in str(excinfo.value)
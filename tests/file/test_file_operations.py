@@ -6,6 +6,7 @@ from typing import Any
 import pytest
 from freezegun import freeze_time
 
+from heisskleber.core import json_packer
 from heisskleber.file import FileConf, FileWriter
 
 
@@ -100,3 +101,30 @@ async def test_file_writer_rollover_natural(tmp_path: Path) -> None:
     assert second_file.exists()
     assert "first file" in first_file.read_text()
     assert "second file" in second_file.read_text()
+
+
+@pytest.mark.asyncio
+async def test_file_writer_send_many(config: FileConf) -> None:
+    writer = FileWriter(config)
+
+    await writer.start()
+    await writer.send_many([{"message": i} for i in range(3)])
+    current_file = writer.filename
+    await writer.stop()
+
+    lines = current_file.read_text().splitlines()
+    assert lines == [json.dumps({"message": i}) for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_file_writer_binary_packer(config: FileConf) -> None:
+    """A packer that emits bytes is written in binary mode, without decoding."""
+    writer = FileWriter(config, packer=json_packer)
+
+    await writer.start()
+    await writer.send({"message": "hello"})
+    current_file = writer.filename
+    await writer.stop()
+
+    assert writer._binary
+    assert current_file.read_bytes() == b'{"message": "hello"}\n'
@@ -1,9 +1,11 @@
 import asyncio
+import struct
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from heisskleber.core import StructUnpacker
 from heisskleber.file import FileConf, FileReader
 
 
@@ -36,3 +38,19 @@ async def test_file_receiver(tmp_path: Path) -> None:
     data, extra = await asyncio.wait_for(receiver.receive(), 1.0)
     assert data == "more text"
     await future
+
+
+@pytest.mark.asyncio
+async def test_file_receiver_reads_complete_records(tmp_path: Path) -> None:
+    file = tmp_path / "records"
+    file.touch()
+    receiver = FileReader(FileConf(watchfile=str(file)), unpacker=StructUnpacker([("counter", "I")]))
+
+    future = asyncio.create_task(write_in(file, struct.pack("<II", 1, 2) + b"\x03", 0.1))
+    assert (await asyncio.wait_for(receiver.receive(), 1.0))[0] == {"counter": 1}
+    assert (await asyncio.wait_for(receiver.receive(), 1.0))[0] == {"counter": 2}
+    await future
+
+    future = asyncio.create_task(write_in(file, b"\x00\x00\x00", 0.1))
+    assert (await asyncio.wait_for(receiver.receive(), 1.0))[0] == {"counter": 3}
+    await future
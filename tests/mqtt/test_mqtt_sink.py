@@ -75,3 +75,30 @@ async def test_mqtt_max_queue_size() -> None:
     assert json.loads(second_value)["value"] == "second"
 
     assert sink._send_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_mqtt_send_many_queues_batch() -> None:
+    mqtt_config = MqttConf(max_saved_messages=3)
+
+    sink = MqttSender(config=mqtt_config)
+    sink._sender_task = True  # Skip connection
+
+    await sink.send_many([{"value": i} for i in range(5)], topic="test", qos=1)
+
+    queued = [sink._send_queue.get_nowait() for _ in range(sink._send_queue.qsize())]
+    assert [json.loads(payload)["value"] for payload, _, _, _ in queued] == [2, 3, 4]
+    assert all(item[1:] == ("test", 1, False) for item in queued)
+
+
+@pytest.mark.asyncio
+async def test_mqtt_coalesce_keeps_latest_message_per_topic() -> None:
+    sink = MqttSender(config=MqttConf(max_saved_messages=10, overflow="coalesce"))
+    sink._sender_task = True  # Skip connection
+
+    for topic, value in [("a", 1), ("b", 1), ("a", 2)]:
+        await sink.send({"value": value}, topic=topic)
+
+    queued = [sink._send_queue.get_nowait() for _ in range(sink._send_queue.qsize())]
+    assert [(topic, json.loads(payload)["value"]) for payload, topic, _, _ in queued] == [("a", 2), ("b", 1)]
+    assert sink._send_queue.dropped == 1
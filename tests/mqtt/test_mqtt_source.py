@@ -1,9 +1,10 @@
-from unittest.mock import AsyncMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiomqtt
 import pytest
 
-from heisskleber.core.unpacker import JSONUnpacker
+from heisskleber.core.unpacker import JSONUnpacker, UnpackerError
 from heisskleber.mqtt import MqttConf, MqttReceiver
 
 
@@ -31,3 +32,93 @@ async def test_mqtt_source_receive_message() -> None:
         assert extra["topic"] == test_topic
 
         await mqtt_source.stop()
+
+
+@pytest.mark.asyncio
+async def test_mqtt_source_receive_many_drains_queue() -> None:
+    mock_client = AsyncMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock()
+
+    with patch("aiomqtt.Client", return_value=mock_client):
+        mqtt_source = MqttReceiver(config=MqttConf(), topic="test", unpacker=JSONUnpacker())
+
+        for i in range(5):
+            message = aiomqtt.Message(
+                topic=f"test/{i}", payload=f'{{"value": {i}}}'.encode(), qos=0, retain=False, mid=i, properties=None
+            )
+            await mqtt_source._message_queue.put(message)
+
+        batch = await mqtt_source.receive_many(max_items=3)
+        assert [data["value"] for data, _ in batch] == [0, 1, 2]
+        assert [extra["topic"] for _, extra in batch] == ["test/0", "test/1", "test/2"]
+
+        batch = await mqtt_source.receive_many(max_items=10)
+        assert [data["value"] for data, _ in batch] == [3, 4]
+
+        await mqtt_source.stop()
+
+
+@pytest.mark.asyncio
+async def test_mqtt_source_receive_many_keeps_messages_after_an_unpacker_error() -> None:
+    mqtt_source = MqttReceiver(config=MqttConf(), topic="#", unpacker=JSONUnpacker())
+    mqtt_source._listener_task = True  # Skip connection
+
+    for i, payload in enumerate([b'{"v": 0}', b"invalid", b'{"v": 2}']):
+        message = aiomqtt.Message(topic="a", payload=payload, qos=0, retain=False, mid=i, properties=None)
+        await mqtt_source._message_queue.put(message)
+
+    assert [data["v"] for data, _ in await mqtt_source.receive_many(max_items=10)] == [0]
+    with pytest.raises(UnpackerError):
+        await mqtt_source.receive_many(max_items=10)
+    assert [data["v"] for data, _ in await mqtt_source.receive_many(max_items=10)] == [2]
+
+
+def test_mqtt_source_rejects_spill_policy() -> None:
+    """aiomqtt messages can not be pickled to the spill file."""
+    with pytest.raises(ValueError, match="can not spill"):
+        MqttReceiver(config=MqttConf(overflow="spill"), topic="#")
+
+
+@pytest.mark.asyncio
+async def test_mqtt_source_conflate_keeps_newest_message_per_topic() -> None:
+    unpacked = []
+
+    def unpacker(payload: bytes) -> tuple[bytes, dict]:
+        unpacked.append(payload)
+        return payload, {}
+
+    mqtt_source = MqttReceiver(config=MqttConf(conflate=True), topic="#", unpacker=unpacker)
+    mqtt_source._listener_task = True  # Skip connection
+
+    for topic, payload in [("a", b"1"), ("b", b"1"), ("a", b"2"), ("a", b"3")]:
+        message = aiomqtt.Message(topic=topic, payload=payload, qos=0, retain=False, mid=1, properties=None)
+        await mqtt_source._message_queue.put(message)
+
+    batch = await mqtt_source.receive_many(max_items=10)
+
+    assert batch == [(b"3", {"topic": "a"}), (b"1", {"topic": "b"})]
+    assert unpacked == [b"3", b"1"]
+
+
+@pytest.mark.asyncio
+async def test_mqtt_source_timestamps_messages_in_listener() -> None:
+    async def messages():
+        yield aiomqtt.Message(topic="a", payload=b'{"v": 1}', qos=0, retain=False, mid=1, properties=None)
+
+    mock_client = MagicMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock()
+    mock_client.subscribe = AsyncMock()
+    mock_client.messages = messages()
+
+    with patch("heisskleber.mqtt.receiver.Client", return_value=mock_client):
+        mqtt_source = MqttReceiver(config=MqttConf(timestamps=True, slotted_metadata=True), topic="#")
+        before = time.monotonic()
+        data, meta = await mqtt_source.receive()
+        await mqtt_source.stop()
+
+    assert data == {"v": 1}
+    assert meta["topic"] == "a"
+    assert before <= meta["arrival"] <= time.monotonic()
+    assert "arrival_time" in meta
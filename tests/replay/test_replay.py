@@ -0,0 +1,126 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from heisskleber.core import UnpackerError, get_unpacker
+from heisskleber.replay import LogReader, Recorder, ReplayConf, ReplayReceiver
+from tests.conftest import QueueReceiver
+
+
+def json_receiver(messages: list[tuple[str, bytes]]) -> QueueReceiver:
+    receiver = QueueReceiver(unpacker=get_unpacker("json"))
+    for topic, payload in messages:
+        receiver.put(payload, topic)
+    return receiver
+
+
+MESSAGES = [("a", b'{"v": 1}'), ("b/c", b'{"v": 2}'), ("a", b'{"v": 3}')]
+
+
+async def record(path: Path, messages: list[tuple[str, bytes]]) -> QueueReceiver:
+    receiver = json_receiver(messages)
+    async with Recorder(receiver, path, buffer_size=16) as recorder:
+        assert await recorder.receive() == ({"v": 1}, {"topic": "a"})
+        assert len(await recorder.receive_many(max_items=10, timeout=0.01)) == len(messages) - 1
+    return receiver
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(tmp_path: Path) -> None:
+    path = tmp_path / "capture.hklog"
+    receiver = await record(path, MESSAGES)
+
+    assert receiver.unpacker is not None
+    assert not hasattr(receiver.unpacker, "payloads")  # the original unpacker is restored
+    with LogReader(path) as log:
+        records = list(log)
+    assert [(record.topic, record.payload) for record in records] == MESSAGES
+    assert records[0].arrival <= records[1].arrival <= records[2].arrival
+
+    async with ReplayReceiver(ReplayConf(path=str(path), speed=0)) as replay:
+        replayed = [(data, meta) async for data, meta in replay]
+    assert [data for data, _ in replayed] == [{"v": 1}, {"v": 2}, {"v": 3}]
+    assert [meta["topic"] for _, meta in replayed] == ["a", "b/c", "a"]
+    assert replayed[0][1]["recorded_time"] == records[0].time
+
+
+@pytest.mark.asyncio
+async def test_records_payloads_that_fail_to_unpack(tmp_path: Path) -> None:
+    path = tmp_path / "capture.hklog"
+    receiver = json_receiver([("a", b"not json"), ("a", b"{}")])
+
+    async with Recorder(receiver, path) as recorder:
+        with pytest.raises(UnpackerError):
+            await recorder.receive()
+        await recorder.receive()
+
+    with LogReader(path) as log:
+        assert [(record.topic, record.payload) for record in log] == [(None, b"not json"), ("a", b"{}")]
+
+
+class FullDisk:
+    def __init__(self, file: Any) -> None:
+        self.file = file
+
+    def write(self, chunk: bytes) -> int:
+        raise OSError(28, "No space left on device")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_writes_are_raised(tmp_path: Path) -> None:
+    recorder = Recorder(json_receiver(MESSAGES), tmp_path / "capture.hklog", buffer_size=16)
+    await recorder.start()
+    recorder._file = FullDisk(recorder._file)  # type: ignore[assignment]
+
+    await recorder.receive()
+    await asyncio.wait(recorder._writes)
+    with pytest.raises(OSError, match="No space"):
+        await recorder.receive()
+    assert (await recorder.receive())[0] == {"v": 2}
+    with pytest.raises(OSError, match="No space"):
+        await recorder.stop()
+
+
+@pytest.mark.asyncio
+async def test_replay_keeps_the_recorded_gaps(tmp_path: Path) -> None:
+    path = tmp_path / "capture.hklog"
+    receiver = json_receiver([])
+    async with Recorder(receiver, path) as recorder:
+        for payload in [b"1", b"2"]:
+            receiver.put(payload, "a")
+            await recorder.receive()
+            await asyncio.sleep(0.1)
+
+    async with ReplayReceiver(ReplayConf(path=str(path), speed=2)) as replay:
+        start = time.monotonic()
+        await replay.receive()
+        batch = await replay.receive_many(timeout=0.0)
+        assert time.monotonic() - start == pytest.approx(0.05, abs=0.04)
+        assert [data for data, _ in batch] == [2]
+
+
+@pytest.mark.asyncio
+async def test_replay_skips_truncated_record(tmp_path: Path) -> None:
+    path = tmp_path / "capture.hklog"
+    await record(path, MESSAGES)
+    path.write_bytes(path.read_bytes()[:-3])
+
+    replay: ReplayReceiver[Any] = ReplayReceiver(ReplayConf(path=str(path), speed=0))
+    batch = await replay.receive_many(max_items=10)
+    await replay.stop()
+
+    assert [data for data, _ in batch] == [{"v": 1}, {"v": 2}]
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "capture.txt"
+    path.write_text("hello world")
+
+    with pytest.raises(ValueError, match="not a heisskleber log"):
+        LogReader(path)
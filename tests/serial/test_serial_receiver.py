@@ -0,0 +1,61 @@
+import struct
+from unittest.mock import MagicMock
+
+import pytest
+
+from heisskleber.core import StructBatchUnpacker, StructUnpacker
+from heisskleber.serial import SerialConf, SerialReceiver
+
+
+@pytest.mark.asyncio
+async def test_receive_reads_single_record() -> None:
+    receiver = SerialReceiver(SerialConf(), unpacker=StructUnpacker([("x", "f")]))
+    receiver._ser = MagicMock()
+    receiver._ser.read.return_value = struct.pack("<f", 0.5)
+
+    data, _ = await receiver.receive()
+
+    receiver._ser.read.assert_called_once_with(4)
+    receiver._ser.read_until.assert_not_called()
+    assert data == {"x": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_receive_reads_waiting_records_for_batched_unpacker() -> None:
+    pytest.importorskip("numpy")
+    receiver = SerialReceiver(SerialConf(), unpacker=StructBatchUnpacker([("x", "f")]))
+    receiver._ser = MagicMock()
+    receiver._ser.in_waiting = 13
+    receiver._ser.read.return_value = struct.pack("<fff", 1, 2, 3)
+
+    data, extra = await receiver.receive()
+
+    receiver._ser.read.assert_called_once_with(12)
+    assert data["x"].tolist() == [1, 2, 3]
+    assert extra == {"records": 3}
+
+
+@pytest.mark.asyncio
+async def test_receive_splits_waiting_bytes_into_frames() -> None:
+    receiver = SerialReceiver(SerialConf(framing="cobs"), unpacker=lambda payload: (payload, {}))
+    receiver._ser = MagicMock()
+    receiver._ser.in_waiting = 9
+    receiver._ser.read.side_effect = [b"\x02a\x00\x03b", b"c\x00"]
+
+    assert (await receiver.receive())[0] == b"a"
+    assert (await receiver.receive())[0] == b"bc"
+    receiver._ser.read_until.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_receive_timestamps_frames_of_a_read() -> None:
+    receiver = SerialReceiver(SerialConf(framing="cobs", timestamps=True), unpacker=lambda payload: (payload, {}))
+    receiver._ser = MagicMock()
+    receiver._ser.in_waiting = 6
+    receiver._ser.read.return_value = b"\x02a\x00\x02b\x00"
+
+    _, first = await receiver.receive()
+    _, second = await receiver.receive()
+
+    assert first == second
+    assert set(first) == {"arrival", "arrival_time"}
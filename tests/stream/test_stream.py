@@ -0,0 +1,226 @@
+import asyncio
+import math
+import time
+from typing import Any
+
+import pytest
+
+from heisskleber.core import Pipeline, Receiver
+from heisskleber.stream import Aggregate, Batch, Debounce, Distinct, Filter, Map, Take, Throttle, Window
+from tests.conftest import ListSender, QueueReceiver
+
+
+async def collect(receiver: Receiver[Any]) -> list[Any]:
+    return [data async for data, _ in receiver]
+
+
+@pytest.mark.asyncio
+async def test_operators_chain_and_cascade_start_stop() -> None:
+    source = QueueReceiver(range(10))
+
+    async def double(data: int, meta: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        return data * 2, meta
+
+    stream = Take(Map(Filter(source, lambda data, _: data % 3), double), 4)
+    async with stream:
+        assert source.started
+        assert await collect(stream) == [2, 4, 8, 10]
+    assert source.stopped
+    assert repr(stream) == "Take(Map(Filter(QueueReceiver, <lambda>), double), count=4)"
+
+
+@pytest.mark.asyncio
+async def test_map_drops_none_and_receive_many_skips_dropped_batches() -> None:
+    stream = Map(QueueReceiver([1, 2, 3]), lambda data, meta: (data, meta) if data == 3 else None)
+
+    assert await stream.receive_many(2) == [(3, {"topic": "test"})]
+
+
+@pytest.mark.asyncio
+async def test_take_limits_batches() -> None:
+    stream = Take(QueueReceiver(range(10)), 3)
+
+    assert [data for data, _ in await stream.receive_many(2)] == [0, 1]
+    assert [data for data, _ in await stream.receive_many(100)] == [2]
+    with pytest.raises(StopAsyncIteration):
+        await stream.receive_many()
+
+
+@pytest.mark.asyncio
+async def test_batch_collects_size_or_timeout() -> None:
+    source = QueueReceiver(range(5))
+    stream = Batch(source, size=3, timeout=0.01)
+
+    assert await stream.receive() == ([0, 1, 2], {"count": 3, "messages": [{"topic": "test"}] * 3, "topic": "test"})
+    source.put(5, topic="other")
+    data, meta = await stream.receive()
+    assert data == [3, 4, 5]
+    assert "topic" not in meta
+    source.put(6)
+    assert (await stream.receive())[0] == [6]
+
+
+@pytest.mark.asyncio
+async def test_window_collects_until_the_window_ends(monkeypatch: pytest.MonkeyPatch) -> None:
+    offset = 100.001 - time.monotonic()  # start 1 ms into the window
+    monkeypatch.setattr(time, "time", lambda: offset + time.monotonic())
+    source = QueueReceiver([1, 2])
+    stream = Window(source, 0.05)
+    asyncio.get_running_loop().call_later(0.01, source.put, 3)
+
+    data, meta = await stream.receive()
+
+    assert data == [1, 2, 3]
+    assert meta["window_start"] == pytest.approx(100.0)
+    assert meta["window_end"] == pytest.approx(100.05)
+
+
+@pytest.mark.asyncio
+async def test_window_returns_the_open_window_at_the_end_of_the_stream() -> None:
+    stream = Window(Take(QueueReceiver([1, 2, 3, 4, 5, 6]), 5), 100)
+
+    assert await asyncio.wait_for(collect(stream), timeout=1) == [[1, 2, 3, 4, 5]]
+
+
+@pytest.mark.asyncio
+async def test_throttle_drops_messages_within_the_interval() -> None:
+    source = QueueReceiver([1, 2, 3])
+    stream = Throttle(source, 0.05)
+
+    asyncio.get_running_loop().call_later(0.06, source.put, 4)
+
+    assert (await stream.receive())[0] == 1
+    assert [data for data, _ in await stream.receive_many()] == [4]
+    assert stream.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_debounce_passes_the_last_message_of_a_burst() -> None:
+    source = QueueReceiver([1, 2])
+    stream = Debounce(source, 0.02)
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, source.put, 3)
+    loop.call_later(0.05, source.put, 4)
+
+    assert (await stream.receive())[0] == 3
+    assert (await stream.receive())[0] == 4
+    assert stream.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_debounce_passes_the_last_message_at_the_end_of_the_stream() -> None:
+    stream = Debounce(Take(QueueReceiver([1, 2, 3]), 2), 10)
+
+    assert await collect(stream) == [2]
+
+
+@pytest.mark.asyncio
+async def test_distinct_drops_repeated_keys() -> None:
+    stream = Distinct(QueueReceiver([{"a": 1}, {"a": 1}, {"a": 2}, {"a": 1}, {"a": 1}]))
+    assert [data for data, _ in await stream.receive_many()] == [{"a": 1}, {"a": 2}, {"a": 1}]
+
+    stream = Distinct(QueueReceiver([1, 2, 1, 3, 2]), key=lambda data, _: data, maxsize=2)
+    assert await collect(Take(stream, 3)) == [1, 2, 3]
+    assert stream.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_operators_feed_the_pipeline() -> None:
+    sender = ListSender()
+    stream = Batch(Take(QueueReceiver(range(4)), 4), size=2)
+
+    await Pipeline([stream], [sender]).run()
+
+    assert sender.sent == [([0, 1], {"topic": "test"}), ([2, 3], {"topic": "test"})]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_tumbling_count_windows() -> None:
+    source = QueueReceiver({"x": x, "y": -x, "name": "imu", "ok": True} for x in (3, 4, 0, 1))
+    stream = Aggregate(source, count=2, stats=("count", "mean", "min", "max", "rms"))
+
+    data, meta = await stream.receive()
+
+    assert data == {
+        "x_count": 2,
+        "x_mean": 3.5,
+        "x_min": 3.0,
+        "x_max": 4.0,
+        "x_rms": pytest.approx(math.sqrt(12.5)),
+        "y_count": 2,
+        "y_mean": -3.5,
+        "y_min": -4.0,
+        "y_max": -3.0,
+        "y_rms": pytest.approx(math.sqrt(12.5)),
+    }
+    assert meta == {"count": 2, "topic": "test"}
+    assert (await stream.receive())[0]["x_mean"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_aggregate_sliding_count_windows_and_end_of_stream() -> None:
+    stream = Aggregate(Take(QueueReceiver({"x": x} for x in range(7)), 7), count=4, step=2, fields=["x"])
+
+    assert [data["x_mean"] async for data, _ in stream] == [0.5, 1.5, 3.5, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_time_windows() -> None:
+    source = QueueReceiver([{"x": 1.0}, {"x": 3.0}])
+    stream = Aggregate(source, seconds=0.05, stats=("mean", "max"))
+
+    data, meta = await stream.receive()
+
+    assert data == {"x_mean": 2.0, "x_max": 3.0}
+    assert meta["count"] == 2
+    assert meta["window_end"] - meta["window_start"] == pytest.approx(0.05)
+    assert meta["window_start"] == pytest.approx(round(meta["window_start"] / 0.05) * 0.05)
+
+
+@pytest.mark.asyncio
+async def test_aggregate_numpy_columns() -> None:
+    np = pytest.importorskip("numpy")
+    source = QueueReceiver([{"x": np.array([1.0, 2.0]), "s": "a"}, {"x": 3}])
+    stream = Aggregate(source, count=2, stats=("count", "sum", "max"), numpy=True)
+
+    assert await stream.receive() == ({"x_count": 3, "x_sum": 6.0, "x_max": 3.0}, {"count": 2, "topic": "test"})
+
+
+def test_aggregate_validates_windows() -> None:
+    with pytest.raises(ValueError, match="either"):
+        Aggregate(QueueReceiver(), seconds=1.0, count=10)
+    with pytest.raises(ValueError, match="multiple"):
+        Aggregate(QueueReceiver(), count=10, step=3)
+    with pytest.raises(ValueError, match="Unknown statistics"):
+        Aggregate(QueueReceiver(), count=10, stats=("median",))
+
+
+class SlowReceiver(Receiver[int]):
+    """Reads one message per 30 ms without a queue, a cancelled read loses its message."""
+
+    def __init__(self) -> None:
+        self.read = 0
+
+    async def receive(self, **kwargs: Any) -> tuple[int, dict[str, Any]]:
+        self.read += 1
+        message = self.read
+        await asyncio.sleep(0.03)
+        return message, {}
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return "SlowReceiver"
+
+
+@pytest.mark.asyncio
+async def test_waits_with_a_deadline_do_not_cancel_a_running_receive() -> None:
+    stream = Debounce(SlowReceiver(), 0.01)
+
+    assert [(await stream.receive())[0] for _ in range(3)] == [1, 2, 3]
+    await stream.stop()
+    assert stream._pending_batch is None
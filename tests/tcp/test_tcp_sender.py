@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from heisskleber.core import create_framer, json_unpacker
+from heisskleber.tcp import TcpConf, TcpSender
+
+
+class FrameCollector:
+    """TCP server that splits everything it receives into frames."""
+
+    def __init__(self, framing: str) -> None:
+        self.framer = create_framer(framing)
+        self.frames: list[bytes] = []
+        self.received = asyncio.Event()
+
+    async def handle(self, reader: asyncio.StreamReader, _writer: asyncio.StreamWriter) -> None:
+        while chunk := await reader.read(2**16):
+            self.frames.extend(self.framer.feed(chunk))
+            self.received.set()
+
+    async def wait_for(self, count: int) -> list[bytes]:
+        while len(self.frames) < count:
+            self.received.clear()
+            await asyncio.wait_for(self.received.wait(), 1)
+        return self.frames
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("framing", ["delimiter", "u16le", "cobs"])
+async def test_send_many_frames_payloads(framing: str) -> None:
+    collector = FrameCollector(framing)
+    server = await asyncio.start_server(collector.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    sender: TcpSender[dict[str, int]] = TcpSender(TcpConf(host="127.0.0.1", port=port, framing=framing))
+    try:
+        await sender.send({"message": 0})
+        await sender.send_many([{"message": i} for i in range(1, 4)])
+        frames = await collector.wait_for(4)
+    finally:
+        await sender.stop()
+        server.close()
+
+    assert [json_unpacker(frame)[0] for frame in frames] == [{"message": i} for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_reconnects_after_connection_loss() -> None:
+    collector = FrameCollector("delimiter")
+    server = await asyncio.start_server(collector.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    sender: TcpSender[dict[str, int]] = TcpSender(TcpConf(host="127.0.0.1", port=port))
+    try:
+        await sender.send({"message": 0})
+        sender.writer.close()  # type: ignore[union-attr]
+        await sender.send({"message": 1})
+        frames = await collector.wait_for(2)
+    finally:
+        await sender.stop()
+        server.close()
+
+    assert frames == [b'{"message": 0}', b'{"message": 1}']
@@ -7,6 +7,7 @@ from typing import Any
 import pytest
 import pytest_asyncio
 
+from heisskleber.core import JSONUnpacker, UnpackerError
 from heisskleber.tcp import TcpConf, TcpReceiver
 
 
@@ -191,3 +192,57 @@ def _check_data(data, expected_value: str):
     assert result == {"key0": expected_value}
     assert isinstance(result, dict)
     assert "key0" in result
+
+
+@pytest.mark.asyncio
+async def test_07_receive_many_splits_chunk(mock_conf) -> None:
+    def send_lines(_reader, writer):
+        writer.write(b"a\nb\nc\nd")
+
+    server = await asyncio.start_server(send_lines, port=mock_conf.port)
+    source = TcpReceiver(mock_conf, unpacker=bytes_csv_unpacker)
+    try:
+        batch = await source.receive_many(max_items=2)
+        assert [data["key0"] for data, _ in batch] == ["a", "b"]
+
+        batch = await source.receive_many(max_items=10, timeout=0.1)
+        assert [data["key0"] for data, _ in batch] == ["c"]
+    finally:
+        await source.stop()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_08_length_prefixed_frames_beyond_line_limit(mock_conf) -> None:
+    large = b"x" * 200_000  # a single readline() fails beyond 64 KiB
+
+    def send_frames(_reader, writer):
+        writer.write(len(large).to_bytes(4, "big") + large + b"\x00\x00\x00\x02ok")
+
+    server = await asyncio.start_server(send_frames, port=mock_conf.port)
+    mock_conf.framing = "u32be"
+    source = TcpReceiver(mock_conf, unpacker=lambda payload: (payload, {}))
+    try:
+        first, _ = await source.receive()
+        second, _ = await source.receive()
+        assert (first, second) == (large, b"ok")
+    finally:
+        await source.stop()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_09_receive_many_keeps_messages_after_an_unpacker_error(mock_conf) -> None:
+    def send_lines(_reader, writer):
+        writer.write(b'{"v": 0}\ninvalid\n{"v": 2}\n')
+
+    server = await asyncio.start_server(send_lines, port=mock_conf.port)
+    source = TcpReceiver(mock_conf, unpacker=JSONUnpacker())
+    try:
+        assert [data["v"] for data, _ in await source.receive_many(max_items=10)] == [0]
+        with pytest.raises(UnpackerError):
+            await source.receive_many(max_items=10)
+        assert (await source.receive())[0] == {"v": 2}
+    finally:
+        await source.stop()
+        server.close()
@@ -117,3 +117,26 @@ async def test_actual_udp_transport():
 
     finally:
         await mock_receiver.stop()
+
+
+@pytest.mark.asyncio
+async def test_udp_source_receive_many() -> None:
+    receiver_host = "127.0.0.1"
+    receiver_port = 35700
+    receiver = UdpReceiver(UdpConf(host=receiver_host, port=receiver_port))
+
+    try:
+        await receiver.start()
+
+        sink = MockUdpSender()
+        try:
+            await sink.start(receiver_host, receiver_port)
+            for i in range(3):
+                sink.transport.sendto(data=json.dumps({"message": i}).encode())
+
+            batch = await receiver.receive_many(max_items=10, timeout=0.5)
+            assert [data for data, _ in batch] == [{"message": 0}, {"message": 1}, {"message": 2}]
+        finally:
+            await sink.stop()
+    finally:
+        await receiver.stop()
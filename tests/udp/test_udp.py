@@ -1,10 +1,14 @@
 import asyncio
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from heisskleber.core import UnpackerError
 from heisskleber.udp.config import UdpConf
+from heisskleber.udp.receiver import UdpProtocol as ReceiverProtocol
+from heisskleber.udp.receiver import UdpReceiver
 from heisskleber.udp.sender import UdpProtocol, UdpSender
 
 
@@ -109,6 +113,21 @@ class TestUdpSink:
         mock_transport.sendto.assert_called_once_with(b"custom_packed_data")
         await sink.stop()
 
+    @patch("asyncio.get_running_loop")
+    async def test_send_many(self, mock_get_loop, udp_sink, mock_transport):
+        """Test sending a batch of data through UDP sink."""
+        mock_loop = AsyncMock()
+        mock_loop.create_datagram_endpoint.return_value = (mock_transport, None)
+        mock_get_loop.return_value = mock_loop
+
+        test_data = [{"test": 1}, {"test": 2}]
+        await udp_sink.send_many(test_data)
+
+        mock_loop.create_datagram_endpoint.assert_called_once()
+        assert [c.args[0] for c in mock_transport.sendto.call_args_list] == [
+            json.dumps(data).encode() for data in test_data
+        ]
+
 
 class TestUdpProtocol:
     """Test suite for UdpProtocol class."""
@@ -130,3 +149,81 @@ class TestUdpProtocol:
         test_exception = Exception("Test exception")
         protocol.connection_lost(test_exception)
         assert not protocol.is_connected
+
+
+def test_udp_receiver_rejects_block_policy():
+    """Datagrams can not wait for free space."""
+    with pytest.raises(ValueError, match="can not block"):
+        UdpReceiver(UdpConf(overflow="block"))
+
+
+@pytest.mark.asyncio
+async def test_udp_receiver_conflate_keeps_newest_datagram_per_sender():
+    receiver = UdpReceiver(UdpConf(conflate=True))
+    receiver._is_connected = True  # Skip connection
+    protocol = ReceiverProtocol(receiver._queue)
+
+    for data, port in [(b'{"v": 1}', 1), (b'{"v": 1}', 2), (b'{"v": 2}', 1)]:
+        protocol.datagram_received(data, ("127.0.0.1", port))
+
+    batch = await receiver.receive_many(max_items=10)
+    assert [data["v"] for data, _ in batch] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_udp_receiver_splits_datagrams_at_delimiter():
+    receiver = UdpReceiver(UdpConf(framing="delimiter"))
+    receiver._is_connected = True  # Skip connection
+    protocol = ReceiverProtocol(receiver._queue)
+
+    protocol.datagram_received(b'{"v": 1}\r\n{"v": 2}\r\n', ("127.0.0.1", 1))
+    protocol.datagram_received(b'{"v": 3}', ("127.0.0.1", 1))
+
+    first, _ = await receiver.receive()
+    batch = await receiver.receive_many(max_items=10)
+    assert [first["v"]] + [data["v"] for data, _ in batch] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("framing", [None, "delimiter"])
+async def test_udp_receiver_receive_many_keeps_messages_after_an_unpacker_error(framing):
+    receiver = UdpReceiver(UdpConf(framing=framing))
+    receiver._is_connected = True  # Skip connection
+    protocol = ReceiverProtocol(receiver._queue)
+
+    for data in [b'{"v": 0}', b"invalid", b'{"v": 2}']:
+        protocol.datagram_received(data, ("127.0.0.1", 1))
+
+    assert [data["v"] for data, _ in await receiver.receive_many(max_items=10)] == [0]
+    with pytest.raises(UnpackerError):
+        await receiver.receive_many(max_items=10)
+    assert [data["v"] for data, _ in await receiver.receive_many(max_items=10)] == [2]
+
+
+@pytest.mark.asyncio
+@patch("asyncio.get_running_loop")
+async def test_udp_sender_frames_payloads(mock_get_loop, mock_transport):
+    mock_loop = AsyncMock()
+    mock_loop.create_datagram_endpoint.return_value = (mock_transport, None)
+    mock_get_loop.return_value = mock_loop
+    sender = UdpSender(UdpConf(framing="delimiter", delimiter="\n"))
+
+    await sender.send({"v": 1})
+
+    mock_transport.sendto.assert_called_once_with(b'{"v": 1}\n')
+
+
+@pytest.mark.asyncio
+async def test_udp_receiver_timestamps_datagrams_on_arrival():
+    receiver = UdpReceiver(UdpConf(timestamps=True, framing="delimiter"))
+    receiver._is_connected = True  # Skip connection
+    protocol = ReceiverProtocol(receiver._queue, timestamps=True)
+
+    before = time.monotonic()
+    protocol.datagram_received(b'{"v": 1}\r\n{"v": 2}', ("127.0.0.1", 1))
+    after = time.monotonic()
+
+    batch = await receiver.receive_many(max_items=10)
+    assert [meta["arrival"] for _, meta in batch] == [batch[0][1]["arrival"]] * 2
+    assert before <= batch[0][1]["arrival"] <= after
+    assert abs(batch[0][1]["arrival_time"] - time.time()) < 1
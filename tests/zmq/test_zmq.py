@@ -3,8 +3,10 @@ import logging
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+import zmq
 
-from heisskleber.zmq import ZmqConf, ZmqSender
+from heisskleber.core import Metadata, UnpackerError
+from heisskleber.zmq import ZmqConf, ZmqReceiver, ZmqSender
 
 
 @pytest.mark.asyncio
@@ -45,3 +47,139 @@ async def test_zmq_sender_send_log_records_format(caplog: pytest.LogCaptureFixtu
     assert caplog.records, "expected debug log records from send()"
     for record in caplog.records:
         record.getMessage()  # raises ValueError on malformed format strings
+
+
+@pytest.mark.asyncio
+async def test_zmq_receiver_receive_many_reads_pending_messages() -> None:
+    mock_socket = AsyncMock()
+    mock_socket.connect = Mock(return_value=None)
+    mock_socket.setsockopt = Mock(return_value=None)
+    mock_socket.recv_multipart.side_effect = [
+        [b"a", b'{"value": 1}'],
+        [b"b", b'{"value": 2}'],
+        zmq.Again(),
+    ]
+    mock_context = Mock()
+    mock_context.socket.return_value = mock_socket
+
+    with patch("zmq.asyncio.Context.instance", return_value=mock_context):
+        receiver = ZmqReceiver(ZmqConf(), topic="")
+        batch = await receiver.receive_many(max_items=10)
+
+    assert batch == [({"value": 1}, {"topic": "a"}), ({"value": 2}, {"topic": "b"})]
+    mock_socket.poll.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_zmq_receiver_receive_many_keeps_messages_after_an_unpacker_error() -> None:
+    mock_socket = AsyncMock()
+    mock_socket.connect = Mock(return_value=None)
+    mock_socket.setsockopt = Mock(return_value=None)
+    mock_socket.recv_multipart.side_effect = [[b"a", b'{"v": 0}'], [b"a", b"invalid"], [b"a", b'{"v": 2}'], zmq.Again()]
+    mock_context = Mock()
+    mock_context.socket.return_value = mock_socket
+
+    with patch("zmq.asyncio.Context.instance", return_value=mock_context):
+        receiver = ZmqReceiver(ZmqConf(), topic="")
+        assert [data["v"] for data, _ in await receiver.receive_many(max_items=10)] == [0]
+        with pytest.raises(UnpackerError):
+            await receiver.receive_many(max_items=10)
+        assert (await receiver.receive())[0] == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_zmq_sink_send_many() -> None:
+    mock_socket = AsyncMock()
+    mock_socket.connect = Mock(return_value=None)
+    mock_context = Mock()
+    mock_context.socket.return_value = mock_socket
+
+    with patch("zmq.asyncio.Context.instance", return_value=mock_context):
+        zmq_sink = ZmqSender(ZmqConf(publisher_port=5555))
+        await zmq_sink.send_many([{"value": 1}, {"value": 2}], topic="test")
+
+    assert [c.args[0] for c in mock_socket.send_multipart.call_args_list] == [
+        [b"test", b'{"value": 1}'],
+        [b"test", b'{"value": 2}'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_zmq_receiver_zero_copy_passes_frame_buffer() -> None:
+    mock_socket = AsyncMock()
+    mock_socket.connect = Mock(return_value=None)
+    mock_socket.setsockopt = Mock(return_value=None)
+    mock_socket.recv_multipart.return_value = [zmq.Frame(b"topic"), zmq.Frame(b'{"value": 1}')]
+    mock_context = Mock()
+    mock_context.socket.return_value = mock_socket
+    unpacker = Mock(return_value=({"value": 1}, {}))
+
+    with patch("zmq.asyncio.Context.instance", return_value=mock_context):
+        receiver = ZmqReceiver(ZmqConf(zero_copy=True), topic="", unpacker=unpacker)
+        data, extra = await receiver.receive()
+
+    mock_socket.recv_multipart.assert_awaited_once_with(copy=False)
+    assert isinstance(unpacker.call_args.args[0], memoryview)
+    assert data == {"value": 1}
+    assert extra == {"topic": "topic"}
+
+
+@pytest.mark.asyncio
+async def test_zmq_receiver_conflate_returns_newest_message_per_topic() -> None:
+    mock_socket = AsyncMock()
+    mock_socket.connect = Mock(return_value=None)
+    mock_socket.setsockopt = Mock(return_value=None)
+    mock_socket.recv_multipart.side_effect = [
+        [b"a", b'{"value": 1}'],
+        [b"b", b'{"value": 1}'],
+        [b"a", b'{"value": 2}'],
+        zmq.Again(),
+        zmq.Again(),
+    ]
+    mock_context = Mock()
+    mock_context.socket.return_value = mock_socket
+
+    with patch("zmq.asyncio.Context.instance", return_value=mock_context):
+        receiver = ZmqReceiver(ZmqConf(conflate=True), topic="")
+        first = await receiver.receive()
+        second = await receiver.receive()
+
+    assert first == ({"value": 2}, {"topic": "a"})
+    assert second == ({"value": 1}, {"topic": "b"})
+
+
+@pytest.mark.asyncio
+async def test_zmq_receiver_slotted_metadata() -> None:
+    mock_socket = AsyncMock()
+    mock_socket.connect = Mock(return_value=None)
+    mock_socket.setsockopt = Mock(return_value=None)
+    mock_socket.recv_multipart.side_effect = [[b"a", b'{"value": 1}'], [b"b", b'{"value": 2}']]
+    mock_context = Mock()
+    mock_context.socket.return_value = mock_socket
+
+    with patch("zmq.asyncio.Context.instance", return_value=mock_context):
+        receiver = ZmqReceiver(ZmqConf(slotted_metadata=True), topic="")
+        _, first = await receiver.receive()
+        _, second = await receiver.receive()
+
+    assert isinstance(second, Metadata)
+    assert first == {"topic": "a", "sequence": 1, "transport": "zmq"}
+    assert second["topic"] == "b"
+    assert second["sequence"] == 2
+
+
+@pytest.mark.asyncio
+async def test_zmq_receiver_timestamps() -> None:
+    mock_socket = AsyncMock()
+    mock_socket.connect = Mock(return_value=None)
+    mock_socket.setsockopt = Mock(return_value=None)
+    mock_socket.recv_multipart.side_effect = [[b"a", b'{"value": 1}'], [b"a", b'{"value": 2}'], zmq.Again()]
+    mock_context = Mock()
+    mock_context.socket.return_value = mock_socket
+
+    with patch("zmq.asyncio.Context.instance", return_value=mock_context):
+        receiver = ZmqReceiver(ZmqConf(timestamps=True, conflate=True), topic="")
+        data, meta = await receiver.receive()
+
+    assert data == {"value": 2}
+    assert set(meta) == {"topic", "arrival", "arrival_time"}